@@ -0,0 +1,120 @@
+#! python3
+# FanGraphs/benchmarks/__init__.py
+
+"""
+Offline benchmarks of the hot paths of the scrapers.
+
+The parsing and selector code runs against saved HTML snapshots of each leaderboard
+(see :py:mod:`fangraphs.benchmarks.fixtures`), and exports run against a local stub HTTP server
+(see :py:mod:`fangraphs.benchmarks.server`), so no browser or network is needed.
+Run the suite with ``python -m fangraphs.benchmarks``.
+"""
+
+import gc
+import statistics
+import time
+import tracemalloc
+
+
+class Result:
+    """
+    The timings and memory use of a benchmark case.
+    """
+    def __init__(self, name, timings, peak_memory):
+        """
+        :param name: The name of the case
+        :param timings: The duration of each run, in seconds
+        :param peak_memory: The peak memory allocated by a single run, in bytes
+
+        .. py:attribute:: timings
+            The duration of each run, in seconds
+            :type: list[float]
+        """
+        self.name = name
+        self.timings = sorted(timings)
+        self.peak_memory = peak_memory
+
+    def percentile(self, p):
+        """
+        :param p: The percentile, between 0 and 100
+        :return: The duration below which ``p`` percent of the runs fall, in seconds (nearest rank)
+        :rtype: float
+        """
+        rank = max(1, -(-len(self.timings) * p // 100))
+        return self.timings[int(rank) - 1]
+
+    def summary(self):
+        """
+        :return: The number of runs, the mean, p50, p90 and p99 durations (in milliseconds) and the peak memory (in KiB)
+        :rtype: dict
+        """
+        return {
+            "name": self.name,
+            "runs": len(self.timings),
+            "mean_ms": statistics.mean(self.timings) * 1000,
+            "p50_ms": self.percentile(50) * 1000,
+            "p90_ms": self.percentile(90) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "peak_kib": self.peak_memory / 1024
+        }
+
+    def __str__(self):
+        s = self.summary()
+        return (
+            f"{s['name']:<40} {s['runs']:>5} {s['mean_ms']:>10.3f} {s['p50_ms']:>10.3f} "
+            f"{s['p90_ms']:>10.3f} {s['p99_ms']:>10.3f} {s['peak_kib']:>11.1f}"
+        )
+
+
+#: The header of the table printed by :py:func:`report`
+HEADER = f"{'case':<40} {'runs':>5} {'mean ms':>10} {'p50 ms':>10} {'p90 ms':>10} {'p99 ms':>10} {'peak KiB':>11}"
+
+
+def measure(name, func, *, repeat=50, warmup=3, setup=None):
+    """
+    Times repeated calls of ``func``.
+    Memory is traced during a separate run, so tracing does not slow the timed runs.
+
+    :param name: The name of the case
+    :param func: The function to benchmark, called without arguments
+    :param repeat: The number of timed runs
+    :param warmup: The number of untimed runs before the timed runs
+    :param setup: A function called, untimed, before every run (e.g. to invalidate a cache)
+    :return: The timings and memory use of the case
+    :rtype: Result
+    """
+    for _ in range(warmup):
+        if setup is not None:
+            setup()
+        func()
+    timings = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return Result(name, timings, peak)
+
+
+def report(results):
+    """
+    :param results: The results of the benchmark cases
+    :return: The results as a table, one case per line
+    :rtype: str
+    """
+    return "\n".join([HEADER, *(str(r) for r in results)])
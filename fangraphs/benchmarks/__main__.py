@@ -0,0 +1,48 @@
+#! python3
+# FanGraphs/benchmarks/__main__.py
+
+"""
+Command-line entry point of the benchmark suite::
+
+    python -m fangraphs.benchmarks [--repeat N] [--json PATH] [--baseline PATH] [--record]
+"""
+
+import argparse
+import json
+import sys
+
+from fangraphs import benchmarks
+from fangraphs.benchmarks import fixtures
+from fangraphs.benchmarks import suite
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m fangraphs.benchmarks", description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=50, help="timed runs of each case")
+    parser.add_argument("--fixtures", default=fixtures.DIRECTORY, help="directory of the page archives")
+    parser.add_argument("--json", help="save the results to this file, for regression tracking")
+    parser.add_argument("--baseline", help="compare the results with a file saved by --json")
+    parser.add_argument("--threshold", type=float, default=0.2, help="relative p50 slow-down reported as a regression")
+    parser.add_argument("--record", action="store_true", help="record the page archives first (needs network access)")
+    args = parser.parse_args(argv)
+
+    if args.record:
+        for path in fixtures.record(directory=args.fixtures):
+            print(f"Recorded {path}")
+    results, missing = suite.run(args.fixtures, args.repeat)
+    print(benchmarks.report(results))
+    if missing:
+        print(f"\nNo archive of: {', '.join(missing)} (record them with --record)")
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump([r.summary() for r in results], file, indent=2)
+    if args.baseline:
+        regressions = suite.compare(results, args.baseline, args.threshold)
+        for name, ratio in regressions:
+            print(f"Regression: {name} is {ratio:.0%} slower")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,343 @@
+#! python3
+# FanGraphs/benchmarks/fixtures.py
+
+"""
+Page snapshots and synthetic data which the benchmarks replay.
+
+The snapshots of the leaderboards are the documents of their HAR archives (see :py:mod:`fangraphs.leaders.replay`),
+which are recorded once, with network access, by :py:func:`record`.
+Data grids and endpoint payloads are generated, so their size can be varied;
+:py:class:`GridPage` serves a generated data grid through the page controls of the ``SeasonStat`` page.
+"""
+
+import json
+import random
+
+import fangraphs.exceptions
+
+from fangraphs.leaders import ROW_CHANGED_JS
+from fangraphs.leaders import ROW_COUNT_CHANGED_JS
+from fangraphs.leaders import ROW_COUNT_JS
+from fangraphs.leaders import ROW_MARKER_JS
+from fangraphs.leaders import TABLE_JS
+from fangraphs.leaders import blocking
+from fangraphs.leaders import leaders
+from fangraphs.leaders import replay
+from fangraphs.selectors import leaders_sel
+
+#: The directory of the archives which the snapshots are read from
+DIRECTORY = replay.DIRECTORY
+
+#: The scraper classes whose pages are snapshotted
+SCRAPERS = (
+    leaders.GameSpan, leaders.International, leaders.MajorLeague,
+    leaders.SeasonStat, leaders.Splits, leaders.WAR
+)
+
+
+class SnapshotPage:
+    """
+    Serves a saved snapshot to a scraper in place of a ``Playwright`` page, for the code paths which read the page.
+    """
+    def __init__(self, html, url=""):
+        """
+        :param html: The markup of the snapshot
+        :param url: The URL the snapshot was saved from
+        """
+        self.html = html
+        self.url = url
+
+    def content(self):
+        return self.html
+
+    def wait_for_selector(self, selector, **kwargs):
+        pass
+
+
+def _archive(scraper_cls, directory=DIRECTORY, mode="replay"):
+    """
+    :return: The archive of a scraper's page
+    :rtype: fangraphs.leaders.replay.Archive
+    """
+    return replay.Archive(replay.archive_name(scraper_cls.address), directory, mode=mode)
+
+
+def load(scraper_cls, directory=DIRECTORY):
+    """
+    :param scraper_cls: A scraper class of :py:mod:`fangraphs.leaders.leaders`
+    :param directory: The directory of the archives
+    :return: The snapshot of the page, i.e. the recorded document, or ``None`` if the page has not been recorded
+    :rtype: str or None
+    """
+    archive = _archive(scraper_cls, directory)
+    if not archive.recorded:
+        return None
+    return archive.text(scraper_cls.address)
+
+
+def scraper(scraper_cls, html):
+    """
+    Creates a scraper which reads a snapshot instead of a live page.
+
+    :param scraper_cls: A scraper class of :py:mod:`fangraphs.leaders.leaders`
+    :param html: The snapshot of the page
+    :return: The scraper
+    """
+    instance = scraper_cls()
+    instance.page = SnapshotPage(html, instance.address)
+    instance._refresh_parser()
+    return instance
+
+
+def record(scrapers=SCRAPERS, directory=DIRECTORY):
+    """
+    Records the archive of each page, replacing any previous recording.
+    This is the only step which needs a browser and network access.
+
+    :param scrapers: The scraper classes whose pages are recorded
+    :param directory: The directory of the archives
+    :return: The filepaths of the archives
+    :rtype: list
+    """
+    paths = []
+    for scraper_cls in scrapers:
+        archive = _archive(scraper_cls, directory, mode="record")
+        with replay.open_page(scraper_cls.address, waitfor=getattr(scraper_cls, "_waitfor", ""), archive=archive):
+            pass
+        paths.append(archive.path)
+    return paths
+
+
+class GridInput:
+    """
+    The page number input of the page control of a :py:class:`GridPage`.
+    """
+    def __init__(self, page):
+        self.page = page
+        self.value = ""
+
+    def fill(self, value):
+        self.value = value
+
+    def press(self, key):
+        if key != "Enter":
+            raise ValueError(key)
+        self.page.current = min(int(self.value), self.page.total_pages) - 1
+
+
+class GridPage(SnapshotPage):
+    """
+    Serves a data grid of generated rows (see :py:func:`grid`) in place of the ``Playwright`` page of ``SeasonStat``,
+    for the code paths which read the grid page by page (:py:meth:`fangraphs.leaders.leaders.SeasonStat.iter_rows`).
+    The grid is driven through the selectors of :py:class:`fangraphs.selectors.leaders_sel.SeasonStat`;
+    other selectors raise ``ValueError``.
+    The page size is set by a select control, or by the ``pageitems`` URL parameter if there is no control.
+
+    .. py:attribute:: clicks
+        The number of clicks on **Next**
+        :type: int
+
+    .. py:attribute:: navigations
+        The number of loads of the page
+        :type: int
+
+    .. py:attribute:: waits
+        The number of waits for the grid to re-render, after a click or a change of the page size
+        :type: int
+    """
+    selectors = leaders_sel.SeasonStat
+
+    def __init__(self, headers, data, url=f"{leaders.SeasonStat.address}?stat=bat", *,
+                 page_sizes=("30", "50"), has_input=True, has_select=True):
+        """
+        :param headers: The column headers of the grid
+        :param data: The rows of the grid
+        :param url: The URL of the page
+        :param page_sizes: The options of the page-size control; the first is displayed initially
+        :param has_input: If ``True``, the page control has a page number input
+        :param has_select: If ``True``, the page size is set by a select control
+        """
+        super().__init__("", url)
+        self.headers = headers
+        self.data = data
+        self.page_sizes = list(page_sizes)
+        self.has_input = has_input
+        self.has_select = has_select
+        self.current = 0
+        self.size = int(self.page_sizes[0])
+        self.clicks = 0
+        self.navigations = 0
+        self.waits = 0
+
+    @property
+    def total_pages(self):
+        return max(1, -(-len(self.data) // self.size))
+
+    def rows(self):
+        """
+        :return: The displayed rows of the grid
+        :rtype: list
+        """
+        start = self.current * self.size
+        return self.data[start:start + self.size]
+
+    def marker(self):
+        """
+        :return: The text of the first displayed row (see :py:data:`fangraphs.leaders.ROW_MARKER_JS`)
+        :rtype: str
+        """
+        rows = self.rows()
+        return "".join(rows[0]) if rows else ""
+
+    def goto(self, url, timeout=None):
+        if url.split("?")[0] != self.url.split("?")[0]:
+            raise ValueError(url)
+        self.navigations += 1
+        self.url = url
+        self.current = 0
+        self.size = int(self.page_sizes[0])
+        if "pageitems=" in url:
+            self.size = min(int(url.split("pageitems=")[1].split("&")[0]), max(1, len(self.data)))
+
+    def wait_for_function(self, expression, arg=None, **kwargs):
+        """
+        :raises TimeoutError: The displayed rows have not changed, so the wait would never end
+        """
+        if arg[0] != self.selectors.table:
+            raise ValueError(arg[0])
+        if expression == ROW_CHANGED_JS:
+            current = self.marker()
+        elif expression == ROW_COUNT_CHANGED_JS:
+            current = len(self.rows())
+        else:
+            raise ValueError(expression)
+        if current == arg[1]:
+            raise TimeoutError(f"The rows of {arg[0]} did not change")
+        self.waits += 1
+
+    def query_selector(self, selector):
+        if selector == self.selectors.pagination["input"]:
+            return GridInput(self) if self.has_input else None
+        if selector == self.selectors.page_size:
+            return self if self.has_select else None
+        return None
+
+    def eval_on_selector_all(self, selector, expression):
+        if selector != f"{self.selectors.page_size} option":
+            raise ValueError(selector)
+        return list(self.page_sizes)
+
+    def select_option(self, selector, value):
+        if selector != self.selectors.page_size:
+            raise ValueError(selector)
+        self.size = int(value)
+        self.current = 0
+
+    def click(self, selector):
+        if selector != self.selectors.pagination["next"]:
+            raise ValueError(selector)
+        self.clicks += 1
+        self.current = min(self.current + 1, self.total_pages - 1)
+
+    def eval_on_selector(self, selector, expression, arg=None):
+        if selector == self.selectors.page_size:
+            return str(self.size)
+        if selector == self.selectors.pagination["total"]:
+            return f"<span>{self.total_pages}</span>"
+        if selector != self.selectors.table:
+            raise ValueError(selector)
+        if expression == ROW_MARKER_JS:
+            return self.marker()
+        if expression == ROW_COUNT_JS:
+            return len(self.rows())
+        if expression != TABLE_JS:
+            raise ValueError(expression)
+        return [list(self.headers), [] if arg else [list(row) for row in self.rows()]]
+
+
+class GridPool:
+    """
+    Lends a :py:class:`GridPage` of the same grid for each borrowed page, in place of a browser pool.
+    Like the default browser pool, it blocks ads, so scrapers do not look for the ad.
+    """
+    profile = blocking.DEFAULT_PROFILE
+
+    def __init__(self, headers, data, size=4, **options):
+        """
+        :param headers: The column headers of the grid
+        :param data: The rows of the grid
+        :param size: The maximum number of pages lent out at once
+        :param options: The keyword arguments of :py:class:`GridPage`
+        """
+        self.headers = headers
+        self.data = data
+        self.size = size
+        self.options = options
+        self.borrowed = 0
+
+    def acquire(self, allow=(), archive=None):
+        if self.borrowed >= self.size:
+            raise fangraphs.exceptions.BrowserPoolExhausted(self.size)
+        self.borrowed += 1
+        return GridPage(self.headers, self.data, **self.options)
+
+    def release(self, page):
+        self.borrowed -= 1
+
+
+def grid_scraper(headers, data, **options):
+    """
+    Creates a ``SeasonStat`` scraper which reads a generated grid, with its page borrowed from a :py:class:`GridPool`.
+
+    :param headers: The column headers of the grid
+    :param data: The rows of the grid
+    :param options: The keyword arguments of :py:class:`GridPool`
+    :return: The scraper, and its pool
+    :rtype: tuple[fangraphs.leaders.leaders.SeasonStat, GridPool]
+    """
+    browser_pool = GridPool(headers, data, **options)
+    instance = leaders.SeasonStat(browser_pool=browser_pool)
+    instance.page = browser_pool.acquire()
+    instance._refresh_parser()
+    return instance, browser_pool
+
+
+def grid(rows=50, columns=30, seed=0):
+    """
+    Generates one page of a data grid, as it is read inside the browser
+    (see :py:meth:`fangraphs.leaders.ScrapingUtilities._extract_table`).
+
+    :param rows: The number of rows
+    :param columns: The number of columns, after the name and team columns
+    :param seed: The seed of the generated values
+    :return: The column headers and the rows
+    :rtype: tuple[list, list]
+    """
+    rng = random.Random(seed)
+    headers = ["Name", "Team", *(f"S{c}" for c in range(columns))]
+    data = [
+        [f"Player {r}", "TM", *(f"{rng.uniform(-5, 300):.3f}" for _ in range(columns))]
+        for r in range(rows)
+    ]
+    return headers, data
+
+
+def payload(rows=1000, columns=30, seed=0):
+    """
+    Generates the JSON response of a leaderboard endpoint.
+
+    :param rows: The number of rows
+    :param columns: The number of stat columns
+    :param seed: The seed of the generated values
+    :rtype: bytes
+    """
+    rng = random.Random(seed)
+    data = [
+        dict(
+            {"Name": f"<a href='/players/{r}'>Player {r}</a>", "Team": "TM", "Season": 2020},
+            **{f"S{c}": round(rng.uniform(-5, 300), 3) for c in range(columns)},
+            **{"K%": f"{rng.uniform(5, 40):.1f} %"}
+        )
+        for r in range(rows)
+    ]
+    return json.dumps({"data": data}).encode()
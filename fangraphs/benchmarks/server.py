@@ -0,0 +1,82 @@
+#! python3
+# FanGraphs/benchmarks/server.py
+
+"""
+A local stub HTTP server, which answers every request with a fixed response.
+
+Exports are benchmarked against the server through :py:class:`fangraphs.leaders.api.APIClient`'s ``base_url``,
+so the measured time is the client's request, decoding and writing, rather than the network.
+"""
+
+import http.server
+import threading
+
+
+class StubServer:
+    """
+    Serves fixed responses on a free local port, from a background thread.
+    """
+    def __init__(self, routes, *, content_type="application/json"):
+        """
+        :param routes: Maps URL paths (without the query string) to the bytes of their responses
+        :param content_type: The content type of every response
+
+        .. py:attribute:: url
+            The base URL of the server, e.g. ``http://127.0.0.1:50123``
+            :type: str
+        """
+        self.routes = dict(routes)
+        self.content_type = content_type
+        self.requests = 0
+
+        stub = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _respond(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                stub.requests += 1
+                body = stub.routes.get(self.path.partition("?")[0])
+                if body is None:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", stub.content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = _respond
+
+            def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+                pass
+
+        self._server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = None
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, value, traceback):
+        self.stop()
+
+    def start(self):
+        """
+        Starts serving requests in a daemon thread.
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops the server and closes its socket.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
@@ -0,0 +1,168 @@
+#! python3
+# FanGraphs/benchmarks/suite.py
+
+"""
+The benchmark cases of the scraper hot paths.
+
+- ``parse``: re-parsing a page snapshot after :py:meth:`fangraphs.leaders.ScrapingUtilities._refresh_parser`
+- ``list_options`` and ``current_option``: every filter query of a page snapshot, on a parsed page
+- ``iter_rows`` and ``export``: reading a generated ``SeasonStat`` data grid page by page, through the scraper
+- ``api_export``: exporting a leaderboard from the stub server to CSV and Parquet
+
+The page cases are skipped for pages whose archive has not been recorded.
+"""
+
+import json
+import os
+import tempfile
+import urllib.parse
+
+import fangraphs.exceptions
+from fangraphs import benchmarks
+from fangraphs.benchmarks import fixtures
+from fangraphs.benchmarks import server
+from fangraphs.leaders import api
+from fangraphs.leaders import leaders
+
+
+def _queries(instance):
+    """
+    :return: The filter queries of a snapshot scraper which can be read from the snapshot
+    """
+    queries = []
+    for query in instance.list_queries():
+        try:
+            instance.list_options(query)
+            instance.current_option(query)
+        except (IndexError, TypeError, fangraphs.exceptions.InvalidFilterQuery):
+            continue
+        queries.append(query)
+    return queries
+
+
+def page_cases(directory=fixtures.DIRECTORY, repeat=50):
+    """
+    Benchmarks the parsing and selector code of the snapshot of each recorded page.
+
+    :return: The results, and the names of the pages without a snapshot
+    :rtype: tuple[list, list]
+    """
+    results, missing = [], []
+    for scraper_cls in fixtures.SCRAPERS:
+        html = fixtures.load(scraper_cls, directory)
+        name = scraper_cls.__name__
+        if html is None:
+            missing.append(name)
+            continue
+        instance = fixtures.scraper(scraper_cls, html)
+
+        def parse():
+            return instance.soup
+        results.append(benchmarks.measure(
+            f"parse[{name}]", parse, repeat=repeat, setup=instance._refresh_parser
+        ))
+        queries = _queries(instance)
+        results.append(benchmarks.measure(
+            f"list_options[{name}]", lambda: [instance.list_options(q) for q in queries], repeat=repeat
+        ))
+        results.append(benchmarks.measure(
+            f"current_option[{name}]", lambda: [instance.current_option(q) for q in queries], repeat=repeat
+        ))
+    return results, missing
+
+
+def pagination_cases(page_sizes=(50, 500), rows=2000, partitions=4, repeat=50):
+    """
+    Benchmarks reading the ``SeasonStat`` data grid page by page, for each page size in ``page_sizes``,
+    over a generated grid of ``rows`` rows (see :py:class:`fangraphs.benchmarks.fixtures.GridPage`).
+    The scraper's own code runs: :py:meth:`fangraphs.leaders.leaders.SeasonStat.iter_rows`
+    (with one and with ``partitions`` pages) and :py:meth:`fangraphs.leaders.leaders.SeasonStat.export`,
+    which read each page with ``_extract_table`` and turn it with ``_next_page`` and ``_wait_rows``.
+
+    :rtype: list
+    """
+    headers, data = fixtures.grid(rows)
+    results = []
+    for size in page_sizes:
+        instance, _ = fixtures.grid_scraper(headers, data, size=partitions, page_sizes=(str(size),))
+
+        def reset(instance=instance):
+            instance.page.goto(instance.page.url)
+        label = f"{rows} rows, {size} rows/page"
+        results.append(benchmarks.measure(
+            f"iter_rows[{label}]", lambda instance=instance: list(instance.iter_rows()), repeat=repeat, setup=reset
+        ))
+        results.append(benchmarks.measure(
+            f"iter_rows[{label}, {partitions} partitions]",
+            lambda instance=instance: list(instance.iter_rows(partitions=partitions)),
+            repeat=repeat, setup=reset
+        ))
+        results.append(benchmarks.measure(
+            f"export[{label}]", lambda instance=instance: instance.export(as_table=True), repeat=repeat, setup=reset
+        ))
+    return results
+
+
+def export_cases(rows=2000, repeat=20):
+    """
+    Benchmarks :py:func:`fangraphs.leaders.api.export` against the stub server.
+
+    :rtype: list
+    """
+    path = urllib.parse.urlsplit(api.ENDPOINTS["SeasonStat"].url).path
+    formats = ["csv"]
+    try:
+        import pyarrow  # pylint: disable=import-outside-toplevel,unused-import
+        formats.append("parquet")
+    except ImportError:
+        pass
+    results = []
+    with server.StubServer({path: fixtures.payload(rows)}) as stub, \
+            api.APIClient(base_url=stub.url) as client, \
+            tempfile.TemporaryDirectory() as directory:
+        for fmt in formats:
+            target = os.path.join(directory, f"grid.{fmt}")
+            results.append(benchmarks.measure(
+                f"api_export[{fmt}, {rows} rows]",
+                lambda target=target: api.export(leaders.SeasonStat, {"stat": "Batting"}, target, client=client),
+                repeat=repeat
+            ))
+    return results
+
+
+def run(directory=fixtures.DIRECTORY, repeat=50):
+    """
+    Runs every benchmark case.
+
+    :param directory: The directory of the archives of the pages
+    :param repeat: The number of timed runs of each case
+    :return: The results, and the names of the pages without a snapshot
+    :rtype: tuple[list, list]
+    """
+    results, missing = page_cases(directory, repeat)
+    results.extend(pagination_cases(repeat=repeat))
+    results.extend(export_cases(repeat=max(1, repeat // 2)))
+    return results, missing
+
+
+def compare(results, baseline_path, threshold=0.2):
+    """
+    Compares the median durations of a run against a saved run.
+
+    :param results: The results of the run
+    :param baseline_path: The JSON file saved by a previous run (see ``--json``)
+    :param threshold: The relative slow-down above which a case is reported as a regression
+    :return: The names of the regressed cases, with their slow-down
+    :rtype: list[tuple[str, float]]
+    """
+    with open(baseline_path) as file:
+        baseline = {case["name"]: case for case in json.load(file)}
+    regressions = []
+    for result in results:
+        case = baseline.get(result.name)
+        if case is None or not case["p50_ms"]:
+            continue
+        ratio = result.summary()["p50_ms"] / case["p50_ms"] - 1
+        if ratio > threshold:
+            regressions.append((result.name, ratio))
+    return regressions
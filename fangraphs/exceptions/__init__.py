@@ -66,3 +66,16 @@ class InvalidQuickSplit(Exception):
         self.quick_split = quick_split
         self.message = f"No quick split '{self.quick_split}` could be found"
         super().__init__(self.message)
+
+
+class BrowserPoolExhausted(Exception):
+    """
+    Raised when a page is requested from a browser pool which has no contexts left to lend.
+    """
+    def __init__(self, size):
+        """
+        :param size: The maximum number of browser contexts held by the pool
+        """
+        self.size = size
+        self.message = f"All {self.size} browser contexts of the pool are in use"
+        super().__init__(self.message)
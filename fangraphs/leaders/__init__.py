@@ -7,20 +7,133 @@ Subpackage for scraping the FanGraphs **Leaders** pages.
 
 import datetime
 import os
+import urllib.parse
 
 import bs4
-from playwright.sync_api import sync_playwright
+import lxml.html
+
+import fangraphs.exceptions
+from fangraphs.leaders import columns
+from fangraphs.leaders import metrics
+from fangraphs.leaders import params
+from fangraphs.leaders import pool
+from fangraphs.leaders import replay
+from fangraphs.leaders import table
+from fangraphs import selectors
+
+
+def page_name(scraper_cls):
+    """
+    Identifies the FanGraphs page covered by a scraper class.
+    Synchronous and asynchronous scrapers of the same page share a name.
+
+    :param scraper_cls: A scraper class (or its name)
+    :return: The name of the page, e.g. ``"MajorLeague"``
+    :rtype: str
+    """
+    name = scraper_cls if isinstance(scraper_cls, str) else scraper_cls.__name__
+    return name[5:] if name.startswith("Async") else name
+
+
+def _is_current(current, option):
+    """
+    :param current: The current option of a filter query (see :py:meth:`ScrapingUtilities.snapshot`)
+    :param option: The option the filter query is to be configured to
+    :return: ``True`` if the filter query is already set to ``option``, ignoring case.
+        An option of a multiple-choice filter query is current if it is one of the selected options.
+    :rtype: bool
+    """
+    option = str(option).strip().lower()
+    if isinstance(current, list):
+        return option in [c.strip().lower() for c in current]
+    return current is not None and current.strip().lower() == option
+
+
+#: The value of the page-size URL parameter which displays every row of a data grid
+PAGE_ITEMS = 2000000000
+
+#: Reads a data grid inside the page, given its root element (or a table) and whether only the headers are read.
+#: The headers are the cells of the last row of the table head; rows holding nested tables (e.g. pagers) are skipped.
+TABLE_JS = """(root, headersOnly) => {
+    const table = root.tagName === "TABLE" ? root : root.querySelector("table");
+    if (!table) return [[], []];
+    const text = cell => cell.textContent.trim();
+    const plain = row => !row.querySelector("table");
+    const head = table.tHead ? Array.from(table.tHead.rows).filter(plain) : [];
+    const headers = head.length ? Array.from(head[head.length - 1].cells, text) : [];
+    if (headersOnly) return [headers, []];
+    const rows = [];
+    for (const body of table.tBodies) {
+        for (const row of body.rows) {
+            if (plain(row)) rows.push(Array.from(row.cells, text));
+        }
+    }
+    return [headers, rows];
+}"""
+
+#: Reads the text of the first row of a data grid, given its root element (or a table).
+#: The text changes once the grid displays another of its pages.
+ROW_MARKER_JS = """root => {
+    const table = root.tagName === "TABLE" ? root : root.querySelector("table");
+    const row = table && table.tBodies.length ? table.tBodies[0].rows[0] : null;
+    return row ? row.textContent : "";
+}"""
+
+#: Checks whether the first row of a data grid differs from ``before``, given the CSS selector of the grid
+ROW_CHANGED_JS = f"""([selector, before]) => {{
+    const root = document.querySelector(selector);
+    return root !== null && ({ROW_MARKER_JS})(root) !== before;
+}}"""
+
+#: Counts the displayed rows of a data grid, given its root element (or a table)
+ROW_COUNT_JS = """root => {
+    const table = root.tagName === "TABLE" ? root : root.querySelector("table");
+    return table && table.tBodies.length ? table.tBodies[0].rows.length : 0;
+}"""
+
+#: Checks whether the number of displayed rows of a data grid differs from ``before``, given the CSS selector of the grid
+ROW_COUNT_CHANGED_JS = f"""([selector, before]) => {{
+    const root = document.querySelector(selector);
+    return root !== null && ({ROW_COUNT_JS})(root) !== before;
+}}"""
+
+
+def set_query_param(url: str, name: str, value):
+    """
+    :param url: The URL
+    :param name: The name of the query-string parameter
+    :param value: The value of the parameter
+    :return: ``url``, with the parameter ``name`` added or replaced
+    :rtype: str
+    """
+    parts = urllib.parse.urlsplit(url)
+    query = [(k, v) for k, v in urllib.parse.parse_qsl(parts.query, keep_blank_values=True) if k != name]
+    query.append((name, str(value)))
+    return urllib.parse.urlunsplit(parts._replace(query=urllib.parse.urlencode(query)))
 
 
 class ScrapingUtilities:
     """
     Manages the various objects used for scraping the FanGraphs webpages.
-    Intializes and manages ``Playwright`` browsers and pages.
+    Borrows and returns ``Playwright`` pages from a :py:class:`~fangraphs.leaders.pool.BrowserPool`.
     Intializes and manages ``bs4.BeautifulSoup`` objects.
     """
-    def __init__(self, address, *, waitfor=""):
+    _page_size = ""
+    _page_size_param = ""
+    _url_params = {}
+    _allowed_resources = ()
+    _table = ""
+    _pagination = {}
+
+    def __init__(self, address, *, waitfor="", browser_pool=None, catalog=None):
         """
         :param address: The base URL address of the FanGraphs page
+        :param waitfor: The CSS selector to wait for after each page update
+        :param browser_pool: The browser pool to borrow pages from.
+            If not specified, the default pool of the current thread is used (see :py:func:`fangraphs.leaders.pool.get_pool`).
+        :param catalog: The option catalog used to list and validate options without reading the page
+            (see :py:class:`fangraphs.leaders.catalog.OptionCatalog`).
+            A missing catalog is filled when the scraper is entered; a stale catalog is refreshed in the background.
         .. py:attribute:: address
             The base URL address of the FanGraphs page
             :type: str
@@ -29,78 +142,755 @@ class ScrapingUtilities:
             :type: playwright.sync_api._generated.Page
         .. py:attribute:: soup
             The ``BeautifulSoup4`` HTML parser for scraping the webpage.
+            It is rebuilt lazily, the first time it is read after :py:meth:`_refresh_parser`.
             :type: bs4.BeautifulSoup
+        .. py:attribute:: browser_pool
+            The browser pool which :py:attr:`page` is borrowed from.
+            :type: fangraphs.leaders.pool.BrowserPool
         """
         self.address = address
         self.waitfor = waitfor
         os.makedirs("out", exist_ok=True)
 
-        self.__play = None
-        self.__browser = None
+        self.browser_pool = browser_pool
+        self.catalog = catalog
         self.page = None
 
-        self.soup = None
+        self._soup = None
+        self._soup_dirty = False
+        self._on_response = None
+
+    def _compile_selectors(self):
+        """
+        Builds the filter query objects of the scraper, which locate catalogued options by their text.
+        """
+
+    def _ensure_catalog(self):
+        """
+        Makes the catalog of the page available (see :py:meth:`fangraphs.leaders.catalog.OptionCatalog.ensure`).
+        The filter query objects are rebuilt, so a catalog filled just now is used to locate options.
+        """
+        self.catalog.ensure(type(self))
+        self._compile_selectors()
+
+    @property
+    def _archive(self):
+        """
+        The name of the HAR archive of the page, which the browser pool replays the page from
+        if it is given a directory of archives (see :py:mod:`fangraphs.leaders.replay`).
+
+        :rtype: str
+        """
+        return replay.archive_name(self.address)
 
     def _browser_init(self):
-        self.__play = sync_playwright().start()
-        self.__browser = self.__play.chromium.launch(
-            downloads_path=os.path.abspath("out")
-        )
-        self.page = self.__browser.new_page(
-            accept_downloads=True
-        )
+        """
+        Borrows a page from the browser pool.
+        The catalog of the page, if any, is made available first (see :py:meth:`_ensure_catalog`).
+        """
+        if self.catalog is not None:
+            self._ensure_catalog()
+        if self.browser_pool is None:
+            self.browser_pool = pool.get_pool()
+        with metrics.stage("acquire", self):
+            self.page = self.browser_pool.acquire(self._allowed_resources, self._archive)
+        self._watch_responses()
         self._refresh_parser()
 
-    def _refresh_parser(self):
+    def _watch_responses(self):
+        """
+        Counts the bytes of every response received by :py:attr:`page`, if instrumentation is enabled.
+        See :py:mod:`fangraphs.leaders.metrics`.
+        """
+        if not metrics.enabled():
+            return
+
+        def on_response(response):
+            metrics.emit("bytes", "network", self, int(response.headers.get("content-length") or 0))
+        self._on_response = on_response
+        self.page.on("response", on_response)
+
+    def _unwatch_responses(self):
+        if self._on_response is not None:
+            self.page.remove_listener("response", self._on_response)
+            self._on_response = None
+
+    def _catalog_options(self, query: str):
+        """
+        :param query: The filter query
+        :return: The catalogued options of ``query``, or ``None`` if there is no catalog
+        :rtype: list or None
+        """
+        if self.catalog is None:
+            return None
+        try:
+            return self.catalog.list_options(type(self), query)
+        except fangraphs.exceptions.InvalidFilterQuery:
+            return None
+
+    def _offline_options(self, query: str):
+        """
+        The options of some filter queries depend on others, while the catalog holds the options of the page
+        as it is first loaded. Thus, ``list_options`` reads the page if there is one, and only the catalog otherwise.
+
+        :param query: The filter query
+        :return: The catalogued options of ``query``, if the scraper has no page; otherwise, ``None``
+        :rtype: list or None
+        """
+        return self._catalog_options(query) if self.page is None else None
+
+    def _schema(self):
+        """
+        :return: The column schema of the stat group which the leaderboard shows, read from its ``stat`` filter query
+            (see :py:func:`fangraphs.leaders.columns.group_schema`)
+        :rtype: dict
+        """
+        stat = None
+        if "stat" in self.list_queries():
+            try:
+                stat = self.current_option("stat")
+            except (IndexError, AttributeError):
+                pass
+        return columns.group_schema(stat)
+
+    def configure_by_url(self, filters: dict):
+        """
+        Configures several filter queries at once.
+        The filter queries which the page encodes in its URL (see :py:mod:`fangraphs.leaders.params`)
+        are configured by a single navigation to the compiled URL.
+        The remaining filter queries are configured one by one, through ``configure``.
+
+        :param filters: Maps filter queries to options
+        :raises FanGraphs.exceptions.InvalidFilterQuery: A filter query is not used by the page
+        :raises FanGraphs.exceptions.InvalidFilterOption: An option is not offered by the page
+        """
+        queries = [q.lower() for q in self.list_queries()]
+        for query in filters:
+            if query.lower() not in queries:
+                raise fangraphs.exceptions.InvalidFilterQuery(query)
+        url, unmapped = params.compile_url(self.page.url, self._url_params, filters)
+        if url != self.page.url:
+            with metrics.stage("goto", self):
+                self.page.goto(url, timeout=0)
+            if self.waitfor:
+                with metrics.stage("wait", self):
+                    self.page.wait_for_selector(self.waitfor)
+            self._refresh_parser()
+        for query, option in unmapped.items():
+            self.configure(query, option)
+
+    @property
+    def soup(self):
+        """
+        The ``bs4.BeautifulSoup`` object of the current page.
+        The page is only re-parsed if it has changed since it was last parsed.
+
+        :rtype: bs4.BeautifulSoup
+        """
+        if self._soup_dirty:
+            self._parse()
+        return self._soup
+
+    @soup.setter
+    def soup(self, soup):
+        self._soup = soup
+        self._soup_dirty = False
+
+    def _parse(self):
         """
         Re-initializes the ``bs4.BeautifulSoup`` object stored in :py:attr:`soup`.
         """
         if self.waitfor:
-            self.page.wait_for_selector(self.waitfor)
-        self.soup = bs4.BeautifulSoup(
-            self.page.content(), features="lxml"
-        )
+            with metrics.stage("wait", self):
+                self.page.wait_for_selector(self.waitfor)
+        with metrics.stage("content", self):
+            html = self.page.content()
+        metrics.emit("characters", "parse", self, len(html))
+        with metrics.stage("parse", self):
+            self.soup = bs4.BeautifulSoup(html, features="lxml")
+
+    def _refresh_parser(self):
+        """
+        Marks :py:attr:`soup` as outdated, following an action which may have changed the page.
+        The page is re-parsed the next time :py:attr:`soup` is read,
+        so consecutive actions cost a single parse.
+        """
+        self._soup_dirty = True
+
+    def _parse_fragment(self, selector: str, page=None):
+        """
+        Parses only the subtree of the first element matching ``selector`` (e.g. the data grid or a filter control).
+        Unlike :py:meth:`_refresh_parser`, the size of the transferred and parsed HTML is proportional to the subtree,
+        rather than the entire page.
+
+        :param selector: The CSS selector of the subtree's root element
+        :param page: The page to parse; defaults to :py:attr:`page`
+        :return: The root element of the parsed subtree
+        :rtype: lxml.html.HtmlElement
+        """
+        page = page or self.page
+        page.wait_for_selector(selector)
+        with metrics.stage("fragment", self):
+            markup = page.eval_on_selector(selector, "e => e.outerHTML")
+            metrics.emit("characters", "fragment", self, len(markup))
+            return lxml.html.fragment_fromstring(markup)
+
+    def _extract_table(self, selector="", page=None, *, headers_only=False):
+        """
+        Reads the displayed rows of a data grid with a single evaluation inside the page (see :py:data:`TABLE_JS`).
+        Only the text of the cells is transferred, as arrays, so nothing is parsed in Python.
+
+        :param selector: The CSS selector of the data grid, or of its table; defaults to the grid of the page
+        :param page: The page to read; defaults to :py:attr:`page`
+        :param headers_only: If ``True``, the rows are not read
+        :return: The column headers and the rows of the data grid
+        :rtype: tuple[list, list]
+        """
+        page = page or self.page
+        selector = selector or self._table
+        page.wait_for_selector(selector)
+        with metrics.stage("extract", self):
+            headers, rows = page.eval_on_selector(selector, TABLE_JS, headers_only)
+        return headers, rows
+
+    def read_table(self):
+        """
+        Reads the data grid as it is displayed, after displaying as many rows per page as possible
+        (see :py:meth:`_maximize_page_size`).
+        Only the displayed page of the grid is read; leaderboards longer than the largest page size are cut off,
+        unless they are read by ``iter_rows`` or ``export``.
+
+        :return: The displayed rows of the leaderboard
+        :rtype: fangraphs.leaders.table.Table
+        """
+        self._close_ad()
+        self._maximize_page_size()
+        return table.Table.from_rows(*self._extract_table(), self._schema())
+
+    def _state_specs(self):
+        """
+        :return: The ``(query, spec)`` pairs read by :py:data:`fangraphs.selectors.STATE_JS`
+        :rtype: list
+        """
+        return []
+
+    def snapshot(self):
+        """
+        Reads the current option of every filter query in a single evaluation inside the page.
+        Unlike ``current_option``, the page is not re-parsed, so a snapshot is cheap enough to take before every export
+        (e.g. as a cache key, or to check the filter configuration).
+
+        :return: Maps each filter query to its current option, as returned by ``current_option``.
+            Options whose element is missing from the page are ``None``.
+        :rtype: dict
+        """
+        with metrics.stage("snapshot", self):
+            return self.page.evaluate(selectors.STATE_JS, self._state_specs())
+
+    def _pending(self, filters: dict, state: dict):
+        """
+        :param filters: Maps filter queries to options
+        :param state: The current option of each filter query (see :py:meth:`snapshot`)
+        :return: The filter queries of ``filters`` which are not already set to their option, mapped to their option
+        :rtype: dict
+        :raises FanGraphs.exceptions.InvalidFilterQuery: A filter query is not used by the page
+        """
+        queries = [q.lower() for q in self.list_queries()]
+        pending = {}
+        for query, option in filters.items():
+            if query.lower() not in queries:
+                raise fangraphs.exceptions.InvalidFilterQuery(query)
+            if not _is_current(state.get(query.lower()), option):
+                pending[query.lower()] = option
+        return pending
+
+    def _submit(self, queries):
+        """
+        Submits the configured filter queries.
+        Most pages apply a filter query as soon as it is configured, so there is nothing to submit.
+
+        :param queries: The configured filter queries
+        """
+
+    def configure_many(self, filters: dict, *, autoupdate=True):
+        """
+        Configures several filter queries, with as few actions on the page as possible.
+        The current options are read by a single :py:meth:`snapshot`, and the filter queries which are
+        already set to their option are skipped.
+        The advertisement is closed once, the remaining filter queries are configured in order,
+        and the filters are submitted once at the end (e.g. a button shared by ``season1`` and ``season2`` is clicked once).
+
+        :param filters: Maps filter queries to options
+        :param autoupdate: If ``True``, the configured filters are submitted, as by the ``autoupdate`` of ``configure``
+        :return: The filter queries which were configured
+        :rtype: list
+        :raises FanGraphs.exceptions.InvalidFilterQuery: A filter query is not used by the page
+        """
+        pending = self._pending(filters, self.snapshot())
+        if not pending:
+            return []
+        self._close_ad()
+        for query, option in pending.items():
+            self._configure(query, option)
+        if autoupdate:
+            self._submit(list(pending))
+        self._refresh_parser()
+        return list(pending)
+
+    def _full_page(self, page, size):
+        """
+        A larger page size only re-renders the data grid of ``page`` with more rows if its displayed page is full
+        and, if the page count of the grid is known (see ``_pagination``), the grid has more than one page.
+
+        :param page: The page of the data grid
+        :param size: The current page size of the data grid
+        :return: The number of displayed rows, if the grid re-renders with more rows under a larger page size;
+            otherwise, ``None``
+        :rtype: int or None
+        """
+        if not self._table or not size.strip().isdigit():
+            return None
+        rows = page.eval_on_selector(self._table, ROW_COUNT_JS)
+        if rows < int(size):
+            return None
+        total = self._pagination.get("total")
+        if total and int(self._parse_fragment(total, page).text_content()) <= 1:
+            return None
+        return rows
+
+    def _maximize_page_size(self, page=None):
+        """
+        Displays as many rows per page of the data grid as possible, so a full table takes the fewest pages to read.
+        The largest option of the grid's page-size control is selected, if the control exists,
+        and the grid is waited for until it displays the additional rows (see :py:meth:`_full_page`).
+        Otherwise, the page-size URL parameter is set to :py:data:`PAGE_ITEMS` and the page is reloaded.
+
+        :param page: The page of the data grid; defaults to :py:attr:`page`
+        :return: ``True`` if the page size was changed
+        :rtype: bool
+        """
+        page = page or self.page
+        if self._page_size and page.query_selector(self._page_size):
+            values = page.eval_on_selector_all(f"{self._page_size} option", "els => els.map(e => e.value)")
+            sizes = [v for v in values if v.strip().isdigit()]
+            if not sizes:
+                return False
+            largest = max(sizes, key=int)
+            current = page.eval_on_selector(self._page_size, "e => e.value")
+            if current == largest:
+                return False
+            before = self._full_page(page, current)
+            page.select_option(self._page_size, largest)
+            if before is not None:
+                with metrics.stage("wait", self):
+                    page.wait_for_function(ROW_COUNT_CHANGED_JS, arg=[self._table, before])
+        elif self._page_size_param:
+            url = set_query_param(page.url, self._page_size_param, PAGE_ITEMS)
+            if url == page.url:
+                return False
+            with metrics.stage("goto", self):
+                page.goto(url, timeout=0)
+            if self.waitfor:
+                with metrics.stage("wait", self):
+                    page.wait_for_selector(self.waitfor)
+        else:
+            return False
+        if page is self.page:
+            self._refresh_parser()
+        return True
 
     def _close_ad(self):
         """
         Closes the ad which may interfere with clicking other page elements.
+        Nothing is done if the browser pool blocks the ad hosts, since the ad is never loaded.
         """
-        elem = self.page.query_selector(".ezmob-footer-close")
-        if self.soup.select("#ezmob-wrapper > div[style='display: none;']"):
+        profile = getattr(self.browser_pool, "profile", None)
+        if profile is not None and profile.blocks_ads:
             return
-        if elem:
-            elem.click()
+        with metrics.stage("close_ad", self):
+            if self.page.query_selector("#ezmob-wrapper > div[style='display: none;']"):
+                return
+            elem = self.page.query_selector(".ezmob-footer-close")
+            if elem:
+                elem.click()
+
+    @staticmethod
+    def _export_path(path="", fmt=None):
+        """
+        Resolves the filepath which exported data is saved to.
 
-    def export_data(self, selector: str, path=""):
+        :param path: The requested filepath
+        :param fmt: The file format (see :py:func:`fangraphs.leaders.table.file_format`)
+        :return: ``path``, if its extension matches the file format; otherwise, *out/%d.%m.%y %H.%M.%S.<ext>*
+        :rtype: str
+        """
+        fmt = table.file_format(path, fmt)
+        if not path or table.FORMATS.get(os.path.splitext(path)[1].lower()) != fmt:
+            os.makedirs("out", exist_ok=True)
+            ext = next(e for e, f in table.FORMATS.items() if f == fmt)
+            path = "out/{}{}".format(
+                datetime.datetime.now().strftime("%d.%m.%y %H.%M.%S"), ext
+            )
+        return path
+
+    def export_data(self, selector: str, path="", *, as_table=False, fmt=None):
         """
         Uses the **Export Data** button on the webpage to export the current leaderboard.
         The data will be exported as a CSV file and the file will be saved to *out/*.
         The file will be saved to the filepath ``path``, if specified.
         Otherwise, the file will be saved to the filepath *./out/%d.%m.%y %H.%M.%S.csv*
+        Paths ending in *.parquet*, *.arrow* or *.feather* select the matching columnar format.
+
         :param selector: The CSS selector of the **Export Data** button
         :param path: The path to save the exported data to
+        :param as_table: If ``True``, the download is read into memory and discarded, and nothing is saved
+        :param fmt: The file format to save the data as (see :py:func:`fangraphs.leaders.table.file_format`).
+            Formats other than CSV are converted through :py:meth:`fangraphs.leaders.table.Table.write`.
+        :return: The exported leaderboard, if ``as_table`` is ``True``
+        :rtype: fangraphs.leaders.table.Table or None
         """
         self._close_ad()
-        if not path or os.path.splitext(path)[1] != ".csv":
-            path = "out/{}.csv".format(
-                datetime.datetime.now().strftime("%d.%m.%y %H.%M.%S")
-            )
-        with self.page.expect_download() as down_info:
-            self.page.click(selector)
-        download = down_info.value
-        download_path = download.path()
-        os.rename(download_path, path)
+        with metrics.stage("download", self):
+            with self.page.expect_download() as down_info:
+                self.page.click(selector)
+            download = down_info.value
+            download_path = download.path()
+        metrics.emit("bytes", "download", self, os.path.getsize(download_path))
+        path = None if as_table else self._export_path(path, fmt)
+        if path is not None and table.file_format(path, fmt) == "csv":
+            os.rename(download_path, path)
+            return None
+        with metrics.stage("read", self):
+            data = table.Table.from_csv(download_path, self._schema())
+        download.delete()
+        if path is None:
+            return data
+        with metrics.stage("write", self):
+            data.write(path, fmt)
+        return None
 
     def reset(self):
         """
         Navigates :py:attr:`page` to :py:attr:`address`.
         """
-        self.page.goto(self.address, timeout=0)
+        with metrics.stage("goto", self):
+            self.page.goto(self.address, timeout=0)
         self._refresh_parser()
 
     def quit(self):
         """
-        Terminates the ``Playwright`` browser and context manager.
+        Returns :py:attr:`page` to the browser pool.
+        The browser itself is kept warm for the next scraper.
+        """
+        if self.page is not None:
+            self._unwatch_responses()
+            self.browser_pool.release(self.page)
+            self.page = None
+
+    def replace_page(self):
+        """
+        Returns :py:attr:`page` to the browser pool, borrows a fresh page and navigates it to :py:attr:`address`,
+        e.g. after the page has crashed.
+        The filter configuration of the previous page is lost.
+        """
+        self.quit()
+        self._browser_init()
+        self.reset()
+
+
+class AsyncScrapingUtilities(ScrapingUtilities):
+    """
+    Asynchronous counterpart of :py:class:`ScrapingUtilities`, built on ``playwright.async_api``.
+    Pages are borrowed from an :py:class:`~fangraphs.leaders.pool.AsyncBrowserPool`.
+
+    The subclasses must be used with ``async with``, and every method which drives the page is a coroutine.
+    Methods which only read :py:attr:`soup` (e.g. ``list_options``) remain synchronous.
+    """
+    def __enter__(self):
+        raise TypeError(
+            f"{type(self).__name__} must be used with 'async with'"
+        )
+
+    def __exit__(self, exc_type, value, traceback):
+        pass
+
+    def _ensure_catalog(self):
+        """
+        Refreshes a missing or stale catalog of the page in the background, so the event loop is never blocked.
+        Until a missing catalog is filled, options are read from the page.
+        """
+        if self.catalog.is_stale(type(self)):
+            self.catalog.refresh_in_background(type(self))
+
+    async def _browser_init(self):
+        """
+        Borrows a page from the asynchronous browser pool.
+        The borrowed page is blank, so it is not parsed until :py:meth:`reset` navigates it to :py:attr:`address`.
+        """
+        if self.catalog is not None:
+            self._ensure_catalog()
+        if self.browser_pool is None:
+            self.browser_pool = pool.get_async_pool()
+        with metrics.stage("acquire", self):
+            self.page = await self.browser_pool.acquire(self._allowed_resources, self._archive)
+        self._watch_responses()
+
+    async def configure_by_url(self, filters: dict):
+        """
+        Configures several filter queries at once.
+        See :py:meth:`ScrapingUtilities.configure_by_url`.
+
+        :param filters: Maps filter queries to options
+        :raises FanGraphs.exceptions.InvalidFilterQuery: A filter query is not used by the page
+        :raises FanGraphs.exceptions.InvalidFilterOption: An option is not offered by the page
+        """
+        queries = [q.lower() for q in self.list_queries()]
+        for query in filters:
+            if query.lower() not in queries:
+                raise fangraphs.exceptions.InvalidFilterQuery(query)
+        url, unmapped = params.compile_url(self.page.url, self._url_params, filters)
+        if url != self.page.url:
+            with metrics.stage("goto", self):
+                await self.page.goto(url, timeout=0)
+            if self.waitfor:
+                with metrics.stage("wait", self):
+                    await self.page.wait_for_selector(self.waitfor)
+            await self._refresh_parser()
+        for query, option in unmapped.items():
+            await self.configure(query, option)
+
+    async def _refresh_parser(self):
+        """
+        Re-initializes the ``bs4.BeautifulSoup`` object stored in :py:attr:`soup`.
+        The page cannot be read from the synchronous :py:attr:`soup` property,
+        so the asynchronous scrapers re-parse eagerly.
+        """
+        if self.waitfor:
+            with metrics.stage("wait", self):
+                await self.page.wait_for_selector(self.waitfor)
+        with metrics.stage("content", self):
+            html = await self.page.content()
+        metrics.emit("characters", "parse", self, len(html))
+        with metrics.stage("parse", self):
+            self.soup = bs4.BeautifulSoup(html, features="lxml")
+
+    async def _parse_fragment(self, selector: str, page=None):
+        """
+        Parses only the subtree of the first element matching ``selector``.
+        See :py:meth:`ScrapingUtilities._parse_fragment`.
+
+        :param selector: The CSS selector of the subtree's root element
+        :param page: The page to parse; defaults to :py:attr:`page`
+        :return: The root element of the parsed subtree
+        :rtype: lxml.html.HtmlElement
+        """
+        page = page or self.page
+        await page.wait_for_selector(selector)
+        with metrics.stage("fragment", self):
+            markup = await page.eval_on_selector(selector, "e => e.outerHTML")
+            metrics.emit("characters", "fragment", self, len(markup))
+            return lxml.html.fragment_fromstring(markup)
+
+    async def _extract_table(self, selector="", page=None, *, headers_only=False):
+        """
+        Reads the displayed rows of a data grid with a single evaluation inside the page.
+        See :py:meth:`ScrapingUtilities._extract_table`.
+
+        :param selector: The CSS selector of the data grid, or of its table; defaults to the grid of the page
+        :param page: The page to read; defaults to :py:attr:`page`
+        :param headers_only: If ``True``, the rows are not read
+        :return: The column headers and the rows of the data grid
+        :rtype: tuple[list, list]
+        """
+        page = page or self.page
+        selector = selector or self._table
+        await page.wait_for_selector(selector)
+        with metrics.stage("extract", self):
+            headers, rows = await page.eval_on_selector(selector, TABLE_JS, headers_only)
+        return headers, rows
+
+    async def read_table(self):
+        """
+        Reads the data grid as it is displayed, after displaying as many rows per page as possible.
+        See :py:meth:`ScrapingUtilities.read_table`.
+
+        :return: The displayed rows of the leaderboard
+        :rtype: fangraphs.leaders.table.Table
+        """
+        await self._close_ad()
+        await self._maximize_page_size()
+        return table.Table.from_rows(*await self._extract_table(), self._schema())
+
+    async def snapshot(self):
+        """
+        Reads the current option of every filter query in a single evaluation inside the page.
+        See :py:meth:`ScrapingUtilities.snapshot`.
+
+        :return: Maps each filter query to its current option
+        :rtype: dict
+        """
+        with metrics.stage("snapshot", self):
+            return await self.page.evaluate(selectors.STATE_JS, self._state_specs())
+
+    async def _submit(self, queries):
+        """
+        Submits the configured filter queries.
+        See :py:meth:`ScrapingUtilities._submit`.
+
+        :param queries: The configured filter queries
+        """
+
+    async def configure_many(self, filters: dict, *, autoupdate=True):
+        """
+        Configures several filter queries, with as few actions on the page as possible.
+        See :py:meth:`ScrapingUtilities.configure_many`.
+
+        :param filters: Maps filter queries to options
+        :param autoupdate: If ``True``, the configured filters are submitted
+        :return: The filter queries which were configured
+        :rtype: list
+        :raises FanGraphs.exceptions.InvalidFilterQuery: A filter query is not used by the page
+        """
+        pending = self._pending(filters, await self.snapshot())
+        if not pending:
+            return []
+        await self._close_ad()
+        for query, option in pending.items():
+            await self._configure(query, option)
+        if autoupdate:
+            await self._submit(list(pending))
+        await self._refresh_parser()
+        return list(pending)
+
+    async def _full_page(self, page, size):
+        """
+        See :py:meth:`ScrapingUtilities._full_page`.
+
+        :param page: The page of the data grid
+        :param size: The current page size of the data grid
+        :return: The number of displayed rows, if the grid re-renders with more rows under a larger page size;
+            otherwise, ``None``
+        :rtype: int or None
+        """
+        if not self._table or not size.strip().isdigit():
+            return None
+        rows = await page.eval_on_selector(self._table, ROW_COUNT_JS)
+        if rows < int(size):
+            return None
+        total = self._pagination.get("total")
+        if total and int((await self._parse_fragment(total, page)).text_content()) <= 1:
+            return None
+        return rows
+
+    async def _maximize_page_size(self, page=None):
+        """
+        Displays as many rows per page of the data grid as possible.
+        See :py:meth:`ScrapingUtilities._maximize_page_size`.
+
+        :param page: The page of the data grid; defaults to :py:attr:`page`
+        :return: ``True`` if the page size was changed
+        :rtype: bool
+        """
+        page = page or self.page
+        if self._page_size and await page.query_selector(self._page_size):
+            values = await page.eval_on_selector_all(f"{self._page_size} option", "els => els.map(e => e.value)")
+            sizes = [v for v in values if v.strip().isdigit()]
+            if not sizes:
+                return False
+            largest = max(sizes, key=int)
+            current = await page.eval_on_selector(self._page_size, "e => e.value")
+            if current == largest:
+                return False
+            before = await self._full_page(page, current)
+            await page.select_option(self._page_size, largest)
+            if before is not None:
+                with metrics.stage("wait", self):
+                    await page.wait_for_function(ROW_COUNT_CHANGED_JS, arg=[self._table, before])
+        elif self._page_size_param:
+            url = set_query_param(page.url, self._page_size_param, PAGE_ITEMS)
+            if url == page.url:
+                return False
+            with metrics.stage("goto", self):
+                await page.goto(url, timeout=0)
+            if self.waitfor:
+                with metrics.stage("wait", self):
+                    await page.wait_for_selector(self.waitfor)
+        else:
+            return False
+        if page is self.page:
+            await self._refresh_parser()
+        return True
+
+    async def _close_ad(self):
+        """
+        Closes the ad which may interfere with clicking other page elements.
+        Nothing is done if the browser pool blocks the ad hosts, since the ad is never loaded.
+        """
+        profile = getattr(self.browser_pool, "profile", None)
+        if profile is not None and profile.blocks_ads:
+            return
+        with metrics.stage("close_ad", self):
+            if await self.page.query_selector("#ezmob-wrapper > div[style='display: none;']"):
+                return
+            elem = await self.page.query_selector(".ezmob-footer-close")
+            if elem:
+                await elem.click()
+
+    async def export_data(self, selector: str, path="", *, as_table=False, fmt=None):
+        """
+        Uses the **Export Data** button on the webpage to export the current leaderboard.
+        See :py:meth:`ScrapingUtilities.export_data`.
+
+        :param selector: The CSS selector of the **Export Data** button
+        :param path: The path to save the exported data to
+        :param as_table: If ``True``, the download is read into memory and discarded, and nothing is saved
+        :param fmt: The file format to save the data as (see :py:func:`fangraphs.leaders.table.file_format`).
+            Formats other than CSV are converted through :py:meth:`fangraphs.leaders.table.Table.write`.
+        :return: The exported leaderboard, if ``as_table`` is ``True``
+        :rtype: fangraphs.leaders.table.Table or None
+        """
+        await self._close_ad()
+        with metrics.stage("download", self):
+            async with self.page.expect_download() as down_info:
+                await self.page.click(selector)
+            download = await down_info.value
+            download_path = await download.path()
+        metrics.emit("bytes", "download", self, os.path.getsize(download_path))
+        path = None if as_table else self._export_path(path, fmt)
+        if path is not None and table.file_format(path, fmt) == "csv":
+            os.rename(download_path, path)
+            return None
+        with metrics.stage("read", self):
+            data = table.Table.from_csv(download_path, self._schema())
+        await download.delete()
+        if path is None:
+            return data
+        with metrics.stage("write", self):
+            data.write(path, fmt)
+        return None
+
+    async def reset(self):
+        """
+        Navigates :py:attr:`page` to :py:attr:`address`.
+        """
+        with metrics.stage("goto", self):
+            await self.page.goto(self.address, timeout=0)
+        await self._refresh_parser()
+
+    async def quit(self):
+        """
+        Returns :py:attr:`page` to the browser pool.
+        """
+        if self.page is not None:
+            self._unwatch_responses()
+            await self.browser_pool.release(self.page)
+            self.page = None
+
+    async def replace_page(self):
+        """
+        Returns :py:attr:`page` to the browser pool, borrows a fresh page and navigates it to :py:attr:`address`.
+        See :py:meth:`ScrapingUtilities.replace_page`.
         """
-        self.__browser.close()
-        self.__play.stop()
+        await self.quit()
+        await self._browser_init()
+        await self.reset()
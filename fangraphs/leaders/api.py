@@ -0,0 +1,334 @@
+#! python3
+# FanGraphs/leaders/api.py
+
+"""
+Browserless data retrieval for the React-based FanGraphs **Leaders** pages.
+
+The React pages load the rows of their data grids from JSON endpoints.
+Each :py:class:`Endpoint` maps the filter queries of a scraper class onto the parameters of its endpoint,
+so a filter configuration can be fetched with a single HTTP request instead of a rendered page.
+Configurations which cannot be mapped fall back to the ``Playwright`` scraper.
+"""
+
+import csv
+import html
+import re
+import threading
+import urllib.parse
+
+import requests
+import requests.adapters
+
+import fangraphs.exceptions
+from fangraphs.leaders import ScrapingUtilities
+from fangraphs.leaders import columns
+from fangraphs.leaders import metrics
+from fangraphs.leaders import table
+from fangraphs.selectors import leaders_sel
+
+
+class Endpoint:
+    """
+    Describes the JSON endpoint behind a leaderboard and how filter queries map onto its parameters.
+    """
+    def __init__(self, url, *, method="GET", params=None, queries=None, rows_key="data"):
+        """
+        :param url: The URL address of the endpoint
+        :param method: The HTTP method; ``POST`` endpoints receive the parameters as a JSON body
+        :param params: The default parameters sent with every request
+        :param queries: Maps each supported filter query to a ``(parameter, options)`` pair.
+            ``options`` maps the (lowercase) option text to the parameter value.
+            If ``options`` is ``None``, the option text is sent unchanged.
+        :param rows_key: The key of the JSON response holding the list of rows
+
+        .. py:attribute:: url
+            The URL address of the endpoint
+            :type: str
+        """
+        self.url = url
+        self.method = method.upper()
+        self.params = dict(params or {})
+        self.queries = dict(queries or {})
+        self.rows_key = rows_key
+
+    def build(self, filters: dict):
+        """
+        Compiles a filter configuration into request parameters.
+
+        :param filters: Maps filter queries to options
+        :return: The request parameters, or ``None`` if any filter query has no mapping
+        :rtype: dict or None
+        :raises FanGraphs.exceptions.InvalidFilterOption: An option is not accepted by the endpoint
+        """
+        params = dict(self.params)
+        for query, option in filters.items():
+            query = query.lower()
+            if query not in self.queries:
+                return None
+            name, options = self.queries[query]
+            option = str(option)
+            if options is None:
+                params[name] = option
+            else:
+                try:
+                    params[name] = options[option.lower()]
+                except KeyError as err:
+                    raise fangraphs.exceptions.InvalidFilterOption(option) from err
+        return params
+
+
+_TAG = re.compile(r"<[^>]+>")
+
+ENDPOINTS = {
+    "GameSpan": Endpoint(
+        "https://www.fangraphs.com/api/leaders/special/60-game-span",
+        params={"pos": "all", "stats": "bat", "type": "0"},
+        queries={
+            "stat": ("stats", {"batting": "bat", "pitching": "pit"}),
+            "type": ("type", {"player": "0", "team": "1", "league": "2"}),
+            "min_pa": ("qual", None),
+            "single_season": ("season", None),
+            "season1": ("season1", None),
+            "season2": ("season", None),
+        }
+    ),
+    "International": Endpoint(
+        "https://www.fangraphs.com/api/leaders/international/kbo/data",
+        params={"lg": "kbo", "pos": "all", "stats": "bat", "type": "1", "ind": "0"},
+        queries={
+            "stat": ("stats", {"batting": "bat", "pitching": "pit"}),
+            "type": ("type", {"standard": "1", "advanced": "2"}),
+            "position": ("pos", None),
+            "min": ("qual", None),
+            "single_season": ("season", None),
+            "season1": ("season1", None),
+            "season2": ("season", None),
+            "team": ("team", None),
+            "split_seasons": ("ind", {"true": "1", "false": "0"}),
+        }
+    ),
+    "SeasonStat": Endpoint(
+        "https://www.fangraphs.com/api/leaders/season-grid/data",
+        params={"position": "B", "mode": "normal"},
+        queries={
+            "stat": ("position", {"batting": "B", "pitching": "P"}),
+            "type": ("mode", {"normal": "normal", "rank": "rank", "percentile": "percentile"}),
+            "start_season": ("seasonStart", None),
+            "end_season": ("seasonEnd", None),
+            **{
+                category: ("stat", None)
+                for category in (
+                    "popular", "standard", "advanced", "statcast", "batted_ball",
+                    "win_probability", "pitch_type", "plate_discipline", "value"
+                )
+            }
+        }
+    ),
+    "Splits": Endpoint(
+        "https://www.fangraphs.com/api/leaders/splits/splits-leaders",
+        method="POST",
+        params={
+            "strPosition": "B", "strType": "1", "strGroup": "season",
+            "strSplitTeams": False, "strAutoPt": "false", "strStatType": "player",
+            "strSplitArr": [], "dctFilters": [], "arrPlayerId": [], "strSplitArrPitch": []
+        },
+        queries={
+            "group": ("strStatType", {"player": "player", "team": "team", "league": "league"}),
+            "stat": ("strPosition", {"batting": "B", "pitching": "P"}),
+            "type": ("strType", {"standard": "1", "advanced": "2", "batted ball": "3"}),
+            "groupby": ("strGroup", {"season": "season", "career": "career", "month": "month"}),
+            "split_teams": ("strSplitTeams", {"true": True, "false": False}),
+            "auto_pt": ("strAutoPt", {"true": "true", "false": "false"}),
+        }
+    ),
+}
+
+
+class APIClient:
+    """
+    Fetches leaderboard rows from the FanGraphs JSON endpoints over a pooled HTTP session.
+    """
+    def __init__(self, *, base_url="", pool_size=10, timeout=60, endpoints=None):
+        """
+        :param base_url: If specified, replaces the scheme and host of every endpoint URL (e.g. a local stub server)
+        :param pool_size: The number of connections kept alive per host
+        :param timeout: The number of seconds to wait for a response
+        :param endpoints: Maps scraper class names to :py:class:`Endpoint` objects; defaults to :py:data:`ENDPOINTS`
+
+        .. py:attribute:: session
+            The pooled HTTP session used for every request
+            :type: requests.Session
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.endpoints = ENDPOINTS if endpoints is None else endpoints
+
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, value, traceback):
+        self.close()
+
+    def endpoint(self, scraper_cls):
+        """
+        :param scraper_cls: A scraper class of :py:mod:`fangraphs.leaders.leaders`
+        :return: The endpoint of the scraper class, or ``None`` if there is no mapping
+        :rtype: Endpoint or None
+        """
+        return self.endpoints.get(scraper_cls.__name__)
+
+    def _url(self, endpoint):
+        if not self.base_url:
+            return endpoint.url
+        parts = urllib.parse.urlsplit(endpoint.url)
+        return self.base_url + urllib.parse.urlunsplit(
+            ("", "", parts.path, parts.query, "")
+        )
+
+    def fetch(self, scraper_cls, filters=None):
+        """
+        Fetches the rows of a leaderboard directly from its JSON endpoint.
+
+        :param scraper_cls: A scraper class of :py:mod:`fangraphs.leaders.leaders`
+        :param filters: Maps filter queries to options
+        :return: The column headers and the rows of the leaderboard,
+            or ``None`` if the filter configuration cannot be mapped onto an endpoint
+        :rtype: tuple[list, list] or None
+        """
+        endpoint = self.endpoint(scraper_cls)
+        if endpoint is None:
+            return None
+        params = endpoint.build(filters or {})
+        if params is None:
+            return None
+        with metrics.stage("request", scraper_cls):
+            if endpoint.method == "POST":
+                res = self.session.post(self._url(endpoint), json=params, timeout=self.timeout)
+            else:
+                res = self.session.get(self._url(endpoint), params=params, timeout=self.timeout)
+        res.raise_for_status()
+        metrics.emit("bytes", "request", scraper_cls, len(res.content))
+        data = res.json()
+        if isinstance(data, dict):
+            data = data.get(endpoint.rows_key, [])
+        return _tabulate(data)
+
+    def close(self):
+        """
+        Closes the pooled HTTP session.
+        """
+        self.session.close()
+
+
+def _tabulate(records):
+    """
+    Converts JSON row objects into column headers and rows.
+    Markup in string values (e.g. player links) is reduced to its text.
+
+    :param records: The row objects returned by an endpoint
+    :return: The column headers and the rows
+    :rtype: tuple[list, list]
+    """
+    headers = []
+    for record in records:
+        for key in record:
+            if key not in headers:
+                headers.append(key)
+    rows = []
+    for record in records:
+        row = []
+        for key in headers:
+            value = record.get(key, "")
+            if isinstance(value, str) and "<" in value:
+                value = html.unescape(_TAG.sub("", value))
+            row.append("" if value is None else value)
+        rows.append(row)
+    return headers, rows
+
+
+_local = threading.local()
+
+
+def get_client():
+    """
+    Returns the default API client of the calling thread, creating it if necessary.
+
+    :rtype: APIClient
+    """
+    client = getattr(_local, "client", None)
+    if client is None:
+        client = APIClient()
+        _local.client = client
+    return client
+
+
+def _validate_queries(scraper_cls, filters):
+    """
+    :raises FanGraphs.exceptions.InvalidFilterQuery: A filter query is not used by ``scraper_cls``
+    """
+    sel = getattr(leaders_sel, scraper_cls.__name__, None)
+    if sel is None:
+        return
+    queries = set()
+    for group in ("selections", "dropdowns", "splits", "switches"):
+        queries.update(getattr(sel, group, {}))
+    for query in filters:
+        if query.lower() not in queries:
+            raise fangraphs.exceptions.InvalidFilterQuery(query)
+
+
+def _browser_export(scraper_cls, filters, path, as_table=False, fmt=None):
+    """
+    Configures a ``Playwright`` scraper to ``filters`` and exports its leaderboard.
+    """
+    with scraper_cls() as scraper:
+        scraper.configure_by_url(filters)
+        if filters and hasattr(scraper, "update"):
+            scraper.update()
+        return scraper.export(path, as_table=as_table, fmt=fmt)
+
+
+def export(scraper_cls, filters=None, path="", *, client=None, as_table=False, fmt=None):
+    """
+    Exports a leaderboard without a browser, if its filter configuration maps onto a JSON endpoint.
+    Otherwise, the leaderboard is exported by an instance of ``scraper_cls``.
+    See :py:meth:`ScrapingUtilities.export_data` for ``path`` and ``fmt``.
+
+    :param scraper_cls: A scraper class of :py:mod:`fangraphs.leaders.leaders`
+    :param filters: Maps filter queries to options
+    :param path: The path to save the exported data to
+    :param client: The API client to use; defaults to :py:func:`get_client`
+    :param as_table: If ``True``, the leaderboard is returned in memory instead of saved
+    :param fmt: The file format; if not specified, it is inferred from the extension of ``path``
+    :return: The path the data was saved to, or the leaderboard if ``as_table`` is ``True``
+    :rtype: str or fangraphs.leaders.table.Table
+    :raises FanGraphs.exceptions.InvalidFilterQuery: A filter query is not used by ``scraper_cls``
+    """
+    filters = dict(filters or {})
+    _validate_queries(scraper_cls, filters)
+    result = (client or get_client()).fetch(scraper_cls, filters)
+    schema = columns.group_schema(next((o for q, o in filters.items() if q.lower() == "stat"), None))
+    if as_table:
+        if result is None:
+            return _browser_export(scraper_cls, filters, "", as_table=True)
+        return table.Table.from_rows(*result, schema)
+    path = ScrapingUtilities._export_path(path, fmt)
+    if result is None:
+        _browser_export(scraper_cls, filters, path, fmt=fmt)
+        return path
+    headers, rows = result
+    if table.file_format(path, fmt) != "csv":
+        table.Table.from_rows(headers, rows, schema).write(path, fmt)
+        return path
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(headers)
+        writer.writerows(rows)
+    return path
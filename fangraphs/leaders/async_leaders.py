@@ -0,0 +1,652 @@
+#! python3
+# FanGraphs/leaders/async_leaders.py
+
+"""
+Asynchronous scrapers for the webpages under the FanGraphs **Leaders** tab.
+
+Each class mirrors the synchronous class of the same name in :py:mod:`fangraphs.leaders.leaders`,
+but drives its page through ``playwright.async_api``.
+Many scrapers can therefore share one event loop and one browser::
+
+    async with AsyncMajorLeague() as mll, AsyncWAR() as war:
+        await asyncio.gather(mll.export("mll.csv"), war.export("war.csv"))
+"""
+
+import asyncio
+import csv
+
+import fangraphs.exceptions
+from fangraphs.leaders import AsyncScrapingUtilities
+from fangraphs.leaders import ROW_CHANGED_JS
+from fangraphs.leaders import ROW_MARKER_JS
+from fangraphs.leaders import leaders
+from fangraphs.leaders import metrics
+from fangraphs.leaders import table
+from fangraphs import selectors
+from fangraphs.selectors import leaders_sel
+
+
+class AsyncGameSpan(AsyncScrapingUtilities, leaders.GameSpan):
+    """
+    Asynchronous scraper for the FanGraphs `60-Game Span Leaderboards`_ page.
+
+    .. _60-Game Span Leaderboards: https://www.fangraphs.com/leaders/special/60-game-span
+    """
+    async def __aenter__(self):
+        await self._browser_init()
+        await self.reset()
+        return self
+
+    async def __aexit__(self, exc_type, value, traceback):
+        await self.quit()
+
+    async def _configure(self, query: str, option: str):
+        """
+        Sets a filter query to an option on the page.
+        See :py:meth:`fangraphs.leaders.leaders.GameSpan._configure`.
+
+        :param query: The filter query to be configured, in lower case
+        :param option: The option to set the filter query to
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        if query in self._selections:
+            await self._selections[query].aconfigure(self.page, option)
+        elif query in self._dropdowns:
+            await self._dropdowns[query].aconfigure(self.page, option)
+        else:
+            raise fangraphs.exceptions.InvalidFilterQuery(query)
+
+    async def configure(self, query: str, option: str):
+        """
+        Configures a filter query to a specified option.
+
+        :param query: The filter query to be configured
+        :param option: The option to set the filter query to
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        query = query.lower()
+        await self._close_ad()
+        await self._configure(query, option)
+        await self._refresh_parser()
+
+    async def export(self, path="", *, as_table=False, fmt=None):
+        """
+        Uses the **Export Data** button on the webpage to export the current leaderboard.
+        See :py:meth:`fangraphs.leaders.leaders.GameSpan.export`.
+
+        :param path: The path to save the exported data to
+        :param as_table: If ``True``, the leaderboard is returned in memory instead of saved
+        :param fmt: The file format; if not specified, it is inferred from the extension of ``path``
+        :return: The exported leaderboard, if ``as_table`` is ``True``
+        :rtype: fangraphs.leaders.table.Table or None
+        """
+        return await self.export_data(".data-export", path, as_table=as_table, fmt=fmt)
+
+
+class AsyncInternational(AsyncScrapingUtilities, leaders.International):
+    """
+    Asynchronous scraper for the FanGraphs `KBO Leaderboards`_ page.
+
+    .. _KBO Leaderboards: https://www.fangraphs.com/leaders/international
+    """
+    async def __aenter__(self):
+        await self._browser_init()
+        await self.reset()
+        return self
+
+    async def __aexit__(self, exc_type, value, traceback):
+        await self.quit()
+
+    async def _configure(self, query: str, option: str):
+        """
+        Sets a filter query to an option on the page.
+        See :py:meth:`fangraphs.leaders.leaders.International._configure`.
+
+        :param query: The filter query to be configured, in lower case
+        :param option: The option to set the filter query to
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        if query in self._selections:
+            await self._selections[query].aconfigure(self.page, option)
+        elif query in self._dropdowns:
+            await self._dropdowns[query].aconfigure(self.page, option)
+        elif query in self._switches:
+            options = [o.lower() for o in self.list_options(query)]
+            if option not in options:
+                raise fangraphs.exceptions.InvalidFilterOption(option)
+            if option == self.current_option(query):
+                return
+            await self.page.click(self._switches[query].selector)
+        else:
+            raise fangraphs.exceptions.InvalidFilterQuery(query)
+
+    async def configure(self, query: str, option: str):
+        """
+        Configures a filter query to a specified option.
+
+        :param query: The filter query to be configured
+        :param option: The option to set the filter query to
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        query = query.lower()
+        await self._close_ad()
+        await self._configure(query, option)
+        await self._refresh_parser()
+
+    async def export(self, path="", *, as_table=False, fmt=None):
+        """
+        Uses the **Export Data** button on the webpage to export the current leaderboard.
+        See :py:meth:`fangraphs.leaders.leaders.International.export`.
+
+        :param path: The path to save the exported data to
+        :param as_table: If ``True``, the leaderboard is returned in memory instead of saved
+        :param fmt: The file format; if not specified, it is inferred from the extension of ``path``
+        :return: The exported leaderboard, if ``as_table`` is ``True``
+        :rtype: fangraphs.leaders.table.Table or None
+        """
+        return await self.export_data(".data-export", path, as_table=as_table, fmt=fmt)
+
+
+class AsyncMajorLeague(AsyncScrapingUtilities, leaders.MajorLeague):
+    """
+    Asynchronous scraper for the FanGraphs `Major League Leaderboards`_ page.
+
+    .. _Major League Leaderboards: https://fangraphs.com/leaders.aspx
+    """
+    async def __aenter__(self):
+        await self._browser_init()
+        await self.reset()
+        return self
+
+    async def __aexit__(self, exc_type, value, traceback):
+        await self.quit()
+
+    async def _configure(self, query: str, option: str):
+        """
+        Sets a filter query to an option on the page.
+        See :py:meth:`fangraphs.leaders.leaders.MajorLeague._configure`.
+
+        :param query: The filter query to be configured, in lower case
+        :param option: The option to set the filter query to
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        option = str(option).lower()
+        if query in self._selections:
+            await self._selections[query].aconfigure(self.page, option)
+        elif query in self._dropdowns:
+            await self._dropdowns[query].aconfigure(self.page, option)
+        elif query in self._switches:
+            options = [o.lower() for o in self.list_options(query)]
+            if option.lower() not in options:
+                raise fangraphs.exceptions.InvalidFilterOption(option)
+            if option != self.current_option(query).lower():
+                await self.page.click(self._switches[query].selector)
+        else:
+            raise fangraphs.exceptions.InvalidFilterQuery(query)
+
+    async def configure(self, query: str, option: str, *, autoupdate=True):
+        """
+        Configures a filter query to a specified option.
+
+        :param query: The filter query to be configured
+        :param option: The option to set the filter query to
+        :param autoupdate: If ``True``, any buttons attached to the filter query will be clicked
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        query = query.lower()
+        await self._close_ad()
+        await self._configure(query, option)
+        if autoupdate:
+            await self._submit([query])
+        await self._refresh_parser()
+
+    async def _submit(self, queries):
+        """
+        Clicks the buttons attached to the configured filter queries, once each.
+        See :py:meth:`fangraphs.leaders.leaders.MajorLeague._submit`.
+
+        :param queries: The configured filter queries
+        """
+        for button in dict.fromkeys(self._buttons[q] for q in queries if q in self._buttons):
+            await self.page.click(button)
+
+    async def export(self, path="", *, as_table=False, fmt=None):
+        """
+        Uses the **Export Data** button on the webpage to export the current leaderboard.
+        See :py:meth:`fangraphs.leaders.leaders.MajorLeague.export`.
+
+        :param path: The path to save the exported data to
+        :param as_table: If ``True``, the leaderboard is returned in memory instead of saved
+        :param fmt: The file format; if not specified, it is inferred from the extension of ``path``
+        :return: The exported leaderboard, if ``as_table`` is ``True``
+        :rtype: fangraphs.leaders.table.Table or None
+        """
+        return await self.export_data("#LeaderBoard1_cmdCSV", path, as_table=as_table, fmt=fmt)
+
+
+class AsyncSeasonStat(AsyncScrapingUtilities, leaders.SeasonStat):
+    """
+    Asynchronous scraper for the FanGraphs `Season Stat Grid`_ page.
+
+    .. _Season Stat Grid: https://fangraphs.com/leaders/season-stat-grid
+    """
+    async def __aenter__(self):
+        await self._browser_init()
+        await self.reset()
+        return self
+
+    async def __aexit__(self, exc_type, value, traceback):
+        await self.quit()
+
+    async def _configure(self, query: str, option: str):
+        """
+        Sets a filter query to an option on the page.
+        See :py:meth:`fangraphs.leaders.leaders.SeasonStat._configure`.
+
+        :param query: The filter query to be configured, in lower case
+        :param option: The option to set the filter query to
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        if query in self._selections:
+            await self._selections[query].aconfigure(self.page, option)
+        elif query in self._dropdowns:
+            await self._dropdowns[query].aconfigure(self.page, option)
+        else:
+            raise fangraphs.exceptions.InvalidFilterQuery(query)
+
+    async def configure(self, query: str, option: str):
+        """
+        Configures a filter query to a specified option.
+
+        :param query: The filter query
+        :param option: The option to configure ``query`` to
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        query = query.lower()
+        await self._close_ad()
+        await self._configure(query, option)
+        await self._refresh_parser()
+
+    async def _total_pages(self):
+        """
+        :return: The number of pages of the data table
+        :rtype: int
+        """
+        elem = await self._parse_fragment(self._pagination["total"])
+        return int(elem.text_content())
+
+    async def _partitions(self, partitions):
+        """
+        Limits the number of partitions of the data table.
+        See :py:meth:`fangraphs.leaders.leaders.SeasonStat._partitions`.
+        An :py:class:`~fangraphs.leaders.pool.AsyncBrowserPool` waits for pages to be released,
+        so more partitions than the pool can lend would wait for pages which this scraper never releases.
+
+        :param partitions: The requested number of partitions
+        :return: The number of partitions to read the data table with
+        :rtype: int
+        """
+        if partitions <= 1 or await self.page.query_selector(self._pagination["input"]) is None:
+            return 1
+        size = getattr(self.browser_pool, "size", None)
+        if size is not None:
+            partitions = min(partitions, size - self.browser_pool.borrowed + 1)
+        return max(1, partitions)
+
+    async def _jump(self, page, page_num):
+        """
+        Displays page ``page_num`` (zero-based) of the data table of ``page``, which is on the first page.
+        See :py:meth:`fangraphs.leaders.leaders.SeasonStat._jump`.
+        """
+        with metrics.stage("jump", self):
+            elem = await page.query_selector(self._pagination["input"])
+            before = await self._row_marker(page)
+            await elem.fill(str(page_num + 1))
+            await elem.press("Enter")
+            await self._wait_rows(page, before)
+
+    async def _row_marker(self, page):
+        """
+        :return: The marker of the page of the data table which ``page`` displays
+        :rtype: str
+        """
+        return await page.eval_on_selector(self._table, ROW_MARKER_JS)
+
+    async def _wait_rows(self, page, before):
+        """
+        Waits until the data table of ``page`` has re-rendered, following a change of its displayed page.
+        See :py:meth:`fangraphs.leaders.leaders.SeasonStat._wait_rows`.
+        """
+        with metrics.stage("wait", self):
+            await page.wait_for_function(ROW_CHANGED_JS, arg=[self._table, before])
+
+    async def _next_page(self, page):
+        """
+        Clicks **Next** in the page control of ``page``, and waits until the next page of the data table is displayed.
+        """
+        before = await self._row_marker(page)
+        await page.click(self._pagination["next"])
+        await self._wait_rows(page, before)
+
+    async def _clone_page(self):
+        """
+        Borrows another page from :py:attr:`browser_pool` and opens the current leaderboard on it.
+        See :py:meth:`fangraphs.leaders.leaders.SeasonStat._clone_page`.
+        """
+        page = await self.browser_pool.acquire(self._allowed_resources, self._archive)
+        try:
+            await page.goto(self.page.url, timeout=0)
+            await page.wait_for_selector(self.waitfor)
+            await self._maximize_page_size(page)
+        except Exception:
+            await self.browser_pool.release(page)
+            raise
+        return page
+
+    async def _table_rows(self, page=None, typed=True):
+        """
+        :param page: The page to read; defaults to :py:attr:`page`
+        :param typed: If ``True``, numeric cells are converted
+        :return: The rows of the currently displayed page of the data table
+        :rtype: list
+        """
+        rows = (await self._extract_table(self._table, page))[1]
+        return [[leaders._typed(c) for c in row] for row in rows] if typed else rows
+
+    async def headers(self):
+        """
+        Lists the column headers of the data table.
+
+        :return: The column headers
+        :rtype: list
+        """
+        return (await self._extract_table(self._table, headers_only=True))[0]
+
+    async def _read_range(self, page_range, typed, page=None):
+        """
+        Reads the rows of a range of pages of the data table.
+        Pages other than :py:attr:`page` are borrowed from :py:attr:`browser_pool` for the read.
+
+        :param page_range: The range of zero-based page numbers
+        :param typed: If ``True``, numeric cells are converted
+        :param page: The page to read with; if not specified, a page is cloned (see :py:meth:`_clone_page`)
+        :return: The rows of the range
+        :rtype: list
+        """
+        clone = page is None
+        if clone:
+            page = await self._clone_page()
+        try:
+            if page_range.start:
+                await self._jump(page, page_range.start)
+            rows = []
+            for page_num in page_range:
+                rows.extend(await self._table_rows(page, typed))
+                if page_num < page_range.stop - 1:
+                    await self._next_page(page)
+            return rows
+        finally:
+            if clone:
+                await self.browser_pool.release(page)
+
+    async def iter_rows(self, *, typed=True, partitions=1):
+        """
+        Iterates through the rows of the data table of the current leaderboard, page by page.
+        See :py:meth:`fangraphs.leaders.leaders.SeasonStat.iter_rows`.
+
+        With more than one partition, the pages of the data table are split into contiguous ranges,
+        which are read concurrently by :py:attr:`page` and pages borrowed from :py:attr:`browser_pool`.
+        The rows are yielded in order once every range has been read.
+        The number of partitions is limited to the pages which the pool can lend (see :py:meth:`_partitions`).
+
+        :param typed: If ``True``, cells holding integers or decimals are converted to ``int`` or ``float``
+        :param partitions: The number of pages of the browser which read the data table concurrently
+        :return: An asynchronous generator yielding one list of cells per row
+        :rtype: collections.abc.AsyncGenerator
+        """
+        await self._close_ad()
+        await self._maximize_page_size()
+        partitions = await self._partitions(partitions)
+        total_pages = await self._total_pages()
+        if partitions > 1:
+            ranges = self._page_ranges(total_pages, partitions)
+            results = await asyncio.gather(
+                self._read_range(ranges[0], typed, self.page),
+                *(self._read_range(r, typed) for r in ranges[1:])
+            )
+            for rows in results:
+                for row in rows:
+                    yield row
+            return
+        for page_num in range(total_pages):
+            for row in await self._table_rows(typed=typed):
+                yield row
+            if page_num < total_pages - 1:
+                await self._next_page(self.page)
+
+    async def export(self, path="", *, as_table=False, fmt=None, partitions=1):
+        """
+        Scrapes and saves the data from the table of the current leaderboards.
+        See :py:meth:`fangraphs.leaders.leaders.SeasonStat.export`.
+
+        :param path: The path to save the exported file to
+        :param as_table: If ``True``, the leaderboard is returned in memory instead of saved
+        :param fmt: The file format; if not specified, it is inferred from the extension of ``path``
+        :param partitions: The number of pages of the browser which read the data table concurrently
+            (see :py:meth:`iter_rows`)
+        :return: The exported leaderboard, if ``as_table`` is ``True``
+        :rtype: fangraphs.leaders.table.Table or None
+        """
+        path = None if as_table else self._export_path(path, fmt)
+        if path is None or table.file_format(path, fmt) != "csv":
+            headers = await self.headers()
+            rows = [row async for row in self.iter_rows(typed=False, partitions=partitions)]
+            data = table.Table.from_rows(headers, rows, self._schema())
+            if path is None:
+                return data
+            data.write(path, fmt)
+            return None
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(await self.headers())
+            async for row in self.iter_rows(typed=False, partitions=partitions):
+                writer.writerow(row)
+        return None
+
+
+class AsyncSplits(AsyncScrapingUtilities, leaders.Splits):
+    """
+    Asynchronous scraper for the FanGraphs `Splits Leaderboards`_ page.
+
+    .. _Splits Leaderboards: https://fangraphs.com/leaders/splits-leaderboards
+    """
+    async def __aenter__(self):
+        await self._browser_init()
+        await self.reset()
+
+        await self.set_filter_group("Show All")
+        await self.configure("auto_pt", "False", autoupdate=True)
+        return self
+
+    async def __aexit__(self, exc_type, value, traceback):
+        await self.quit()
+
+    async def _configure(self, query: str, option: str):
+        """
+        Sets a filter query to an option on the page.
+        See :py:meth:`fangraphs.leaders.leaders.Splits._configure`.
+
+        :param query: The filter query to be configured, in lower case
+        :param option: The option to set the filter query to
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        if query in self._selections:
+            await self._selections[query].aconfigure(self.page, option)
+        elif query in self._dropdowns:
+            await self._dropdowns[query].aconfigure(self.page, option)
+        elif query in self._splits:
+            await self._splits[query].aconfigure(self.page, option)
+        elif query in self._switches:
+            options = [o.lower() for o in self.list_options(query)]
+            if option.lower() not in options:
+                raise fangraphs.exceptions.InvalidFilterOption(option)
+            if option != self.current_option(query)[0].title():
+                await self.page.click(self._switches[query].selector)
+        else:
+            raise fangraphs.exceptions.InvalidFilterQuery(query)
+
+    async def configure(self, query: str, option: str, *, autoupdate=False):
+        """
+        Configures a filter query to a specified option.
+
+        :param query: The filter query to be configured
+        :param option: The option to set the filter query to
+        :param autoupdate: If ``True``, :py:meth:`update` will be called following configuration
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        await self._close_ad()
+        query = query.lower()
+        await self._configure(query, option)
+        if autoupdate:
+            await self._submit([query])
+        await self._refresh_parser()
+
+    async def _submit(self, queries):
+        """
+        Submits the configured filter queries through :py:meth:`update`.
+
+        :param queries: The configured filter queries
+        """
+        await self.update()
+
+    async def update(self):
+        """
+        Clicks the **Update** button of the page.
+        All configured filters are submitted and the page is refreshed.
+
+        :raises FanGraphs.exceptions.FilterUpdateIncapability: No filter queries to update
+        """
+        elem = await self.page.query_selector("#button-update")
+        if elem is None:
+            raise fangraphs.exceptions.FilterUpdateIncapability()
+        await self._close_ad()
+        with metrics.stage("update", self):
+            await elem.click()
+        await self._refresh_parser()
+
+    async def set_filter_group(self, group="Show All"):
+        """
+        Configures the available filters to a specified group of filters
+
+        :param group: The name of the group of filters
+        """
+        selector = leaders_sel.Splits.filter_groups
+        elems = selectors.compile_selector(selector).select(self.soup)
+        options = [e.getText() for e in elems]
+        try:
+            index = options.index(group)
+        except ValueError as err:
+            raise fangraphs.exceptions.InvalidFilterGroup(group) from err
+        await self._close_ad()
+        elems = await self.page.query_selector_all(selector)
+        await elems[index].click()
+
+    async def reset_filters(self):
+        """
+        Resets filters to the original option(s).
+        See :py:meth:`fangraphs.leaders.leaders.Splits.reset_filters`.
+        """
+        elem = await self.page.query_selector(
+            "#stack-buttons .fgButton.small:nth-last-child(1)"
+        )
+        if elem is None:
+            return
+        await self._close_ad()
+        await elem.click()
+
+    async def set_to_quick_split(self, quick_split: str, autoupdate=True):
+        """
+        Invokes the configuration of a quick split.
+        See :py:meth:`fangraphs.leaders.leaders.Splits.set_to_quick_split`.
+
+        :param quick_split: The quick split to invoke
+        :param autoupdate: If ``True``, :py:meth:`update` will be called
+        :raises FanGraphs.exceptions.InvalidQuickSplits: Invalid argument ``quick_split``
+        """
+        quick_split = quick_split.lower()
+        try:
+            selector = self._quick_splits[quick_split]
+        except KeyError as err:
+            raise fangraphs.exceptions.InvalidQuickSplit(quick_split) from err
+        await self._close_ad()
+        await self.page.click(selector)
+        if autoupdate:
+            await self.update()
+
+    async def export(self, path="", *, as_table=False, fmt=None):
+        """
+        Uses the **Export Data** button on the webpage to export the current leaderboard.
+        See :py:meth:`fangraphs.leaders.leaders.Splits.export`.
+
+        :param path: The path to save the exported data to
+        :param as_table: If ``True``, the leaderboard is returned in memory instead of saved
+        :param fmt: The file format; if not specified, it is inferred from the extension of ``path``
+        :return: The exported leaderboard, if ``as_table`` is ``True``
+        :rtype: fangraphs.leaders.table.Table or None
+        """
+        return await self.export_data(".data-export", path, as_table=as_table, fmt=fmt)
+
+
+class AsyncWAR(AsyncScrapingUtilities, leaders.WAR):
+    """
+    Asynchronous scraper for the FanGraphs `Combined WAR Leaderboards`_ page.
+
+    .. _Combined WAR Leaderboards: https://www.fangraphs.com/warleaders.aspx
+    """
+    async def __aenter__(self):
+        await self._browser_init()
+        await self.reset()
+        return self
+
+    async def __aexit__(self, exc_type, value, traceback):
+        await self.quit()
+
+    async def _configure(self, query: str, option: str):
+        """
+        Sets a filter query to an option on the page.
+        See :py:meth:`fangraphs.leaders.leaders.WAR._configure`.
+
+        :param query: The filter query to be configured, in lower case
+        :param option: The option to set the filter query to
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        if query in self._dropdowns:
+            await self._dropdowns[query].aconfigure(self.page, option)
+        else:
+            raise fangraphs.exceptions.InvalidFilterQuery(query)
+
+    async def configure(self, query: str, option: str):
+        """
+        Configures a filter query to a specified option.
+
+        :param query: The filter query to be configured
+        :param option: The option to set the filter query to
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        query = query.lower()
+        await self._close_ad()
+        await self._configure(query, option)
+        await self._refresh_parser()
+
+    async def export(self, path="", *, as_table=False, fmt=None):
+        """
+        Uses the **Export Data** button on the webpage to export the current leaderboard.
+        See :py:meth:`fangraphs.leaders.leaders.WAR.export`.
+
+        :param path: The path to save the exported data to
+        :param as_table: If ``True``, the leaderboard is returned in memory instead of saved
+        :param fmt: The file format; if not specified, it is inferred from the extension of ``path``
+        :return: The exported leaderboard, if ``as_table`` is ``True``
+        :rtype: fangraphs.leaders.table.Table or None
+        """
+        return await self.export_data("#WARBoard1_cmdCSV", path, as_table=as_table, fmt=fmt)
@@ -0,0 +1,220 @@
+#! python3
+# FanGraphs/leaders/batch.py
+
+"""
+Batch export of one leaderboard across many filter configurations.
+
+Jobs are split into contiguous chunks, one per worker.
+Each worker keeps a single page open and only reconfigures the filter queries which change between consecutive jobs.
+"""
+
+import asyncio
+import itertools
+import os
+import time
+
+from fangraphs.leaders import AsyncScrapingUtilities
+from fangraphs.leaders import async_leaders
+from fangraphs.leaders import pool
+
+
+def expand_grid(grid: dict):
+    """
+    Expands a grid of filter options into the list of every filter configuration.
+    The last filter query varies fastest, so consecutive configurations differ by as few filter queries as possible.
+
+    :param grid: Maps filter queries to the list of options to sweep
+    :return: Every combination of the options, as dictionaries mapping filter queries to options
+    :rtype: list
+    """
+    queries = list(grid)
+    return [
+        dict(zip(queries, options))
+        for options in itertools.product(*(grid[q] for q in queries))
+    ]
+
+
+class BatchReport:
+    """
+    The outcome of a batch export.
+    """
+    def __init__(self):
+        """
+        .. py:attribute:: exported
+            The ``(filters, path, seconds)`` of each successful job
+            :type: list
+        .. py:attribute:: failed
+            The ``(filters, exception)`` of each failed job.
+            If the page could not be reset after the failure, the exception of the reset is recorded instead;
+            the exception of the job is its ``__context__``.
+            :type: list
+        .. py:attribute:: elapsed
+            The wall-clock duration of the batch, in seconds
+            :type: float
+        """
+        self.exported = []
+        self.failed = []
+        self.elapsed = 0.0
+
+    @property
+    def throughput(self):
+        """
+        The number of successful jobs per second of wall-clock time.
+
+        :rtype: float
+        """
+        return len(self.exported) / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self):
+        return (
+            f"{len(self.exported)} exported, {len(self.failed)} failed "
+            f"in {self.elapsed:.1f}s ({self.throughput:.2f} jobs/s)"
+        )
+
+
+class BatchExporter:
+    """
+    Exports a leaderboard once per filter configuration, fanning the jobs out over several pages.
+    """
+    def __init__(self, scraper_cls, jobs, *, workers=1, path="out/{index}.csv", browser_pool=None,
+                 catalog=None):
+        """
+        :param scraper_cls: A scraper class of :py:mod:`fangraphs.leaders.leaders` (or its asynchronous counterpart)
+        :param jobs: The filter configurations to export, or a grid (see :py:func:`expand_grid`)
+        :param workers: The number of pages exporting concurrently
+        :param path: The output filepath template, formatted with ``index`` and the filter queries of each job,
+            e.g. ``"out/{stat}_{single_season}.csv"``
+        :param browser_pool: The asynchronous browser pool to borrow pages from.
+            If not specified, a pool of ``workers`` contexts is created for the batch.
+        :param catalog: The option catalog which every job is validated against before any page is opened.
+            Options missing from the catalog are checked against the page when the job runs
+            (see :py:meth:`fangraphs.leaders.catalog.OptionCatalog.validate`).
+        :raises FanGraphs.exceptions.InvalidFilterQuery: A job uses a filter query unknown to the catalog
+        """
+        if isinstance(jobs, dict):
+            jobs = expand_grid(jobs)
+        self.scraper_cls = self._async_class(scraper_cls)
+        self.jobs = [dict(j) for j in jobs]
+        self.workers = max(1, min(workers, len(self.jobs)))
+        self.path = path
+        self.browser_pool = browser_pool
+        self.catalog = catalog
+        if catalog is not None:
+            for filters in self.jobs:
+                catalog.validate(self.scraper_cls, filters)
+
+    @staticmethod
+    def _async_class(scraper_cls):
+        if issubclass(scraper_cls, AsyncScrapingUtilities):
+            return scraper_cls
+        return getattr(async_leaders, f"Async{scraper_cls.__name__}")
+
+    def _chunks(self):
+        """
+        Splits the numbered jobs into one contiguous chunk per worker.
+        """
+        jobs = list(enumerate(self.jobs))
+        size, extra = divmod(len(jobs), self.workers)
+        start = 0
+        for i in range(self.workers):
+            stop = start + size + (i < extra)
+            yield jobs[start:stop]
+            start = stop
+
+    async def _configure(self, scraper, previous, filters):
+        """
+        Reconfigures ``scraper`` from the filter configuration ``previous`` to ``filters``.
+        The page is reset if ``previous`` configured a filter query which ``filters`` does not.
+        """
+        if previous is None or set(previous) - set(filters):
+            if previous is not None:
+                await scraper.reset()
+            previous = {}
+        changed = {
+            q: o for q, o in filters.items()
+            if str(previous.get(q, "")).lower() != str(o).lower()
+        }
+        if changed:
+            await scraper.configure_by_url(changed)
+        if changed and hasattr(scraper, "update"):
+            await scraper.update()
+
+    @staticmethod
+    async def _recover(scraper):
+        """
+        Resets the page of ``scraper`` after a failed job.
+        If the page cannot be reset, it is returned to the browser pool and a fresh page is borrowed instead.
+
+        :return: The exception raised by the reset, chained to the failure of the job, or ``None``
+        :raises Exception: A fresh page could not be borrowed or reset
+        """
+        try:
+            await scraper.reset()
+        except Exception as err:  # pylint: disable=broad-except
+            await scraper.replace_page()
+            return err
+        return None
+
+    async def _work(self, chunk, browser_pool, report):
+        """
+        Exports the jobs of one chunk on a single page, recording the outcome of every job in ``report``.
+        If the page cannot be borrowed (or returned), the jobs of the chunk which were not run fail with that exception,
+        so one worker never aborts the batch.
+        """
+        done = 0
+        try:
+            async with self.scraper_cls(browser_pool=browser_pool, catalog=self.catalog) as scraper:
+                previous = None
+                for index, filters in chunk:
+                    path = self.path.format(index=index, **filters)
+                    start = time.perf_counter()
+                    try:
+                        await self._configure(scraper, previous, filters)
+                        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                        await scraper.export(path)
+                    except Exception as err:  # pylint: disable=broad-except
+                        previous = None
+                        done += 1
+                        try:
+                            err = await self._recover(scraper) or err
+                        except Exception as fatal:  # pylint: disable=broad-except
+                            report.failed.append((filters, err))
+                            report.failed.extend((f, fatal) for _, f in chunk[done:])
+                            done = len(chunk)
+                            return
+                        report.failed.append((filters, err))
+                        continue
+                    done += 1
+                    report.exported.append((filters, path, time.perf_counter() - start))
+                    previous = filters
+        except Exception as err:  # pylint: disable=broad-except
+            report.failed.extend((f, err) for _, f in chunk[done:])
+
+    async def run_async(self):
+        """
+        Exports every job.
+
+        :return: The outcome of the batch
+        :rtype: BatchReport
+        """
+        report = BatchReport()
+        browser_pool = self.browser_pool or pool.AsyncBrowserPool(self.workers)
+        start = time.perf_counter()
+        try:
+            await asyncio.gather(*(
+                self._work(chunk, browser_pool, report) for chunk in self._chunks()
+            ))
+        finally:
+            report.elapsed = time.perf_counter() - start
+            if self.browser_pool is None:
+                await browser_pool.close()
+        return report
+
+    def run(self):
+        """
+        Exports every job, running an event loop until the batch is complete.
+
+        :return: The outcome of the batch
+        :rtype: BatchReport
+        """
+        return asyncio.run(self.run_async())
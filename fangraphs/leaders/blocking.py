@@ -0,0 +1,106 @@
+#! python3
+# FanGraphs/leaders/blocking.py
+
+"""
+Request-interception profiles, which keep the browser from loading what the scrapers never read.
+
+The FanGraphs pages load ads, analytics, images and fonts alongside the data.
+A :py:class:`ResourceProfile` aborts those requests through ``Playwright`` routing,
+so pages load faster and the ad overlays which block clicks never appear.
+"""
+
+import urllib.parse
+
+#: Hosts serving ads and analytics on the FanGraphs pages
+AD_HOSTS = (
+    "ezoic.net", "ezojs.com", "ezodn.com", "ezoic.com", "ezmob.com",
+    "doubleclick.net", "googlesyndication.com", "googletagservices.com", "googletagmanager.com",
+    "google-analytics.com", "adservice.google.com", "amazon-adsystem.com", "adnxs.com",
+    "rubiconproject.com", "pubmatic.com", "openx.net", "criteo.com", "criteo.net", "casalemedia.com",
+    "3lift.com", "taboola.com", "outbrain.com", "moatads.com", "scorecardresearch.com",
+    "quantserve.com", "quantcount.com", "chartbeat.com", "chartbeat.net", "hotjar.com",
+    "facebook.net", "facebook.com", "twitter.com", "newrelic.com", "nr-data.net"
+)
+
+#: Resource types which the scrapers never read
+RESOURCE_TYPES = ("image", "font", "media")
+
+
+class ResourceProfile:
+    """
+    Decides which requests of a page are aborted.
+    """
+    def __init__(self, *, block_types=RESOURCE_TYPES, block_hosts=AD_HOSTS):
+        """
+        :param block_types: The ``Playwright`` resource types to abort (e.g. ``"image"``, ``"font"``)
+        :param block_hosts: The hosts to abort every request to, including their subdomains
+
+        .. py:attribute:: block_types
+            The resource types to abort
+            :type: frozenset
+
+        .. py:attribute:: block_hosts
+            The hosts to abort every request to
+            :type: tuple
+        """
+        self.block_types = frozenset(block_types)
+        self.block_hosts = tuple(h.lower() for h in block_hosts)
+
+    @property
+    def blocks_ads(self):
+        """
+        ``True`` if the profile aborts requests to ad hosts, so no ad overlay needs closing.
+
+        :rtype: bool
+        """
+        return bool(self.block_hosts)
+
+    def blocks(self, url: str, resource_type: str, allow=()):
+        """
+        :param url: The URL of the request
+        :param resource_type: The ``Playwright`` resource type of the request
+        :param allow: Resource types and URL substrings which are never aborted (e.g. the allow-list of a scraper)
+        :return: ``True`` if the request is aborted
+        :rtype: bool
+        """
+        if resource_type in allow or any(a in url for a in allow):
+            return False
+        if resource_type in self.block_types:
+            return True
+        host = (urllib.parse.urlsplit(url).hostname or "").lower()
+        return any(host == h or host.endswith("." + h) for h in self.block_hosts)
+
+    def route(self, page, allow=()):
+        """
+        Intercepts the requests of a synchronous ``Playwright`` page.
+        Requests which are not aborted fall back to the page's other routes (e.g. a HAR replay), if any.
+
+        :param page: The page
+        :param allow: Resource types and URL substrings which are never aborted
+        """
+        def handler(route):
+            request = route.request
+            if self.blocks(request.url, request.resource_type, allow):
+                route.abort()
+            else:
+                route.fallback()
+        page.route("**/*", handler)
+
+    async def aroute(self, page, allow=()):
+        """
+        Intercepts the requests of an asynchronous ``Playwright`` page.
+
+        :param page: The page
+        :param allow: Resource types and URL substrings which are never aborted
+        """
+        async def handler(route):
+            request = route.request
+            if self.blocks(request.url, request.resource_type, allow):
+                await route.abort()
+            else:
+                await route.fallback()
+        await page.route("**/*", handler)
+
+
+#: The profile of the default browser pools, which blocks ads, analytics, images and fonts
+DEFAULT_PROFILE = ResourceProfile()
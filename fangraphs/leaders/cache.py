@@ -0,0 +1,268 @@
+#! python3
+# FanGraphs/leaders/cache.py
+
+"""
+Persistent on-disk cache of leaderboard exports.
+
+Exports are keyed by the scraper class and the canonical form of the filter configuration.
+Leaderboards of past seasons never change, so they are kept until evicted.
+Leaderboards which may include the current season expire after a short TTL.
+"""
+
+import contextlib
+import datetime
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+
+from fangraphs.leaders import ScrapingUtilities
+from fangraphs.leaders import api
+from fangraphs.leaders import page_name
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+#: Matches the filter queries which select a season (e.g. ``season``, ``season1``, ``single_season``, ``end_season``),
+#: but not the switches named after seasons (e.g. ``split_seasons``)
+_SEASON_QUERY = re.compile(r"(^|_)season\d?$")
+_YEAR = re.compile(r"^\d{4}$")
+
+
+def _default_directory():
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "fangraphs")
+
+
+@contextlib.contextmanager
+def _file_lock(path):
+    """
+    Holds an exclusive lock on ``path``, which is shared by every process using the same cache directory.
+    """
+    with open(path, "a+") as file:
+        if fcntl is not None:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+        else:
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+            else:
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def canonical_filters(filters=None):
+    """
+    Normalizes a filter configuration, so equivalent configurations compare equal.
+
+    :param filters: Maps filter queries to options
+    :return: The filter configuration with lowercase queries and options, sorted by query
+    :rtype: dict
+    """
+    return {
+        str(q).lower(): str(o).lower()
+        for q, o in sorted((filters or {}).items(), key=lambda i: str(i[0]).lower())
+    }
+
+
+class ExportCache:
+    """
+    Stores exported leaderboards on local disk, with TTL expiry and size-based LRU eviction.
+    """
+    def __init__(self, directory=None, *, ttl=None, current_ttl=3600.0, max_size=512 * 2 ** 20):
+        """
+        :param directory: The directory of the cache; defaults to *$XDG_CACHE_HOME/fangraphs*
+        :param ttl: The number of seconds historical leaderboards are kept for; ``None`` keeps them until evicted
+        :param current_ttl: The number of seconds leaderboards which may include the current season are kept for
+        :param max_size: The maximum total size of the cached files, in bytes
+
+        .. py:attribute:: directory
+            The directory of the cache
+            :type: str
+        """
+        self.directory = os.path.abspath(directory or _default_directory())
+        self.ttl = ttl
+        self.current_ttl = current_ttl
+        self.max_size = max_size
+        os.makedirs(self.directory, exist_ok=True)
+        self.__index_path = os.path.join(self.directory, "index.json")
+        self.__lock_path = os.path.join(self.directory, "index.lock")
+
+    def _locked(self):
+        """
+        Serializes the updates of the index, which parallel processes (e.g. of a sharded run) share.
+        Each update reads, modifies and replaces the index while holding the lock.
+        """
+        return _file_lock(self.__lock_path)
+
+    def _load(self):
+        try:
+            with open(self.__index_path) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, index):
+        """
+        Writes the index to a temporary file, which atomically replaces the index.
+        """
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".json")
+        with os.fdopen(fd, "w") as file:
+            json.dump(index, file)
+        os.replace(tmp, self.__index_path)
+
+    @staticmethod
+    def key(scraper_cls, filters=None, ext=".csv"):
+        """
+        :param scraper_cls: A scraper class of :py:mod:`fangraphs.leaders.leaders`
+        :param filters: Maps filter queries to options
+        :param ext: The file extension of the export, which distinguishes its file format
+        :return: The cache key of the leaderboard
+        :rtype: str
+        """
+        entry = {"page": page_name(scraper_cls), "filters": canonical_filters(filters)}
+        if ext.lower() != ".csv":
+            entry["ext"] = ext.lower()
+        data = json.dumps(entry, sort_keys=True)
+        return hashlib.sha256(data.encode()).hexdigest()
+
+    def _ttl(self, filters):
+        """
+        :return: The TTL of a leaderboard, which is short if the leaderboard may include the current season.
+            Only the season queries set to a year select past seasons.
+        :rtype: float or None
+        """
+        filters = canonical_filters(filters)
+        year = str(datetime.date.today().year)
+        seasons = [o for q, o in filters.items() if _SEASON_QUERY.search(q)]
+        if not seasons or year in seasons or not all(_YEAR.match(o) for o in seasons):
+            return self.current_ttl
+        return self.ttl
+
+    def get(self, scraper_cls, filters=None, ext=".csv"):
+        """
+        Looks up a cached export.
+
+        :param scraper_cls: A scraper class of :py:mod:`fangraphs.leaders.leaders`
+        :param filters: Maps filter queries to options
+        :param ext: The file extension of the export
+        :return: The path of the cached file, or ``None`` if it is missing or expired
+        :rtype: str or None
+        """
+        key = self.key(scraper_cls, filters, ext)
+        with self._locked():
+            index = self._load()
+            entry = index.get(key)
+            if entry is None:
+                return None
+            path = os.path.join(self.directory, entry["file"])
+            now = time.time()
+            if (entry["expires"] is not None and now > entry["expires"]) or not os.path.exists(path):
+                self._discard(index, key)
+                self._save(index)
+                return None
+            entry["accessed"] = now
+            self._save(index)
+        return path
+
+    def put(self, scraper_cls, filters, source):
+        """
+        Stores a copy of an exported file.
+
+        :param scraper_cls: A scraper class of :py:mod:`fangraphs.leaders.leaders`
+        :param filters: Maps filter queries to options
+        :param source: The path of the exported file
+        :return: The path of the cached file, or ``None`` if the file was not kept,
+            because it expires immediately or is larger than :py:attr:`max_size` on its own
+        :rtype: str or None
+        """
+        ext = os.path.splitext(source)[1]
+        key = self.key(scraper_cls, filters, ext)
+        name = key + ext
+        path = os.path.join(self.directory, name)
+        ttl = self._ttl(filters)
+        with self._locked():
+            shutil.copyfile(source, path)
+            now = time.time()
+            index = self._load()
+            index[key] = {
+                "file": name, "size": os.path.getsize(path), "accessed": now,
+                "expires": None if ttl is None else now + ttl
+            }
+            self._evict(index, key)
+            self._save(index)
+        return path if key in index else None
+
+    def _discard(self, index, key):
+        entry = index.pop(key)
+        try:
+            os.remove(os.path.join(self.directory, entry["file"]))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self, index, keep=None):
+        """
+        Removes expired entries, then the least recently used entries until the cache fits :py:attr:`max_size`.
+
+        :param keep: The key of an entry which is only removed if it does not fit on its own (e.g. the entry just stored)
+        """
+        now = time.time()
+        for key in [k for k, e in index.items() if e["expires"] is not None and now > e["expires"]]:
+            self._discard(index, key)
+        total = sum(e["size"] for e in index.values())
+        for key in sorted(index, key=lambda k: (k == keep, index[k]["accessed"])):
+            if total <= self.max_size:
+                break
+            total -= index[key]["size"]
+            self._discard(index, key)
+
+    def evict(self):
+        """
+        Removes expired entries and enforces :py:attr:`max_size`.
+        """
+        with self._locked():
+            index = self._load()
+            self._evict(index)
+            self._save(index)
+
+    def clear(self):
+        """
+        Removes every cached export.
+        """
+        with self._locked():
+            index = self._load()
+            for key in list(index):
+                self._discard(index, key)
+            self._save(index)
+
+    def export(self, scraper_cls, filters=None, path="", *, fmt=None):
+        """
+        Exports a leaderboard, returning the cached copy without a browser or request when available.
+        Otherwise, the leaderboard is exported through :py:func:`fangraphs.leaders.api.export` and cached.
+        See :py:meth:`ScrapingUtilities.export_data` for ``path`` and ``fmt``.
+
+        :param scraper_cls: A scraper class of :py:mod:`fangraphs.leaders.leaders`
+        :param filters: Maps filter queries to options
+        :param path: The path to save the exported data to
+        :param fmt: The file format; if not specified, it is inferred from the extension of ``path``
+        :return: The path the data was saved to
+        :rtype: str
+        """
+        path = ScrapingUtilities._export_path(path, fmt)
+        cached = self.get(scraper_cls, filters, os.path.splitext(path)[1])
+        if cached is None:
+            api.export(scraper_cls, filters, path, fmt=fmt)
+            self.put(scraper_cls, filters, path)
+        else:
+            shutil.copyfile(cached, path)
+        return path
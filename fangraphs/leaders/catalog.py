@@ -0,0 +1,200 @@
+#! python3
+# FanGraphs/leaders/catalog.py
+
+"""
+Persistent catalogs of the options of every filter query, one per page.
+
+A catalog is filled once from a live page and refreshed in the background when it grows old.
+Option lookups and validation can then run without a browser.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+
+import fangraphs.exceptions
+from fangraphs.leaders import leaders
+from fangraphs.leaders import page_name
+from fangraphs.leaders import pool
+
+CATALOG_VERSION = 1
+
+
+def _default_directory():
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "fangraphs", "catalogs")
+
+
+class OptionCatalog:
+    """
+    Stores the options of the filter queries of each page on local disk.
+    """
+    def __init__(self, directory=None, *, max_age=7 * 24 * 3600.0):
+        """
+        :param directory: The directory of the catalogs; defaults to *$XDG_CACHE_HOME/fangraphs/catalogs*
+        :param max_age: The number of seconds after which a catalog is refreshed
+
+        .. py:attribute:: directory
+            The directory of the catalogs
+            :type: str
+        """
+        self.directory = os.path.abspath(directory or _default_directory())
+        self.max_age = max_age
+        os.makedirs(self.directory, exist_ok=True)
+        self.__catalogs = {}
+        self.__refreshing = {}
+        self.__lock = threading.Lock()
+
+    def _path(self, scraper_cls):
+        return os.path.join(self.directory, f"{page_name(scraper_cls)}.json")
+
+    def load(self, scraper_cls):
+        """
+        Reads the catalog of a page.
+        Catalogs written by another :py:data:`CATALOG_VERSION` are ignored.
+
+        :param scraper_cls: A scraper class of :py:mod:`fangraphs.leaders.leaders`
+        :return: The catalog, with the keys ``version``, ``updated`` and ``options``, or ``None`` if there is none
+        :rtype: dict or None
+        """
+        name = page_name(scraper_cls)
+        with self.__lock:
+            catalog = self.__catalogs.get(name)
+        if catalog is not None:
+            return catalog
+        try:
+            with open(self._path(scraper_cls)) as file:
+                catalog = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if catalog.get("version") != CATALOG_VERSION:
+            return None
+        with self.__lock:
+            self.__catalogs[name] = catalog
+        return catalog
+
+    def is_stale(self, scraper_cls):
+        """
+        :param scraper_cls: A scraper class of :py:mod:`fangraphs.leaders.leaders`
+        :return: ``True`` if the catalog of the page is missing or older than :py:attr:`max_age`
+        :rtype: bool
+        """
+        catalog = self.load(scraper_cls)
+        return catalog is None or time.time() - catalog["updated"] > self.max_age
+
+    def list_queries(self, scraper_cls):
+        """
+        :param scraper_cls: A scraper class of :py:mod:`fangraphs.leaders.leaders`
+        :return: The catalogued filter queries of the page
+        :rtype: list
+        """
+        catalog = self.load(scraper_cls)
+        return list(catalog["options"]) if catalog else []
+
+    def list_options(self, scraper_cls, query: str):
+        """
+        Lists the catalogued options of a filter query, without a browser.
+
+        :param scraper_cls: A scraper class of :py:mod:`fangraphs.leaders.leaders`
+        :param query: The filter query
+        :return: The options of the filter query, or ``None`` if the page has not been catalogued
+        :rtype: list or None
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        catalog = self.load(scraper_cls)
+        if catalog is None:
+            return None
+        try:
+            return list(catalog["options"][query.lower()])
+        except KeyError as err:
+            raise fangraphs.exceptions.InvalidFilterQuery(query) from err
+
+    def validate(self, scraper_cls, filters: dict):
+        """
+        Checks a filter configuration against the catalog of the page, without a browser.
+        Pages which have not been catalogued are not checked.
+
+        The options of some filter queries depend on others (the catalog holds the options of the page
+        as it is first loaded), so an option missing from the catalog is not rejected.
+        It is returned instead, and checked against the live page when it is configured.
+
+        :param scraper_cls: A scraper class of :py:mod:`fangraphs.leaders.leaders`
+        :param filters: Maps filter queries to options
+        :return: The filter queries whose option is not in the catalog, mapped to their option
+        :rtype: dict
+        :raises FanGraphs.exceptions.InvalidFilterQuery: A filter query is not used by the page
+        """
+        missing = {}
+        for query, option in filters.items():
+            options = self.list_options(scraper_cls, query)
+            if options is not None and str(option).lower() not in [o.lower() for o in options]:
+                missing[query] = option
+        return missing
+
+    def fill(self, scraper):
+        """
+        Catalogs the options of every filter query from a live scraper.
+
+        :param scraper: An entered scraper of :py:mod:`fangraphs.leaders.leaders`.
+            The options are read from its page, even if it has a catalog of its own.
+        """
+        attached, scraper.catalog = getattr(scraper, "catalog", None), None
+        try:
+            options = {q: scraper.list_options(q) for q in scraper.list_queries()}
+        finally:
+            scraper.catalog = attached
+        catalog = {"version": CATALOG_VERSION, "updated": time.time(), "options": options}
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".json")
+        with os.fdopen(fd, "w") as file:
+            json.dump(catalog, file)
+        os.replace(tmp, self._path(type(scraper)))
+        with self.__lock:
+            self.__catalogs[page_name(type(scraper))] = catalog
+
+    def refresh(self, scraper_cls):
+        """
+        Re-catalogs a page, using a browser.
+        Pages of asynchronous scrapers are catalogued by their synchronous counterparts.
+
+        :param scraper_cls: A scraper class of :py:mod:`fangraphs.leaders.leaders` (or its asynchronous counterpart)
+        """
+        with getattr(leaders, page_name(scraper_cls))() as scraper:
+            self.fill(scraper)
+
+    def refresh_in_background(self, scraper_cls):
+        """
+        Re-catalogs a page in a background thread, with a browser pool of its own.
+        A page is re-catalogued by one thread at a time.
+
+        :param scraper_cls: A scraper class of :py:mod:`fangraphs.leaders.leaders`
+        :return: The started thread, or the thread already re-cataloguing the page
+        :rtype: threading.Thread
+        """
+        def target():
+            try:
+                self.refresh(scraper_cls)
+            finally:
+                pool.get_pool().close()
+
+        name = page_name(scraper_cls)
+        with self.__lock:
+            thread = self.__refreshing.get(name)
+            if thread is None or not thread.is_alive():
+                thread = threading.Thread(target=target, daemon=True)
+                self.__refreshing[name] = thread
+                thread.start()
+        return thread
+
+    def ensure(self, scraper_cls):
+        """
+        Makes the catalog of a page available.
+        A missing catalog is filled immediately; a stale catalog is refreshed in the background.
+
+        :param scraper_cls: A scraper class of :py:mod:`fangraphs.leaders.leaders`
+        """
+        if self.load(scraper_cls) is None:
+            self.refresh(scraper_cls)
+        elif self.is_stale(scraper_cls):
+            self.refresh_in_background(scraper_cls)
@@ -0,0 +1,231 @@
+#! python3
+# FanGraphs/leaders/columns.py
+
+"""
+Registry of the stat columns of the FanGraphs leaderboards, and conversion of their text into typed columns.
+
+Each column has a *kind*, which decides how its cells are converted:
+
+- ``int``: counting stats, e.g. ``"53"``
+- ``float``: rate and value stats, e.g. ``"-0.4"``
+- ``percent``: e.g. ``"25.3 %"``, converted to the fraction ``0.253``
+- ``dollars``: e.g. ``"$12.4"``, converted to ``12.4``
+- ``innings``: innings written in thirds, e.g. ``"183.2"``, converted to ``183.667``
+- ``text``: names, teams and positions, which are never converted
+
+Columns are converted whole: string clean-up runs once over the joined column,
+and the cells are parsed by the built-in ``int`` and ``float`` in C.
+If ``numpy`` is installed, the arithmetic of percent and innings columns is vectorized as well.
+Columns missing from the registry are inferred, as an integer, decimal or text column.
+"""
+
+import array
+import math
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+KINDS = ("int", "float", "percent", "dollars", "innings", "text")
+
+_COMMON = {
+    "Name": "text", "Team": "text", "Season": "int", "Age": "int", "G": "int",
+    "playerid": "int", "xMLBAMID": "int", "WAR": "float", "RAR": "float", "Dollars": "dollars",
+    "AVG": "float", "BABIP": "float", "H": "int", "R": "int", "HR": "int", "BB": "int",
+    "IBB": "int", "SO": "int", "HBP": "int", "SB": "int", "CS": "int", "WP": "int",
+    "BB%": "percent", "K%": "percent", "LD%": "percent", "GB%": "percent", "FB%": "percent",
+    "IFFB%": "percent", "HR/FB": "percent", "IFH%": "percent", "BUH%": "percent",
+    "Pull%": "percent", "Cent%": "percent", "Oppo%": "percent",
+    "Soft%": "percent", "Med%": "percent", "Hard%": "percent",
+    "GB/FB": "float", "Def": "float"
+}
+
+#: Columns of the batting leaderboards
+BATTING = dict(_COMMON, **{
+    "PA": "int", "AB": "int", "1B": "int", "2B": "int", "3B": "int", "RBI": "int",
+    "SF": "int", "SH": "int", "GDP": "int", "IFH": "int", "BUH": "int",
+    "OBP": "float", "SLG": "float", "OPS": "float", "ISO": "float", "BB/K": "float",
+    "wOBA": "float", "xwOBA": "float", "wRAA": "float", "wRC": "float", "wRC+": "int",
+    "Spd": "float", "UBR": "float", "wGDP": "float", "wSB": "float", "BsR": "float", "Off": "float",
+    "Batting": "float", "Base Running": "float", "Positional": "float", "Fielding": "float",
+    "League": "float", "Replacement": "float"
+})
+
+#: Columns of the pitching leaderboards
+PITCHING = dict(_COMMON, **{
+    "W": "int", "L": "int", "GS": "int", "CG": "int", "ShO": "int", "SV": "int",
+    "HLD": "int", "BS": "int", "TBF": "int", "ER": "int", "BK": "int", "IP": "innings",
+    "ERA": "float", "xERA": "float", "FIP": "float", "xFIP": "float", "SIERA": "float", "tERA": "float",
+    "ERA-": "int", "FIP-": "int", "xFIP-": "int", "E-F": "float", "WHIP": "float",
+    "K/9": "float", "BB/9": "float", "HR/9": "float", "K/BB": "float",
+    "K-BB%": "percent", "LOB%": "percent", "Swing%": "percent", "Contact%": "percent",
+    "Zone%": "percent", "SwStr%": "percent", "CSW%": "percent"
+})
+
+#: Columns of the fielding leaderboards
+FIELDING = dict(_COMMON, **{
+    "Pos": "text", "Inn": "innings", "GS": "int", "PO": "int", "A": "int", "E": "int",
+    "FE": "int", "TE": "int", "DP": "int", "DPS": "int", "DPT": "int", "DPF": "int",
+    "Scp": "int", "PB": "int", "FP": "float", "rSB": "int", "rGDP": "int", "rARM": "int",
+    "rGFP": "int", "rPM": "int", "rSZ": "int", "rCERA": "int", "DRS": "int", "BIZ": "int",
+    "Plays": "int", "RZR": "float", "OOZ": "int", "ARM": "float", "DPR": "float",
+    "RngR": "float", "ErrR": "float", "UZR": "float", "UZR/150": "float", "CPP": "float", "RPP": "float"
+})
+
+SCHEMAS = {
+    "batting": BATTING,
+    "pitching": PITCHING,
+    "fielding": FIELDING
+}
+
+
+def schema(stat=None):
+    """
+    :param stat: The stat group of the leaderboard (``batting``, ``pitching`` or ``fielding``).
+        If not specified, the columns of every stat group are merged.
+    :return: Maps column headers to kinds
+    :rtype: dict
+    :raises KeyError: Unknown stat group ``stat``
+    """
+    if stat is not None:
+        return dict(SCHEMAS[stat.lower()])
+    merged = {}
+    for columns in SCHEMAS.values():
+        merged.update(columns)
+    return merged
+
+
+def group_schema(stat):
+    """
+    :param stat: The stat group of a leaderboard, e.g. the current option of its ``stat`` filter query
+    :return: The schema of ``stat``, or the merged schema if ``stat`` is not a stat group (see :py:func:`schema`)
+    :rtype: dict
+    """
+    if isinstance(stat, str) and stat.lower() in SCHEMAS:
+        return schema(stat)
+    return schema()
+
+
+def register(stat, columns: dict):
+    """
+    Adds columns to the schema of a stat group.
+
+    :param stat: The stat group, which is created if it does not exist
+    :param columns: Maps column headers to kinds
+    :raises ValueError: Unknown kind
+    """
+    for header, kind in columns.items():
+        if kind not in KINDS:
+            raise ValueError(f"Unknown column kind for {header}: {kind}")
+    SCHEMAS.setdefault(stat.lower(), {}).update(columns)
+
+
+def _number(text: str, percent=False):
+    """
+    Converts the text of a stat cell, which may be a percentage or a dollar value.
+    Empty cells are converted to NaN.
+
+    :param percent: If ``True``, the cell is a percentage, with or without its percent sign
+    :raises ValueError: The cell is not numeric
+    """
+    text = text.strip()
+    if not text:
+        return math.nan
+    if text.endswith("%"):
+        return float(text[:-1]) / 100
+    if "$" in text:
+        return float(text.replace("$", ""))
+    return float(text) / 100 if percent else float(text)
+
+
+def _innings(floats):
+    """
+    Converts innings written in thirds (e.g. ``123.1``) to decimal innings (e.g. ``123.333``).
+    """
+    if numpy is not None:
+        values = numpy.frombuffer(floats, dtype=numpy.float64)
+        whole = numpy.floor(values)
+        return array.array("d", (whole + numpy.round((values - whole) * 10) / 3).tobytes())
+    return array.array("d", (
+        v if math.isnan(v) else math.floor(v) + round((v - math.floor(v)) * 10) / 3
+        for v in floats
+    ))
+
+
+def _ints(cells):
+    """
+    :return: The column as integers, or ``None`` if a cell is not an integer
+    """
+    try:
+        return array.array("q", map(int, cells))
+    except (ValueError, OverflowError):
+        return None
+
+
+def _floats(text, percent=False):
+    """
+    Converts a column of text to decimals with whole-column string operations.
+    Percent and dollar signs are removed from the joined column at once, and the cells are parsed by ``float``.
+    Columns which mix percentages with other values, or hold cells ``float`` rejects, are converted cell by cell.
+
+    :param percent: If ``True``, the column is a percent column, and every cell is scaled to a fraction,
+        whether or not it has a percent sign
+    :return: The column as decimals, or ``None`` if a cell is not numeric
+    """
+    joined = "\n".join(text)
+    percents = joined.count("%")
+    cells = text
+    if percents or "$" in joined:
+        cells = joined.replace("%", "").replace("$", "").split("\n")
+    empty = cells.count("")
+    if percent or percents in (0, len(cells) - empty):
+        if empty:
+            cells = [c or "nan" for c in cells]
+        try:
+            floats = array.array("d", map(float, cells))
+        except ValueError:
+            pass
+        else:
+            if not (percent or percents):
+                return floats
+            if numpy is not None:
+                return array.array("d", (numpy.frombuffer(floats, dtype=numpy.float64) / 100).tobytes())
+            return array.array("d", (f / 100 for f in floats))
+    try:
+        return array.array("d", (_number(t, percent) for t in text))
+    except ValueError:
+        return None
+
+
+def convert(values, kind=None):
+    """
+    Converts a whole column of cells.
+
+    :param values: The cells of the column, as text or numbers
+    :param kind: The kind of the column (see :py:data:`KINDS`); if not specified, it is inferred.
+        Every text cell of a ``percent`` column is a percentage, with or without its percent sign;
+        numeric cells are taken as already converted.
+    :return: An ``array.array`` of typecode ``q`` or ``d`` for numeric columns; otherwise, a list of strings
+    :rtype: array.array or list
+    """
+    values = list(values)
+    if values and all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+        if kind in (None, "int") and all(isinstance(v, int) for v in values):
+            return array.array("q", values)
+        if kind != "text":
+            floats = array.array("d", values)
+            return _innings(floats) if kind == "innings" else floats
+    if None in values:
+        values = ["" if v is None else v for v in values]
+    text = list(map(str, values))
+    if kind == "text" or not "".join(text).strip():
+        return text
+    if kind in (None, "int"):
+        ints = _ints(text)
+        if ints is not None:
+            return ints
+    floats = _floats(text, kind == "percent")
+    if floats is None:
+        return text
+    return _innings(floats) if kind == "innings" else floats
@@ -6,47 +6,80 @@ Scrpaer for the webpages under the FanGaphs **Leaders** tab.
 """
 
 import csv
-import datetime
-import os
 
 import fangraphs.exceptions
+from fangraphs.leaders import ROW_CHANGED_JS
+from fangraphs.leaders import ROW_MARKER_JS
 from fangraphs.leaders import ScrapingUtilities
+from fangraphs.leaders import metrics
+from fangraphs.leaders import params
+from fangraphs.leaders import table
 from fangraphs import selectors
 from fangraphs.selectors import leaders_sel
 
 
+def _typed(value: str):
+    """
+    Converts the text of a table cell holding an integer or a decimal.
+
+    :param value: The text of the table cell
+    :return: The converted number, or ``value`` if it is not numeric
+    :rtype: int or float or str
+    """
+    text = value.strip()
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return value
+
+
 class GameSpan(ScrapingUtilities):
     """
     Scraper for the FanGraphs `60-Game Span Leaderboards`_ page.
 
     .. _60-Game Span Leaderboards: https://www.fangraphs.com/leaders/special/60-game-span
     """
-    __selections = {}
-    __dropdowns = {}
-    __waitfor = leaders_sel.GameSpan.waitfor
+    _waitfor = leaders_sel.GameSpan.waitfor
+    _page_size = leaders_sel.GameSpan.page_size
+    _table = leaders_sel.GameSpan.table
+    _page_size_param = "pageitems"
 
     address = "https://fangraphs.com/leaders/special/60-game-span"
 
-    def __init__(self):
-        super().__init__(self.address, waitfor=self.__waitfor)
+    def __init__(self, *, browser_pool=None, catalog=None):
+        """
+        :param browser_pool: The browser pool to borrow a page from
+        :param catalog: The option catalog used to validate options
+        """
+        super().__init__(self.address, waitfor=self._waitfor, browser_pool=browser_pool, catalog=catalog)
+        self._compile_selectors()
 
     def __enter__(self):
         self._browser_init()
         self.reset()
-        self.__compile_selectors()
         return self
 
     def __exit__(self, exc_type, value, traceback):
         self.quit()
 
-    def __compile_selectors(self):
+    def _compile_selectors(self):
+        """
+        Builds the filter query objects of this scraper.
+        Each scraper owns its objects, which read the page through its own :py:attr:`soup`.
+        """
+        self._selections = {}
         for cat, sel in leaders_sel.GameSpan.selections.items():
-            self.__selections.setdefault(
-                cat, selectors.Selections(self.soup, sel)
+            self._selections[cat] = selectors.Selections(
+                self, sel, options=self._catalog_options(cat)
             )
+        self._dropdowns = {}
         for cat, sel in leaders_sel.GameSpan.dropdowns.items():
-            self.__dropdowns.setdefault(
-                cat, selectors.Dropdowns(self.soup, sel, "> div > a")
+            self._dropdowns[cat] = selectors.Dropdowns(
+                self, sel, "> div > a", options=self._catalog_options(cat)
             )
 
     @classmethod
@@ -58,8 +91,8 @@ class GameSpan(ScrapingUtilities):
         :rtype: list
         """
         queries = []
-        queries.extend(list(cls.__selections))
-        queries.extend(list(cls.__dropdowns))
+        queries.extend(leaders_sel.GameSpan.selections)
+        queries.extend(leaders_sel.GameSpan.dropdowns)
         return queries
 
     def list_options(self, query: str):
@@ -72,10 +105,13 @@ class GameSpan(ScrapingUtilities):
         :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
         """
         query = query.lower()
-        if query in self.__selections:
-            options = self.__selections[query].list_options()
-        elif query in self.__dropdowns:
-            options = self.__dropdowns[query].list_options()
+        options = self._offline_options(query)
+        if options is not None:
+            return options
+        if query in self._selections:
+            options = self._selections[query].list_options()
+        elif query in self._dropdowns:
+            options = self._dropdowns[query].list_options()
         else:
             raise fangraphs.exceptions.InvalidFilterQuery(query)
         return options
@@ -90,14 +126,40 @@ class GameSpan(ScrapingUtilities):
         :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
         """
         query = query.lower()
-        if query in self.__selections:
-            option = self.__selections[query].current_option()
-        elif query in self.__dropdowns:
-            option = self.__dropdowns[query].current_option(opt_type=3)
+        if query in self._selections:
+            option = self._selections[query].current_option()
+        elif query in self._dropdowns:
+            option = self._dropdowns[query].current_option(opt_type=3)
         else:
             raise fangraphs.exceptions.InvalidFilterQuery(query)
         return option
 
+    def _state_specs(self):
+        """
+        :return: How each filter query's current option is read by :py:meth:`snapshot`, as in :py:meth:`current_option`
+        :rtype: list
+        """
+        specs = [(q, s.state_spec()) for q, s in self._selections.items()]
+        specs += [(q, s.state_spec(opt_type=3)) for q, s in self._dropdowns.items()]
+        return specs
+
+    def _configure(self, query: str, option: str):
+        """
+        Sets a filter query to an option on the page.
+        Unlike :py:meth:`configure`, the advertisement is not closed, the filters are not submitted
+        and the parser is not refreshed, so :py:meth:`configure_many` can batch them.
+
+        :param query: The filter query to be configured, in lower case
+        :param option: The option to set the filter query to
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        if query in self._selections:
+            self._selections[query].configure(self.page, option)
+        elif query in self._dropdowns:
+            self._dropdowns[query].configure(self.page, option)
+        else:
+            raise fangraphs.exceptions.InvalidFilterQuery(query)
+
     def configure(self, query: str, option: str):
         """
         Configures a filter query to a specified option.
@@ -108,15 +170,10 @@ class GameSpan(ScrapingUtilities):
         """
         query = query.lower()
         self._close_ad()
-        if query in self.__selections:
-            self.__selections[query].configure(self.page, option)
-        elif query in self.__dropdowns:
-            self.__dropdowns[query].configure(self.page, option)
-        else:
-            raise fangraphs.exceptions.InvalidFilterQuery(query)
+        self._configure(query, option)
         self._refresh_parser()
 
-    def export(self, path=""):
+    def export(self, path="", *, as_table=False, fmt=None):
         """
         Uses the **Export Data** button on the webpage to export the current leaderboard.
         The data will be exported as a CSV file and the file will be saved to *out/*.
@@ -124,8 +181,12 @@ class GameSpan(ScrapingUtilities):
         Otherwise, the file will be saved to the filepath *./out/%d.%m.%y %H.%M.%S.csv*
 
         :param path: The path to save the exported data to
+        :param as_table: If ``True``, the leaderboard is returned in memory instead of saved
+        :param fmt: The file format; if not specified, it is inferred from the extension of ``path``
+        :return: The exported leaderboard, if ``as_table`` is ``True``
+        :rtype: fangraphs.leaders.table.Table or None
         """
-        self.export_data(".data-export", path)
+        return self.export_data(".data-export", path, as_table=as_table, fmt=fmt)
 
 
 class International(ScrapingUtilities):
@@ -134,38 +195,47 @@ class International(ScrapingUtilities):
 
     .. _KBO Leaderboards: https://www.fangraphs.com/leaders/international
     """
-    __selections = {}
-    __dropdowns = {}
-    __switches = {}
-    __waitfor = leaders_sel.International.waitfor
+    _waitfor = leaders_sel.International.waitfor
+    _page_size = leaders_sel.International.page_size
+    _table = leaders_sel.International.table
+    _page_size_param = "pageitems"
 
     address = "https://www.fangraphs.com/leaders/international"
 
-    def __init__(self):
-        super().__init__(self.address, waitfor=self.__waitfor)
+    def __init__(self, *, browser_pool=None, catalog=None):
+        """
+        :param browser_pool: The browser pool to borrow a page from
+        :param catalog: The option catalog used to validate options
+        """
+        super().__init__(self.address, waitfor=self._waitfor, browser_pool=browser_pool, catalog=catalog)
+        self._compile_selectors()
 
     def __enter__(self):
         self._browser_init()
         self.reset()
-        self.__compile_selectors()
         return self
 
     def __exit__(self, exc_type, value, traceback):
         self.quit()
 
-    def __compile_selectors(self):
+    def _compile_selectors(self):
+        """
+        Builds the filter query objects of this scraper.
+        Each scraper owns its objects, which read the page through its own :py:attr:`soup`.
+        """
+        self._selections = {}
         for cat, sel in leaders_sel.International.selections.items():
-            self.__selections.setdefault(
-                cat, selectors.Selections(self.soup, sel)
+            self._selections[cat] = selectors.Selections(
+                self, sel, options=self._catalog_options(cat)
             )
+        self._dropdowns = {}
         for cat, sel in leaders_sel.International.dropdowns.items():
-            self.__dropdowns.setdefault(
-                cat, selectors.Dropdowns(self.soup, sel, "> div > a")
+            self._dropdowns[cat] = selectors.Dropdowns(
+                self, sel, "> div > a", options=self._catalog_options(cat)
             )
+        self._switches = {}
         for cat, sel in leaders_sel.International.switches.items():
-            self.__switches.setdefault(
-                cat, selectors.Switches(self.soup, sel)
-            )
+            self._switches[cat] = selectors.Switches(self, sel)
 
     @classmethod
     def list_queries(cls):
@@ -176,9 +246,9 @@ class International(ScrapingUtilities):
         :rtype: list
         """
         queries = []
-        queries.extend(cls.__selections)
-        queries.extend(cls.__dropdowns)
-        queries.extend(cls.__switches)
+        queries.extend(leaders_sel.International.selections)
+        queries.extend(leaders_sel.International.dropdowns)
+        queries.extend(leaders_sel.International.switches)
         return queries
 
     def list_options(self, query: str):
@@ -191,11 +261,14 @@ class International(ScrapingUtilities):
         :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
         """
         query = query.lower()
-        if query in self.__selections:
-            options = self.__selections[query].list_options()
-        elif query in self.__dropdowns:
-            options = self.__dropdowns[query].list_options()
-        elif query in self.__switches:
+        options = self._offline_options(query)
+        if options is not None:
+            return options
+        if query in self._selections:
+            options = self._selections[query].list_options()
+        elif query in self._dropdowns:
+            options = self._dropdowns[query].list_options()
+        elif query in self._switches:
             options = ["True", "False"]
         else:
             raise fangraphs.exceptions.InvalidFilterQuery(query)
@@ -208,42 +281,64 @@ class International(ScrapingUtilities):
         :return:
         """
         query = query.lower()
-        if query in self.__selections:
-            option = self.__selections[query].current_option()
-        elif query in self.__dropdowns:
-            option = self.__dropdowns[query].current_option(opt_type=3)
-        elif query in self.__switches:
+        if query in self._selections:
+            option = self._selections[query].current_option()
+        elif query in self._dropdowns:
+            option = self._dropdowns[query].current_option(opt_type=3)
+        elif query in self._switches:
             option = "True" if ",to" in self.page.url else "False"
         else:
             raise fangraphs.exceptions.InvalidFilterQuery(query)
         return option
 
-    def configure(self, query: str, option: str):
+    def _state_specs(self):
         """
-        Configures a filter query to a specified option.
+        :return: How each filter query's current option is read by :py:meth:`snapshot`, as in :py:meth:`current_option`
+        :rtype: list
+        """
+        specs = [(q, s.state_spec()) for q, s in self._selections.items()]
+        specs += [(q, s.state_spec(opt_type=3)) for q, s in self._dropdowns.items()]
+        specs += [(q, {"kind": "url", "contains": ",to"}) for q in self._switches]
+        return specs
 
-        :param query: The filter query to be configured
+    def _configure(self, query: str, option: str):
+        """
+        Sets a filter query to an option on the page.
+        Unlike :py:meth:`configure`, the advertisement is not closed, the filters are not submitted
+        and the parser is not refreshed, so :py:meth:`configure_many` can batch them.
+
+        :param query: The filter query to be configured, in lower case
         :param option: The option to set the filter query to
         :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
         """
-        query = query.lower()
-        self._close_ad()
-        if query in self.__selections:
-            self.__selections[query].configure(self.page, option)
-        elif query in self.__dropdowns:
-            self.__dropdowns[query].configure(self.page, option)
-        elif query in self.__switches:
+        if query in self._selections:
+            self._selections[query].configure(self.page, option)
+        elif query in self._dropdowns:
+            self._dropdowns[query].configure(self.page, option)
+        elif query in self._switches:
             options = [o.lower() for o in self.list_options(query)]
             if option not in options:
                 raise fangraphs.exceptions.InvalidFilterOption(option)
             if option == self.current_option(query):
                 return
-            self.page.click(self.__switches[query])
+            self.page.click(self._switches[query].selector)
         else:
             raise fangraphs.exceptions.InvalidFilterQuery(query)
+
+    def configure(self, query: str, option: str):
+        """
+        Configures a filter query to a specified option.
+
+        :param query: The filter query to be configured
+        :param option: The option to set the filter query to
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        query = query.lower()
+        self._close_ad()
+        self._configure(query, option)
         self._refresh_parser()
 
-    def export(self, path=""):
+    def export(self, path="", *, as_table=False, fmt=None):
         """
         Uses the **Export Data** button on the webpage to export the current leaderboard.
         The data will be exported as a CSV file and the file will be saved to *out/*.
@@ -251,8 +346,12 @@ class International(ScrapingUtilities):
         Otherwise, the file will be saved to the filepath *./out/%d.%m.%y %H.%M.%S.csv*
 
         :param path: The path to save the exported data to
+        :param as_table: If ``True``, the leaderboard is returned in memory instead of saved
+        :param fmt: The file format; if not specified, it is inferred from the extension of ``path``
+        :return: The exported leaderboard, if ``as_table`` is ``True``
+        :rtype: fangraphs.leaders.table.Table or None
         """
-        self.export_data(".data-export", path)
+        return self.export_data(".data-export", path, as_table=as_table, fmt=fmt)
 
 
 class MajorLeague(ScrapingUtilities):
@@ -264,39 +363,47 @@ class MajorLeague(ScrapingUtilities):
 
     .. _Major League Leaderboards: https://fangraphs.com/leaders.aspx
     """
-    __selections = {}
-    __dropdowns = {}
-    __switches = {}
-    __buttons = leaders_sel.MajorLeague.buttons
+    _buttons = leaders_sel.MajorLeague.buttons
+    _url_params = params.MajorLeague.params
+    _table = leaders_sel.MajorLeague.table
 
     address = "https://fangraphs.com/leaders.aspx"
 
-    def __init__(self):
-        super().__init__(self.address, waitfor="")
+    def __init__(self, *, browser_pool=None, catalog=None):
+        """
+        :param browser_pool: The browser pool to borrow a page from
+        :param catalog: The option catalog used to validate options
+        """
+        super().__init__(self.address, waitfor="", browser_pool=browser_pool, catalog=catalog)
+        self._compile_selectors()
 
     def __enter__(self):
         self._browser_init()
         self.reset()
-        self.__compile_selectors()
         return self
 
     def __exit__(self, exc_type, value, traceback):
         self.quit()
 
-    def __compile_selectors(self):
+    def _compile_selectors(self):
+        """
+        Builds the filter query objects of this scraper.
+        Each scraper owns its objects, which read the page through its own :py:attr:`soup`.
+        """
+        self._selections = {}
         for cat, sel in leaders_sel.MajorLeague.selections.items():
-            self.__selections.setdefault(
-                cat, selectors.Selections(self.soup, sel, "> div > ul > li")
+            self._selections[cat] = selectors.Selections(
+                self, sel, "> div > ul > li", options=self._catalog_options(cat)
             )
+        self._dropdowns = {}
         for cat, sel in leaders_sel.MajorLeague.dropdowns.items():
-            options = leaders_sel.MajorLeague.dropdown_options[cat]
-            self.__dropdowns.setdefault(
-                cat, selectors.Dropdowns(self.soup, sel, "> div > ul > li", options)
+            dd_options = leaders_sel.MajorLeague.dropdown_options[cat]
+            self._dropdowns[cat] = selectors.Dropdowns(
+                self, sel, "> div > ul > li", dd_options, options=self._catalog_options(cat)
             )
+        self._switches = {}
         for cat, sel in leaders_sel.MajorLeague.switches.items():
-            self.__switches.setdefault(
-                cat, selectors.Switches(self.soup, sel)
-            )
+            self._switches[cat] = selectors.Switches(self, sel)
 
     @classmethod
     def list_queries(cls):
@@ -307,9 +414,9 @@ class MajorLeague(ScrapingUtilities):
         :rtype: list
         """
         queries = []
-        queries.extend(list(cls.__selections))
-        queries.extend(list(cls.__dropdowns))
-        queries.extend(list(cls.__switches))
+        queries.extend(leaders_sel.MajorLeague.selections)
+        queries.extend(leaders_sel.MajorLeague.dropdowns)
+        queries.extend(leaders_sel.MajorLeague.switches)
         return queries
 
     def list_options(self, query: str):
@@ -322,12 +429,15 @@ class MajorLeague(ScrapingUtilities):
         :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
         """
         query = query.lower()
-        if query in self.__switches:
+        options = self._offline_options(query)
+        if options is not None:
+            return options
+        if query in self._switches:
             options = ["True", "False"]
-        elif query in self.__dropdowns:
-            options = self.__dropdowns[query].list_options()
-        elif query in self.__selections:
-            options = self.__selections[query].list_options()
+        elif query in self._dropdowns:
+            options = self._dropdowns[query].list_options()
+        elif query in self._selections:
+            options = self._selections[query].list_options()
         else:
             raise fangraphs.exceptions.InvalidFilterQuery(query)
         return options
@@ -342,44 +452,77 @@ class MajorLeague(ScrapingUtilities):
         :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
         """
         query = query.lower()
-        if query in self.__switches:
-            option = self.__switches[query].current_option(opt_type=1)
-        elif query in self.__dropdowns:
-            option = self.__dropdowns[query].current_option(opt_type=1)
-        elif query in self.__selections:
-            option = self.__selections[query].current_option()
+        if query in self._switches:
+            option = self._switches[query].current_option(opt_type=1)
+        elif query in self._dropdowns:
+            option = self._dropdowns[query].current_option(opt_type=1)
+        elif query in self._selections:
+            option = self._selections[query].current_option()
         else:
             raise fangraphs.exceptions.InvalidFilterQuery(query)
         return option
 
-    def configure(self, query: str, option: str, *, autoupdate=True):
+    def _state_specs(self):
         """
-        Configures a filter query to a specified option.
+        :return: How each filter query's current option is read by :py:meth:`snapshot`, as in :py:meth:`current_option`
+        :rtype: list
+        """
+        specs = [(q, s.state_spec(opt_type=1)) for q, s in self._switches.items()]
+        specs += [(q, s.state_spec(opt_type=1)) for q, s in self._dropdowns.items()]
+        specs += [(q, s.state_spec()) for q, s in self._selections.items()]
+        return specs
 
-        :param query: The filter query to be configured
+    def _configure(self, query: str, option: str):
+        """
+        Sets a filter query to an option on the page.
+        Unlike :py:meth:`configure`, the advertisement is not closed, the filters are not submitted
+        and the parser is not refreshed, so :py:meth:`configure_many` can batch them.
+
+        :param query: The filter query to be configured, in lower case
         :param option: The option to set the filter query to
-        :param autoupdate: If ``True``, any buttons attached to the filter query will be clicked
         :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
         """
-        query, option = query.lower(), str(option).lower()
-        self._close_ad()
-        if query in self.__selections:
-            self.__selections[query].configure(self.page, option)
-        elif query in self.__dropdowns:
-            self.__dropdowns[query].configure(self.page, option)
-        elif query in self.__switches:
+        option = str(option).lower()
+        if query in self._selections:
+            self._selections[query].configure(self.page, option)
+        elif query in self._dropdowns:
+            self._dropdowns[query].configure(self.page, option)
+        elif query in self._switches:
             options = [o.lower() for o in self.list_options(query)]
             if option.lower() not in options:
                 raise fangraphs.exceptions.InvalidFilterOption(option)
-            if option != self.current_option(query).title():
-                self.page.click(self.__switches[query])
+            if option != self.current_option(query).lower():
+                self.page.click(self._switches[query].selector)
         else:
             raise fangraphs.exceptions.InvalidFilterQuery(query)
-        if query in self.__buttons and autoupdate:
-            self.page.click(self.__buttons[query])
+
+    def configure(self, query: str, option: str, *, autoupdate=True):
+        """
+        Configures a filter query to a specified option.
+
+        :param query: The filter query to be configured
+        :param option: The option to set the filter query to
+        :param autoupdate: If ``True``, any buttons attached to the filter query will be clicked
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        query = query.lower()
+        self._close_ad()
+        self._configure(query, option)
+        if autoupdate:
+            self._submit([query])
         self._refresh_parser()
 
-    def export(self, path=""):
+    def _submit(self, queries):
+        """
+        Clicks the buttons attached to the configured filter queries, e.g. **Update** for ``season1`` and ``season2``.
+        A button shared by several filter queries is clicked once.
+
+        :param queries: The configured filter queries
+        """
+        for button in dict.fromkeys(self._buttons[q] for q in queries if q in self._buttons):
+            self.page.click(button)
+
+    def export(self, path="", *, as_table=False, fmt=None):
         """
         Uses the **Export Data** button on the webpage to export the current leaderboard.
         The data will be exported as a CSV file and the file will be saved to *out/*.
@@ -387,8 +530,12 @@ class MajorLeague(ScrapingUtilities):
         Otherwise, the file will be saved to the filepath *./out/%d.%m.%y %H.%M.%S.csv*
 
         :param path: The path to save the exported data to
+        :param as_table: If ``True``, the leaderboard is returned in memory instead of saved
+        :param fmt: The file format; if not specified, it is inferred from the extension of ``path``
+        :return: The exported leaderboard, if ``as_table`` is ``True``
+        :rtype: fangraphs.leaders.table.Table or None
         """
-        self.export_data("#LeaderBoard1_cmdCSV", path)
+        return self.export_data("#LeaderBoard1_cmdCSV", path, as_table=as_table, fmt=fmt)
 
 
 class SeasonStat(ScrapingUtilities):
@@ -397,32 +544,44 @@ class SeasonStat(ScrapingUtilities):
 
     .. _Season Stat Grid: https://fangraphs.com/leaders/season-stat-grid
     """
-    __selections = {}
-    __dropdowns = {}
-    __waitfor = leaders_sel.SeasonStat.waitfor
+    _waitfor = leaders_sel.SeasonStat.waitfor
+    _page_size = leaders_sel.SeasonStat.page_size
+    _table = leaders_sel.SeasonStat.table
+    _page_size_param = "pageitems"
+    _pagination = leaders_sel.SeasonStat.pagination
 
     address = "https://fangraphs.com/leaders/season-stat-grid"
 
-    def __init__(self):
-        super().__init__(self.address, waitfor=self.__waitfor)
+    def __init__(self, *, browser_pool=None, catalog=None):
+        """
+        :param browser_pool: The browser pool to borrow a page from
+        :param catalog: The option catalog used to validate options
+        """
+        super().__init__(self.address, waitfor=self._waitfor, browser_pool=browser_pool, catalog=catalog)
+        self._compile_selectors()
 
     def __enter__(self):
         self._browser_init()
         self.reset()
-        self.__compile_selectors()
         return self
 
     def __exit__(self, exc_type, value, traceback):
         self.quit()
 
-    def __compile_selectors(self):
+    def _compile_selectors(self):
+        """
+        Builds the filter query objects of this scraper.
+        Each scraper owns its objects, which read the page through its own :py:attr:`soup`.
+        """
+        self._selections = {}
         for cat, sel in leaders_sel.SeasonStat.selections.items():
-            self.__selections.setdefault(
-                cat, selectors.Selections(self.soup, sel)
+            self._selections[cat] = selectors.Selections(
+                self, sel, options=self._catalog_options(cat)
             )
+        self._dropdowns = {}
         for cat, sel in leaders_sel.SeasonStat.dropdowns.items():
-            self.__dropdowns.setdefault(
-                cat, selectors.Dropdowns(self.soup, sel, "> ul > li")
+            self._dropdowns[cat] = selectors.Dropdowns(
+                self, sel, "> ul > li", options=self._catalog_options(cat)
             )
 
     @classmethod
@@ -434,8 +593,8 @@ class SeasonStat(ScrapingUtilities):
         :type: list
         """
         queries = []
-        queries.extend(list(cls.__selections))
-        queries.extend(list(cls.__dropdowns))
+        queries.extend(leaders_sel.SeasonStat.selections)
+        queries.extend(leaders_sel.SeasonStat.dropdowns)
         return queries
 
     def list_options(self, query: str):
@@ -448,10 +607,13 @@ class SeasonStat(ScrapingUtilities):
         :raises FanGraphs.exceptions.InvalidFilterQuery: Argument ``query`` is invalid
         """
         query = query.lower()
-        if query in self.__selections:
-            options = self.__selections[query].list_options()
-        elif query in self.__dropdowns:
-            options = self.__dropdowns[query].list_options()
+        options = self._offline_options(query)
+        if options is not None:
+            return options
+        if query in self._selections:
+            options = self._selections[query].list_options()
+        elif query in self._dropdowns:
+            options = self._dropdowns[query].list_options()
         else:
             raise fangraphs.exceptions.InvalidFilterQuery(query)
         return options
@@ -466,14 +628,40 @@ class SeasonStat(ScrapingUtilities):
         :raises FanGraphs.exceptions.InvalidFilterQuery: Argument ``query`` is invalid
         """
         query = query.lower()
-        if query in self.__selections:
-            option = self.__selections[query].current_option()
-        elif query in self.__dropdowns:
-            option = self.__dropdowns[query].current_option(opt_type=2)
+        if query in self._selections:
+            option = self._selections[query].current_option()
+        elif query in self._dropdowns:
+            option = self._dropdowns[query].current_option(opt_type=2)
         else:
             raise fangraphs.exceptions.InvalidFilterQuery(query)
         return option
 
+    def _state_specs(self):
+        """
+        :return: How each filter query's current option is read by :py:meth:`snapshot`, as in :py:meth:`current_option`
+        :rtype: list
+        """
+        specs = [(q, s.state_spec()) for q, s in self._selections.items()]
+        specs += [(q, s.state_spec(opt_type=2)) for q, s in self._dropdowns.items()]
+        return specs
+
+    def _configure(self, query: str, option: str):
+        """
+        Sets a filter query to an option on the page.
+        Unlike :py:meth:`configure`, the advertisement is not closed, the filters are not submitted
+        and the parser is not refreshed, so :py:meth:`configure_many` can batch them.
+
+        :param query: The filter query to be configured, in lower case
+        :param option: The option to set the filter query to
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        if query in self._selections:
+            self._selections[query].configure(self.page, option)
+        elif query in self._dropdowns:
+            self._dropdowns[query].configure(self.page, option)
+        else:
+            raise fangraphs.exceptions.InvalidFilterQuery(query)
+
     def configure(self, query: str, option: str):
         """
         Configures a filter query to a specified option.
@@ -484,38 +672,191 @@ class SeasonStat(ScrapingUtilities):
         """
         query = query.lower()
         self._close_ad()
-        if query in self.__selections:
-            self.__selections[query].configure(self.page, option)
-        elif query in self.__dropdowns:
-            self.__dropdowns[query].configure(self.page, option)
-        else:
-            raise fangraphs.exceptions.InvalidFilterQuery(query)
+        self._configure(query, option)
         self._refresh_parser()
 
-    def _write_table_headers(self, writer: csv.writer):
+    def _table_rows(self, page=None, typed=True):
         """
-        Writes the headers of the data table to the CSV file.
+        :param page: The page to read; defaults to :py:attr:`page`
+        :param typed: If ``True``, numeric cells are converted (see :py:meth:`iter_rows`)
+        :return: The rows of the currently displayed page of the data table
+        :rtype: list
+        """
+        rows = self._extract_table(self._table, page)[1]
+        return [[_typed(c) for c in row] for row in rows] if typed else rows
 
-        :param writer: The ``csv.writer`` object
+    def _total_pages(self):
+        """
+        :return: The number of pages of the data table
+        :rtype: int
         """
-        elems = self.soup.select(".table-scroll thead tr th")
-        headers = [e.getText() for e in elems]
-        writer.writerow(headers)
+        elem = self._parse_fragment(self._pagination["total"])
+        return int(elem.text_content())
 
-    def _write_table_rows(self, writer: csv.writer):
+    @staticmethod
+    def _page_ranges(total_pages, partitions):
         """
-        Iterates through the rows of the current data table.
-        The data in each row is written to the CSV file.
+        Splits the pages of the data table into contiguous ranges, the longest first.
 
-        :param writer: The ``csv.writer`` object
+        :param total_pages: The number of pages of the data table
+        :param partitions: The number of ranges
+        :return: The ranges of zero-based page numbers; empty ranges are omitted
+        :rtype: list
+        """
+        partitions = max(1, min(partitions, total_pages))
+        size, extra = divmod(total_pages, partitions)
+        ranges, start = [], 0
+        for i in range(partitions):
+            stop = start + size + (i < extra)
+            ranges.append(range(start, stop))
+            start = stop
+        return ranges
+
+    def _partitions(self, partitions):
+        """
+        Limits the number of partitions of the data table (see :py:meth:`_iter_partitions`).
+        Each partition other than the first borrows a page, so there are at most as many partitions as pages
+        :py:attr:`browser_pool` has left to lend, plus :py:attr:`page`.
+        A partition jumps to its first page through the page number input of the page control;
+        without an input, the data table is read by :py:attr:`page` alone, rather than clicking through it.
+
+        :param partitions: The requested number of partitions
+        :return: The number of partitions to read the data table with
+        :rtype: int
+        """
+        if partitions <= 1 or self.page.query_selector(self._pagination["input"]) is None:
+            return 1
+        size = getattr(self.browser_pool, "size", None)
+        if size is not None:
+            partitions = min(partitions, size - self.browser_pool.borrowed + 1)
+        return max(1, partitions)
+
+    def _jump(self, page, page_num):
+        """
+        Displays page ``page_num`` (zero-based) of the data table of ``page``, which is on the first page,
+        by typing the page number into the input of the page control.
+        """
+        with metrics.stage("jump", self):
+            elem = page.query_selector(self._pagination["input"])
+            before = self._row_marker(page)
+            elem.fill(str(page_num + 1))
+            elem.press("Enter")
+            self._wait_rows(page, before)
+
+    def _row_marker(self, page):
+        """
+        :return: The marker of the page of the data table which ``page`` displays (see :py:data:`fangraphs.leaders.ROW_MARKER_JS`)
+        :rtype: str
         """
-        row_elems = self.soup.select(".table-scroll tbody tr")
-        for row in row_elems:
-            elems = row.select("td")
-            items = [e.getText() for e in elems]
-            writer.writerow(items)
+        return page.eval_on_selector(self._table, ROW_MARKER_JS)
 
-    def export(self, path=""):
+    def _wait_rows(self, page, before):
+        """
+        Waits until the data table of ``page`` has re-rendered, following a change of its displayed page.
+
+        :param before: The marker of the previously displayed page (see :py:meth:`_row_marker`)
+        """
+        with metrics.stage("wait", self):
+            page.wait_for_function(ROW_CHANGED_JS, arg=[self._table, before])
+
+    def _next_page(self, page):
+        """
+        Clicks **Next** in the page control of ``page``, and waits until the next page of the data table is displayed.
+        """
+        before = self._row_marker(page)
+        page.click(self._pagination["next"])
+        self._wait_rows(page, before)
+
+    def _clone_page(self):
+        """
+        Borrows another page from :py:attr:`browser_pool` and opens the current leaderboard on it.
+        The filter configuration is carried over through the URL of :py:attr:`page`.
+
+        :return: The borrowed page
+        :rtype: playwright.sync_api._generated.Page
+        """
+        page = self.browser_pool.acquire(self._allowed_resources, self._archive)
+        try:
+            page.goto(self.page.url, timeout=0)
+            page.wait_for_selector(self.waitfor)
+            self._maximize_page_size(page)
+        except Exception:
+            self.browser_pool.release(page)
+            raise
+        return page
+
+    def headers(self):
+        """
+        Lists the column headers of the data table.
+
+        :return: The column headers
+        :rtype: list
+        """
+        return self._extract_table(self._table, headers_only=True)[0]
+
+    def iter_rows(self, *, typed=True, partitions=1):
+        """
+        Iterates through the rows of the data table of the current leaderboard, page by page.
+        The page size of the data table is maximized first (see :py:meth:`_maximize_page_size`).
+        Only one page of the data table is held in memory at a time,
+        and each page is read by a single evaluation inside the browser (see :py:meth:`_extract_table`).
+        Note that the data table is left on its last page.
+
+        :param typed: If ``True``, cells holding integers or decimals are converted to ``int`` or ``float``.
+            Other cells (e.g. names and percentages) remain strings.
+        :param partitions: The number of pages of the browser which read the data table concurrently.
+            See :py:meth:`_iter_partitions`; the number is limited by :py:meth:`_partitions`.
+        :return: A generator yielding one list of cells per row
+        :rtype: collections.abc.Generator
+        """
+        self._close_ad()
+        self._maximize_page_size()
+        partitions = self._partitions(partitions)
+        if partitions > 1:
+            yield from self._iter_partitions(typed, partitions)
+            return
+        total_pages = self._total_pages()
+        for page_num in range(total_pages):
+            yield from self._table_rows(typed=typed)
+            if page_num < total_pages - 1:
+                self._next_page(self.page)
+
+    def _iter_partitions(self, typed, partitions):
+        """
+        Iterates through the rows of the data table with ``partitions`` browser pages.
+        The pages of the data table are split into contiguous ranges (see :py:meth:`_page_ranges`).
+        :py:attr:`page` reads the first range, and a page borrowed from :py:attr:`browser_pool` reads each other range.
+        The clicks are interleaved, so every page renders its next page of the data table while the others are read;
+        each page is only read once its data table has re-rendered (see :py:meth:`_wait_rows`).
+        The rows of the first range are yielded as they are read; the other ranges are buffered and yielded in order.
+        """
+        ranges = self._page_ranges(self._total_pages(), partitions)
+        pages = [self.page]
+        try:
+            for page_range in ranges[1:]:
+                page = self._clone_page()
+                pages.append(page)
+                self._jump(page, page_range.start)
+            buffers = [[] for _ in ranges]
+            for step in range(len(ranges[0])):
+                active = [i for i, page_range in enumerate(ranges) if step < len(page_range)]
+                for i in active:
+                    buffers[i].extend(self._table_rows(pages[i], typed))
+                turning = [i for i in active if step < len(ranges[i]) - 1]
+                markers = {i: self._row_marker(pages[i]) for i in turning}
+                for i in turning:
+                    pages[i].click(self._pagination["next"])
+                for i in turning:
+                    self._wait_rows(pages[i], markers[i])
+                yield from buffers[0]
+                buffers[0].clear()
+            for buffer in buffers[1:]:
+                yield from buffer
+        finally:
+            for page in pages[1:]:
+                self.browser_pool.release(page)
+
+    def export(self, path="", *, as_table=False, fmt=None, partitions=1):
         """
         Scrapes and saves the data from the table of the current leaderboards.
         The data will be exported as a CSV file and the file will be saved to *out/*.
@@ -523,31 +864,32 @@ class SeasonStat(ScrapingUtilities):
         Otherwise, the file will be saved to the filepath *out/%d.%m.%y %H.%M.%S.csv*.
 
         *Note: This is a 'manual' export of the data.
-        In other words, the data is scraped from the table.
+        In other words, the data is scraped from the table, through :py:meth:`iter_rows`.
         This is unlike other forms of export where a button is clicked.
         Thus, there will be no record of a download when the data is exported.*
 
         :param path: The path to save the exported file to
-        """
-        self._close_ad()
-        if not path or os.path.splitext(path)[1] != ".csv":
-            path = "out/{}.csv".format(
-                datetime.datetime.now().strftime("%d.%m.%y %H.%M.%S")
+        :param as_table: If ``True``, the leaderboard is returned in memory instead of saved
+        :param fmt: The file format; if not specified, it is inferred from the extension of ``path``
+        :param partitions: The number of pages of the browser which read the data table concurrently
+            (see :py:meth:`iter_rows`)
+        :return: The exported leaderboard, if ``as_table`` is ``True``
+        :rtype: fangraphs.leaders.table.Table or None
+        """
+        path = None if as_table else self._export_path(path, fmt)
+        if path is None or table.file_format(path, fmt) != "csv":
+            data = table.Table.from_rows(
+                self.headers(), self.iter_rows(typed=False, partitions=partitions), self._schema()
             )
-        total_pages = int(
-            self.soup.select(
-                ".table-page-control:nth-last-child(1) > .table-control-total"
-            )[0].getText()
-        )
+            if path is None:
+                return data
+            data.write(path, fmt)
+            return None
         with open(path, "w", newline="") as file:
             writer = csv.writer(file)
-            self._write_table_headers(writer)
-            for _ in range(0, total_pages):
-                self._write_table_rows(writer)
-                self.page.click(
-                    ".table-page-control:nth-last-child(1) > .next"
-                )
-                self._refresh_parser()
+            writer.writerow(self.headers())
+            writer.writerows(self.iter_rows(typed=False, partitions=partitions))
+        return None
 
 
 class Splits(ScrapingUtilities):
@@ -556,22 +898,25 @@ class Splits(ScrapingUtilities):
 
     .. _Splits Leaderboards: https://fangraphs.com/leaders/splits-leaderboards
     """
-    __selections = {}
-    __dropdowns = {}
-    __splits = {}
-    __quick_splits = leaders_sel.Splits.quick_splits
-    __switches = {}
-    __waitfor = leaders_sel.Splits.waitfor
+    _quick_splits = leaders_sel.Splits.quick_splits
+    _waitfor = leaders_sel.Splits.waitfor
+    _page_size = leaders_sel.Splits.page_size
+    _table = leaders_sel.Splits.table
+    _page_size_param = "pageitems"
 
     address = "https://fangraphs.com/leaders/splits-leaderboards"
 
-    def __init__(self):
-        super().__init__(self.address, waitfor=self.__waitfor)
+    def __init__(self, *, browser_pool=None, catalog=None):
+        """
+        :param browser_pool: The browser pool to borrow a page from
+        :param catalog: The option catalog used to validate options
+        """
+        super().__init__(self.address, waitfor=self._waitfor, browser_pool=browser_pool, catalog=catalog)
+        self._compile_selectors()
 
     def __enter__(self):
         self._browser_init()
         self.reset()
-        self.__compile_selectors()
 
         self.set_filter_group("Show All")
         self.configure("auto_pt", "False", autoupdate=True)
@@ -580,23 +925,29 @@ class Splits(ScrapingUtilities):
     def __exit__(self, exc_type, value, traceback):
         self.quit()
 
-    def __compile_selectors(self):
+    def _compile_selectors(self):
+        """
+        Builds the filter query objects of this scraper.
+        Each scraper owns its objects, which read the page through its own :py:attr:`soup`.
+        """
+        self._selections = {}
         for cat, sel in leaders_sel.Splits.selections.items():
-            self.__selections.setdefault(
-                cat, selectors.Selections(self.soup, sel)
+            self._selections[cat] = selectors.Selections(
+                self, sel, options=self._catalog_options(cat)
             )
+        self._dropdowns = {}
         for cat, sel in leaders_sel.Splits.dropdowns.items():
-            self.__dropdowns.setdefault(
-                cat, selectors.Dropdowns(self.soup, sel, "> ul > li")
+            self._dropdowns[cat] = selectors.Dropdowns(
+                self, sel, "> ul > li", options=self._catalog_options(cat)
             )
+        self._splits = {}
         for cat, sel in leaders_sel.Splits.splits.items():
-            self.__splits.setdefault(
-                cat, selectors.Dropdowns(self.soup, sel, "> ul > li")
+            self._splits[cat] = selectors.Dropdowns(
+                self, sel, "> ul > li", options=self._catalog_options(cat)
             )
+        self._switches = {}
         for cat, sel in leaders_sel.Splits.switches.items():
-            self.__switches.setdefault(
-                cat, selectors.Switches(self.soup, sel)
-            )
+            self._switches[cat] = selectors.Switches(self, sel)
 
     @classmethod
     def list_queries(cls):
@@ -607,10 +958,10 @@ class Splits(ScrapingUtilities):
         :rtype: list
         """
         queries = []
-        queries.extend(list(cls.__selections))
-        queries.extend(list(cls.__dropdowns))
-        queries.extend(list(cls.__splits))
-        queries.extend(list(cls.__switches))
+        queries.extend(leaders_sel.Splits.selections)
+        queries.extend(leaders_sel.Splits.dropdowns)
+        queries.extend(leaders_sel.Splits.splits)
+        queries.extend(leaders_sel.Splits.switches)
         return queries
 
     def list_options(self, query: str):
@@ -623,13 +974,16 @@ class Splits(ScrapingUtilities):
         :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
         """
         query = query.lower()
-        if query in self.__selections:
-            options = self.__selections[query].list_options()
-        elif query in self.__dropdowns:
-            options = self.__dropdowns[query].list_options()
-        elif query in self.__splits:
-            options = self.__splits[query].list_options()
-        elif query in self.__switches:
+        options = self._offline_options(query)
+        if options is not None:
+            return options
+        if query in self._selections:
+            options = self._selections[query].list_options()
+        elif query in self._dropdowns:
+            options = self._dropdowns[query].list_options()
+        elif query in self._splits:
+            options = self._splits[query].list_options()
+        elif query in self._switches:
             options = ["True", "False"]
         else:
             raise fangraphs.exceptions.InvalidFilterQuery(query)
@@ -653,47 +1007,78 @@ class Splits(ScrapingUtilities):
         :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
         """
         query = query.lower()
-        if query in self.__selections:
-            option = self.__selections[query].current_option()
-        elif query in self.__dropdowns:
-            option = self.__dropdowns[query].current_option(opt_type=2, multiple=True)
-        elif query in self.__splits:
-            option = self.__splits[query].current_option(opt_type=2, multiple=True)
-        elif query in self.__switches:
-            option = self.__switches[query].current_option(opt_type=2)
+        if query in self._selections:
+            option = self._selections[query].current_option()
+        elif query in self._dropdowns:
+            option = self._dropdowns[query].current_option(opt_type=2, multiple=True)
+        elif query in self._splits:
+            option = self._splits[query].current_option(opt_type=2, multiple=True)
+        elif query in self._switches:
+            option = self._switches[query].current_option(opt_type=2)
         else:
             raise fangraphs.exceptions.InvalidFilterQuery(query)
         return option
 
-    def configure(self, query: str, option: str, *, autoupdate=False):
+    def _state_specs(self):
         """
-        Configures a filter query to a specified option.
+        :return: How each filter query's current option is read by :py:meth:`snapshot`, as in :py:meth:`current_option`
+        :rtype: list
+        """
+        specs = [(q, s.state_spec()) for q, s in self._selections.items()]
+        specs += [(q, s.state_spec(opt_type=2, multiple=True)) for q, s in self._dropdowns.items()]
+        specs += [(q, s.state_spec(opt_type=2, multiple=True)) for q, s in self._splits.items()]
+        specs += [(q, s.state_spec(opt_type=2)) for q, s in self._switches.items()]
+        return specs
 
-        :param query: The filter query to be configured
+    def _configure(self, query: str, option: str):
+        """
+        Sets a filter query to an option on the page.
+        Unlike :py:meth:`configure`, the advertisement is not closed, the filters are not submitted
+        and the parser is not refreshed, so :py:meth:`configure_many` can batch them.
+
+        :param query: The filter query to be configured, in lower case
         :param option: The option to set the filter query to
-        :param autoupdate: If ``True``, :py:meth:`update` will be called following configuration
         :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
         """
-        self._close_ad()
-        query = query.lower()
-        if query in self.__selections:
-            self.__selections[query].configure(self.page, option)
-        elif query in self.__dropdowns:
-            self.__dropdowns[query].configure(self.page, option)
-        elif query in self.__splits:
-            self.__splits[query].configure(self.page, option)
-        elif query in self.__switches:
+        if query in self._selections:
+            self._selections[query].configure(self.page, option)
+        elif query in self._dropdowns:
+            self._dropdowns[query].configure(self.page, option)
+        elif query in self._splits:
+            self._splits[query].configure(self.page, option)
+        elif query in self._switches:
             options = [o.lower() for o in self.list_options(query)]
             if option.lower() not in options:
                 raise fangraphs.exceptions.InvalidFilterOption(option)
             if option != self.current_option(query)[0].title():
-                self.page.click(self.__switches[query])
+                self.page.click(self._switches[query].selector)
         else:
             raise fangraphs.exceptions.InvalidFilterQuery(query)
+
+    def configure(self, query: str, option: str, *, autoupdate=False):
+        """
+        Configures a filter query to a specified option.
+
+        :param query: The filter query to be configured
+        :param option: The option to set the filter query to
+        :param autoupdate: If ``True``, :py:meth:`update` will be called following configuration
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        self._close_ad()
+        query = query.lower()
+        self._configure(query, option)
         if autoupdate:
-            self.update()
+            self._submit([query])
         self._refresh_parser()
 
+    def _submit(self, queries):
+        """
+        Submits the configured filter queries through :py:meth:`update`.
+
+        :param queries: The configured filter queries
+        """
+        self.update()
+
     def update(self):
         """
         Clicks the **Update** button of the page.
@@ -705,7 +1090,8 @@ class Splits(ScrapingUtilities):
         if elem is None:
             raise fangraphs.exceptions.FilterUpdateIncapability()
         self._close_ad()
-        elem.click()
+        with metrics.stage("update", self):
+            elem.click()
         self._refresh_parser()
 
     def list_filter_groups(self):
@@ -715,7 +1101,7 @@ class Splits(ScrapingUtilities):
         :return: Names of the groups of filter queries
         :rtype: list
         """
-        elems = self.soup.select(".fgBin.splits-bin-controller div")
+        elems = selectors.compile_selector(leaders_sel.Splits.filter_groups).select(self.soup)
         groups = [e.getText() for e in elems]
         return groups
 
@@ -725,8 +1111,8 @@ class Splits(ScrapingUtilities):
 
         :param group: The name of the group of filters
         """
-        selector = ".fgBin.splits-bin-controller div"
-        elems = self.soup.select(selector)
+        selector = leaders_sel.Splits.filter_groups
+        elems = selectors.compile_selector(selector).select(self.soup)
         options = [e.getText() for e in elems]
         try:
             index = options.index(group)
@@ -766,7 +1152,7 @@ class Splits(ScrapingUtilities):
         :return: All available quick splits
         :rtype: list
         """
-        return list(cls.__quick_splits)
+        return leaders_sel.Splits.quick_splits
 
     def set_to_quick_split(self, quick_split: str, autoupdate=True):
         """
@@ -780,15 +1166,15 @@ class Splits(ScrapingUtilities):
         """
         quick_split = quick_split.lower()
         try:
-            selector = self.__quick_splits[quick_split]
-        except ValueError as err:
+            selector = self._quick_splits[quick_split]
+        except KeyError as err:
             raise fangraphs.exceptions.InvalidQuickSplit(quick_split) from err
         self._close_ad()
         self.page.click(selector)
         if autoupdate:
             self.update()
 
-    def export(self, path=""):
+    def export(self, path="", *, as_table=False, fmt=None):
         """
         Uses the **Export Data** button on the webpage to export the current leaderboard.
         The data will be exported as a CSV file and the file will be saved to *out/*.
@@ -796,8 +1182,12 @@ class Splits(ScrapingUtilities):
         Otherwise, the file will be saved to the filepath *./out/%d.%m.%y %H.%M.%S.csv*
 
         :param path: The path to save the exported data to
+        :param as_table: If ``True``, the leaderboard is returned in memory instead of saved
+        :param fmt: The file format; if not specified, it is inferred from the extension of ``path``
+        :return: The exported leaderboard, if ``as_table`` is ``True``
+        :rtype: fangraphs.leaders.table.Table or None
         """
-        self.export_data(".data-export", path)
+        return self.export_data(".data-export", path, as_table=as_table, fmt=fmt)
 
 
 class WAR(ScrapingUtilities):
@@ -806,28 +1196,38 @@ class WAR(ScrapingUtilities):
 
     .. _Combined WAR Leaderboards: https://www.fangraphs.com/warleaders.aspx
     """
-    __dropdowns = {}
-    __waitfor = leaders_sel.WAR.waitfor
+    _waitfor = leaders_sel.WAR.waitfor
+    _table = leaders_sel.WAR.table
+    _url_params = params.WAR.params
 
     address = "https://fangraphs.com/warleaders.aspx"
 
-    def __init__(self):
-        super().__init__(self.address, waitfor=self.__waitfor)
+    def __init__(self, *, browser_pool=None, catalog=None):
+        """
+        :param browser_pool: The browser pool to borrow a page from
+        :param catalog: The option catalog used to validate options
+        """
+        super().__init__(self.address, waitfor=self._waitfor, browser_pool=browser_pool, catalog=catalog)
+        self._compile_selectors()
 
     def __enter__(self):
         self._browser_init()
         self.reset()
-        self.__compile_selectors()
         return self
 
     def __exit__(self, exc_type, value, traceback):
         self.quit()
 
-    def __compile_selectors(self):
+    def _compile_selectors(self):
+        """
+        Builds the filter query objects of this scraper.
+        Each scraper owns its objects, which read the page through its own :py:attr:`soup`.
+        """
+        self._dropdowns = {}
         for cat, sel in leaders_sel.WAR.dropdowns.items():
-            options = leaders_sel.WAR.dropdown_options[cat]
-            self.__dropdowns.setdefault(
-                cat, selectors.Dropdowns(self.soup, sel, "> div > ul > li", options)
+            dd_options = leaders_sel.WAR.dropdown_options[cat]
+            self._dropdowns[cat] = selectors.Dropdowns(
+                self, sel, "> div > ul > li", dd_options, options=self._catalog_options(cat)
             )
 
     @classmethod
@@ -839,7 +1239,7 @@ class WAR(ScrapingUtilities):
         :rtype: list
         """
         queries = []
-        queries.extend(list(cls.__dropdowns))
+        queries.extend(leaders_sel.WAR.dropdowns)
         return queries
 
     def list_options(self, query: str):
@@ -852,8 +1252,11 @@ class WAR(ScrapingUtilities):
         :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
         """
         query = query.lower()
-        if query in self.__dropdowns:
-            options = self.__dropdowns[query].list_options()
+        options = self._offline_options(query)
+        if options is not None:
+            return options
+        if query in self._dropdowns:
+            options = self._dropdowns[query].list_options()
         else:
             raise fangraphs.exceptions.InvalidFilterQuery(query)
         return options
@@ -868,12 +1271,35 @@ class WAR(ScrapingUtilities):
         :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
         """
         query = query.lower()
-        if query in self.__dropdowns:
-            option = self.__dropdowns[query].current_option(opt_type=1)
+        if query in self._dropdowns:
+            option = self._dropdowns[query].current_option(opt_type=1)
         else:
             raise fangraphs.exceptions.InvalidFilterQuery(query)
         return option
 
+    def _state_specs(self):
+        """
+        :return: How each filter query's current option is read by :py:meth:`snapshot`, as in :py:meth:`current_option`
+        :rtype: list
+        """
+        specs = [(q, s.state_spec(opt_type=1)) for q, s in self._dropdowns.items()]
+        return specs
+
+    def _configure(self, query: str, option: str):
+        """
+        Sets a filter query to an option on the page.
+        Unlike :py:meth:`configure`, the advertisement is not closed, the filters are not submitted
+        and the parser is not refreshed, so :py:meth:`configure_many` can batch them.
+
+        :param query: The filter query to be configured, in lower case
+        :param option: The option to set the filter query to
+        :raises FanGraphs.exceptions.InvalidFilterQuery: Invalid argument ``query``
+        """
+        if query in self._dropdowns:
+            self._dropdowns[query].configure(self.page, option)
+        else:
+            raise fangraphs.exceptions.InvalidFilterQuery(query)
+
     def configure(self, query: str, option: str):
         """
         Configures a filter query to a specified option.
@@ -884,13 +1310,10 @@ class WAR(ScrapingUtilities):
         """
         query = query.lower()
         self._close_ad()
-        if query in self.__dropdowns:
-            self.__dropdowns[query].configure(self.page, option)
-        else:
-            raise fangraphs.exceptions.InvalidFilterQuery(query)
+        self._configure(query, option)
         self._refresh_parser()
 
-    def export(self, path=""):
+    def export(self, path="", *, as_table=False, fmt=None):
         """
         Uses the **Export Data** button on the webpage to export the current leaderboard.
         The data will be exported as a CSV file and the file will be saved to *out/*.
@@ -898,5 +1321,9 @@ class WAR(ScrapingUtilities):
         Otherwise, the file will be saved to the filepath *./out/%d.%m.%y %H.%M.%S.csv*
 
         :param path: The path to save the exported data to
+        :param as_table: If ``True``, the leaderboard is returned in memory instead of saved
+        :param fmt: The file format; if not specified, it is inferred from the extension of ``path``
+        :return: The exported leaderboard, if ``as_table`` is ``True``
+        :rtype: fangraphs.leaders.table.Table or None
         """
-        self.export_data("#WARBoard1_cmdCSV", path)
+        return self.export_data("#WARBoard1_cmdCSV", path, as_table=as_table, fmt=fmt)
@@ -0,0 +1,184 @@
+#! python3
+# FanGraphs/leaders/metrics.py
+
+"""
+Instrumentation of the scrapers.
+
+The scrapers report an :py:data:`Event` for each stage of their work
+(``goto``, ``wait``, ``content``, ``parse``, ``fragment``, ``close_ad``, ``configure``, ``download``, ``write``, ...),
+the bytes transferred, the size of the parsed markup and the number of retries.
+Events are passed to every installed hook; three hooks are provided:
+
+- any callable, which is called with each event
+- :py:class:`LoggingHook`, which logs each event
+- :py:class:`PrometheusHook`, which aggregates the events and renders them in the Prometheus text exposition format
+
+While no hook is installed, :py:func:`stage` returns a shared no-op context manager and :py:func:`emit` returns at once,
+so the instrumentation costs a function call per stage.
+"""
+
+import collections
+import contextlib
+import logging
+import threading
+import time
+
+import fangraphs.leaders
+
+#: An instrumented measurement.
+#: ``kind`` is one of :py:data:`KINDS`; ``page`` is the name of the scraped page (e.g. ``"MajorLeague"``)
+Event = collections.namedtuple("Event", ("kind", "stage", "page", "value"))
+
+#: The kinds of events: stage durations (in seconds), transferred bytes, parsed characters and retries
+KINDS = ("seconds", "bytes", "characters", "retries")
+
+_hooks = []
+_null = contextlib.nullcontext()
+
+
+def add_hook(hook):
+    """
+    Installs a hook, which is called with every subsequent :py:data:`Event`.
+
+    :param hook: A callable of one argument
+    :return: ``hook``
+    """
+    _hooks.append(hook)
+    return hook
+
+
+def remove_hook(hook):
+    """
+    Uninstalls a hook.
+
+    :param hook: The hook passed to :py:func:`add_hook`
+    :raises ValueError: The hook is not installed
+    """
+    _hooks.remove(hook)
+
+
+def enabled():
+    """
+    :return: ``True`` if at least one hook is installed
+    :rtype: bool
+    """
+    return bool(_hooks)
+
+
+def emit(kind, stage, scraper, value):
+    """
+    Passes an event to every installed hook.
+
+    :param kind: One of :py:data:`KINDS`
+    :param stage: The stage of the scraper the measurement belongs to
+    :param scraper: The scraper, its class or the name of its page
+    :param value: The measurement
+    """
+    if not _hooks:
+        return
+    if not isinstance(scraper, (str, type)):
+        scraper = type(scraper)
+    event = Event(kind, stage, fangraphs.leaders.page_name(scraper), value)
+    for hook in list(_hooks):
+        hook(event)
+
+
+class _Timer:
+    __slots__ = ("stage", "scraper", "start")
+
+    def __init__(self, stage, scraper):
+        self.stage = stage
+        self.scraper = scraper
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, value, traceback):
+        emit("seconds", self.stage, self.scraper, time.perf_counter() - self.start)
+
+
+def stage(name, scraper):
+    """
+    Times a stage of a scraper's work, as a ``with`` block (in synchronous or asynchronous code).
+    The duration is emitted even if the block raises.
+
+    :param name: The name of the stage, e.g. ``"goto"``
+    :param scraper: The scraper, its class or the name of its page
+    :return: A context manager
+    """
+    if not _hooks:
+        return _null
+    return _Timer(name, scraper)
+
+
+class LoggingHook:
+    """
+    Logs every event.
+    """
+    def __init__(self, logger="fangraphs.metrics", level=logging.DEBUG):
+        """
+        :param logger: The logger, or its name
+        :param level: The level of the log records
+        """
+        self.logger = logging.getLogger(logger) if isinstance(logger, str) else logger
+        self.level = level
+
+    def __call__(self, event):
+        if event.kind == "seconds":
+            value = f"{event.value * 1000:.1f} ms"
+        else:
+            value = f"{event.value} {event.kind}"
+        self.logger.log(self.level, "%s %s: %s", event.page, event.stage, value)
+
+
+class PrometheusHook:
+    """
+    Aggregates events per page and stage, for exposition in the Prometheus text format.
+
+    - Stage durations are exposed as the summary ``fangraphs_stage_seconds``
+    - Transferred bytes are exposed as the counter ``fangraphs_transferred_bytes_total``
+    - Parsed characters are exposed as the summary ``fangraphs_parsed_characters``
+    - Retries are exposed as the counter ``fangraphs_retries_total``
+    """
+    _METRICS = {
+        "seconds": ("fangraphs_stage_seconds", "summary", "Duration of the stages of the scrapers"),
+        "bytes": ("fangraphs_transferred_bytes_total", "counter", "Bytes transferred by the scrapers"),
+        "characters": ("fangraphs_parsed_characters", "summary", "Characters of markup parsed by the scrapers"),
+        "retries": ("fangraphs_retries_total", "counter", "Retried scraper jobs")
+    }
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sums = collections.defaultdict(float)
+        self._counts = collections.defaultdict(int)
+
+    def __call__(self, event):
+        key = (event.kind, event.page, event.stage)
+        with self._lock:
+            self._sums[key] += event.value
+            self._counts[key] += 1
+
+    def exposition(self):
+        """
+        :return: The aggregated metrics, in the Prometheus text exposition format
+        :rtype: str
+        """
+        with self._lock:
+            sums, counts = dict(self._sums), dict(self._counts)
+        lines = []
+        for kind, (name, metric_type, description) in self._METRICS.items():
+            keys = sorted(k for k in sums if k[0] == kind)
+            if not keys:
+                continue
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for _, page, stage_name in keys:
+                labels = f'page="{page}",stage="{stage_name}"'
+                if metric_type == "summary":
+                    lines.append(f"{name}_sum{{{labels}}} {sums[kind, page, stage_name]:g}")
+                    lines.append(f"{name}_count{{{labels}}} {counts[kind, page, stage_name]}")
+                else:
+                    lines.append(f"{name}{{{labels}}} {sums[kind, page, stage_name]:g}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,124 @@
+#! python3
+# FanGraphs/leaders/params.py
+
+"""
+Query-string parameters of the ASP.NET **Leaders** pages, which encode their filter configuration in the URL.
+
+Each table maps a filter query onto the names of its URL parameters and a converter.
+A converter is either a dictionary of lowercase options to parameter values,
+or a function of the lowercase option and the current parameters, which returns ``None`` for options it cannot map.
+Filter queries and options missing from a table are configured through the page instead.
+"""
+
+import urllib.parse
+
+#: The FanGraphs team IDs of the team options
+TEAMS = {
+    "all teams": "0", "angels": "1", "orioles": "2", "red sox": "3", "white sox": "4", "indians": "5",
+    "tigers": "6", "royals": "7", "twins": "8", "yankees": "9", "athletics": "10",
+    "mariners": "11", "rays": "12", "rangers": "13", "blue jays": "14", "diamondbacks": "15",
+    "braves": "16", "cubs": "17", "reds": "18", "rockies": "19", "marlins": "20",
+    "astros": "21", "dodgers": "22", "brewers": "23", "nationals": "24", "mets": "25",
+    "phillies": "26", "pirates": "27", "cardinals": "28", "padres": "29", "giants": "30"
+}
+
+
+def _year(option, current):
+    return option if option.isdigit() and len(option) == 4 else None
+
+
+def _qualified(option, current):
+    if option == "qualified":
+        return "y"
+    return option if option.isdigit() else None
+
+
+def _boolean(option, current):
+    return {"true": "1", "false": "0"}.get(option)
+
+
+def _team(option, current):
+    """
+    The ``team`` parameter holds the team ID, followed by the stat group (e.g. ``0,ts``) if it is not players.
+    """
+    team = TEAMS.get(option)
+    if team is None:
+        return None
+    group = current.get("team", "0").partition(",")[2]
+    return f"{team},{group}" if group else team
+
+
+def _group(option, current):
+    group = {"player stats": "", "team stats": "ts", "league stats": "ss"}.get(option)
+    if group is None:
+        return None
+    team = current.get("team", "0").partition(",")[0]
+    return f"{team},{group}" if group else team
+
+
+class MajorLeague:
+    """
+    URL parameters of :py:class:`fangraphs.leaders.leaders.MajorLeague`.
+    """
+    params = {
+        "group": ("team", _group),
+        "stat": ("stats", {"batting": "bat", "pitching": "pit", "fielding": "fld"}),
+        "position": ("pos", {
+            p.lower(): p.lower()
+            for p in ("All", "P", "C", "1B", "2B", "SS", "3B", "RF", "CF", "LF", "OF", "DH", "NP")
+        }),
+        "type": ("type", {
+            "dashboard": "8", "standard": "0", "advanced": "1", "batted ball": "2",
+            "win probability": "3", "pitch type": "4", "plate discipline": "5", "value": "6",
+            "pitch value": "7"
+        }),
+        "league": ("lg", {"all leagues": "all", "al": "al", "nl": "nl"}),
+        "team": ("team", _team),
+        "single_season": (("season", "season1"), _year),
+        "season1": ("season1", _year),
+        "season2": ("season", _year),
+        "min_pa": ("qual", _qualified),
+        "split_seasons": ("ind", _boolean),
+        "active_roster": ("rost", _boolean)
+    }
+
+
+class WAR:
+    """
+    URL parameters of :py:class:`fangraphs.leaders.leaders.WAR`.
+    """
+    params = {
+        "season": ("season", _year)
+    }
+
+
+def compile_url(url: str, params: dict, filters: dict):
+    """
+    Encodes a filter configuration into the URL of a leaderboard.
+
+    :param url: The current URL of the leaderboard, whose parameters are kept unless they are overridden
+    :param params: The table of URL parameters of the leaderboard (e.g. ``MajorLeague.params``)
+    :param filters: Maps filter queries to options
+    :return: The URL, and the filter configuration which could not be encoded
+    :rtype: tuple[str, dict]
+    """
+    parts = urllib.parse.urlsplit(url)
+    current = dict(urllib.parse.parse_qsl(parts.query, keep_blank_values=True))
+    unmapped = {}
+    for query, option in filters.items():
+        entry = params.get(query.lower())
+        value = None
+        if entry is not None:
+            names, converter = entry
+            option = str(option).strip().lower()
+            if isinstance(converter, dict):
+                value = converter.get(option)
+            else:
+                value = converter(option, current)
+        if value is None:
+            unmapped[query] = filters[query]
+            continue
+        for name in (names,) if isinstance(names, str) else names:
+            current[name] = value
+    url = urllib.parse.urlunsplit(parts._replace(query=urllib.parse.urlencode(current, safe=",")))
+    return url, unmapped
@@ -0,0 +1,478 @@
+#! python3
+# FanGraphs/leaders/pool.py
+
+"""
+Shared ``Playwright`` browser pool for the scrapers in :py:mod:`fangraphs.leaders.leaders`.
+
+Launching Chromium is by far the slowest step of opening a scraper.
+The pool keeps a single browser warm and lends out browser contexts (each with one page),
+which are returned to the pool when the scraper exits.
+Lent pages can be served from (or recorded into) HAR archives, see :py:mod:`fangraphs.leaders.replay`.
+"""
+
+import asyncio
+import atexit
+import os
+import threading
+import time
+import weakref
+
+from playwright.async_api import async_playwright
+from playwright.sync_api import sync_playwright
+
+import fangraphs.exceptions
+from fangraphs.leaders import blocking
+from fangraphs.leaders import replay
+
+
+class BrowserPool:
+    """
+    Manages a warm Chromium browser and a bounded set of reusable browser contexts.
+
+    ``Playwright`` objects created through the synchronous API are bound to the thread which created them.
+    Thus, a pool must only be used from the thread which created it.
+    See :py:func:`get_pool` for the per-thread default pool.
+    """
+    def __init__(self, size=4, *, idle_timeout=300.0, downloads_path="out", profile=blocking.DEFAULT_PROFILE,
+                 archives=None):
+        """
+        :param size: The maximum number of browser contexts (borrowed and idle) held by the pool
+        :param idle_timeout: The number of seconds after which an idle context (or browser) is closed
+        :param downloads_path: The directory which browser downloads are saved to
+        :param profile: The request-interception profile of the lent pages (see :py:mod:`fangraphs.leaders.blocking`).
+            If ``None``, every request is let through.
+        :param archives: The directory of the HAR archives which lent pages are replayed from or recorded into,
+            when :py:meth:`acquire` is given the name of an archive (see :py:mod:`fangraphs.leaders.replay`).
+            If ``None``, named archives are ignored and pages use the network.
+
+        .. py:attribute:: size
+            The maximum number of browser contexts held by the pool
+            :type: int
+
+        .. py:attribute:: idle_timeout
+            The number of seconds after which an idle context is evicted
+            :type: float
+        """
+        if size < 1:
+            raise ValueError("Browser pool size must be at least 1")
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.downloads_path = os.path.abspath(downloads_path)
+        self.profile = profile
+        self.archives = archives
+
+        self.__play = None
+        self.__browser = None
+        self.__idle = []
+        self.__borrowed = {}
+        self.__recording = set()
+        self.__last_used = time.monotonic()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, value, traceback):
+        self.close()
+
+    @property
+    def borrowed(self):
+        """
+        The number of pages currently lent out by the pool.
+
+        :rtype: int
+        """
+        return len(self.__borrowed)
+
+    @property
+    def idle(self):
+        """
+        The number of warm browser contexts waiting to be borrowed.
+
+        :rtype: int
+        """
+        return len(self.__idle)
+
+    def _launch(self):
+        """
+        Starts ``Playwright`` and launches Chromium, if not already running.
+        """
+        if self.__browser is not None and self.__browser.is_connected():
+            return
+        os.makedirs(self.downloads_path, exist_ok=True)
+        if self.__play is None:
+            self.__play = sync_playwright().start()
+        self.__browser = self.__play.chromium.launch(
+            downloads_path=self.downloads_path
+        )
+
+    def _archive(self, archive):
+        """
+        :param archive: An archive, or the name of an archive in :py:attr:`archives`
+        :return: The archive, or ``None`` if the page uses the network
+        :rtype: fangraphs.leaders.replay.Archive or None
+        """
+        if isinstance(archive, str):
+            return replay.Archive(archive, self.archives) if self.archives else None
+        return archive
+
+    def acquire(self, allow=(), archive=None):
+        """
+        Borrows a page from the pool.
+        A warm browser context is reused, if one is available.
+        A page which records an archive gets a fresh context, which is closed (writing the archive) on release.
+
+        :param allow: Resource types and URL substrings which :py:attr:`profile` never blocks on the page
+        :param archive: The archive which the page is replayed from or recorded into,
+            or its name in :py:attr:`archives`
+        :return: A page with downloads enabled
+        :rtype: playwright.sync_api._generated.Page
+        :raises FanGraphs.exceptions.BrowserPoolExhausted: All contexts are currently borrowed
+        """
+        archive = self._archive(archive)
+        recording = archive is not None and archive.recording
+        self.evict_idle()
+        self._launch()
+        page = None
+        while self.__idle and page is None and not recording:
+            context, _ = self.__idle.pop()
+            if context.pages:
+                page = context.pages[0]
+            else:
+                context.close()
+        if page is None:
+            if len(self.__borrowed) >= self.size:
+                raise fangraphs.exceptions.BrowserPoolExhausted(self.size)
+            context = self.__browser.new_context(accept_downloads=True)
+            page = context.new_page()
+        if archive is not None:
+            archive.attach(page)
+        if recording:
+            self.__recording.add(id(page))
+        if self.profile is not None:
+            self.profile.route(page, allow)
+        self.__borrowed[id(page)] = page
+        self.__last_used = time.monotonic()
+        return page
+
+    def release(self, page):
+        """
+        Returns a borrowed page to the pool.
+        The browser context is cleared of cookies and storage, so the next borrower starts fresh.
+
+        :param page: The page returned by :py:meth:`acquire`
+        """
+        if self.__borrowed.pop(id(page), None) is None:
+            return
+        self.__last_used = time.monotonic()
+        context = page.context
+        if page.is_closed() or id(page) in self.__recording:
+            self.__recording.discard(id(page))
+            context.close()
+            return
+        try:
+            page.unroute("**/*")
+            page.evaluate(
+                "() => { try { localStorage.clear(); sessionStorage.clear(); } catch (e) {} }"
+            )
+            context.clear_cookies()
+            for extra in context.pages[1:]:
+                extra.close()
+            page.goto("about:blank")
+        except Exception:  # pylint: disable=broad-except
+            context.close()
+            return
+        self.__idle.append((context, self.__last_used))
+        self.evict_idle()
+
+    def evict_idle(self):
+        """
+        Closes the browser contexts which have been idle for longer than :py:attr:`idle_timeout`.
+        The browser itself is closed once the pool has been entirely unused for that long.
+        """
+        now = time.monotonic()
+        keep = []
+        for context, last_used in self.__idle:
+            if now - last_used > self.idle_timeout:
+                context.close()
+            else:
+                keep.append((context, last_used))
+        self.__idle = keep
+        if (not self.__idle and not self.__borrowed
+                and now - self.__last_used > self.idle_timeout):
+            self._shutdown()
+
+    def _shutdown(self):
+        """
+        Terminates the browser and ``Playwright``, leaving the pool reusable.
+        """
+        if self.__browser is not None:
+            self.__browser.close()
+            self.__browser = None
+        if self.__play is not None:
+            self.__play.stop()
+            self.__play = None
+
+    def close(self):
+        """
+        Closes every context (including the contexts of borrowed pages), the browser and ``Playwright``.
+        Pages which are still borrowed can no longer be used, and releasing them does nothing.
+        """
+        for context, _ in self.__idle:
+            context.close()
+        for page in self.__borrowed.values():
+            page.context.close()
+        self.__idle = []
+        self.__borrowed = {}
+        self.__recording = set()
+        self._shutdown()
+
+
+class AsyncBrowserPool:
+    """
+    Asynchronous counterpart of :py:class:`BrowserPool`, built on ``playwright.async_api``.
+
+    Unlike :py:class:`BrowserPool`, :py:meth:`acquire` waits for a context to be released
+    when all contexts are borrowed, so any number of coroutines can share one pool.
+    A pool must only be used from the event loop which created it.
+    """
+    def __init__(self, size=4, *, idle_timeout=300.0, downloads_path="out", profile=blocking.DEFAULT_PROFILE,
+                 archives=None):
+        """
+        :param size: The maximum number of browser contexts (borrowed and idle) held by the pool
+        :param idle_timeout: The number of seconds after which an idle context (or browser) is closed
+        :param downloads_path: The directory which browser downloads are saved to
+        :param profile: The request-interception profile of the lent pages (see :py:mod:`fangraphs.leaders.blocking`).
+            If ``None``, every request is let through.
+        :param archives: The directory of the HAR archives which lent pages are replayed from or recorded into,
+            when :py:meth:`acquire` is given the name of an archive (see :py:mod:`fangraphs.leaders.replay`).
+            If ``None``, named archives are ignored and pages use the network.
+        """
+        if size < 1:
+            raise ValueError("Browser pool size must be at least 1")
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.downloads_path = os.path.abspath(downloads_path)
+        self.profile = profile
+        self.archives = archives
+
+        self.__play = None
+        self.__browser = None
+        self.__idle = []
+        self.__borrowed = {}
+        self.__recording = set()
+        self.__last_used = time.monotonic()
+        self.__launching = asyncio.Lock()
+        self.__available = asyncio.Semaphore(size)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, value, traceback):
+        await self.close()
+
+    @property
+    def borrowed(self):
+        """
+        The number of pages currently lent out by the pool.
+
+        :rtype: int
+        """
+        return len(self.__borrowed)
+
+    @property
+    def idle(self):
+        """
+        The number of warm browser contexts waiting to be borrowed.
+
+        :rtype: int
+        """
+        return len(self.__idle)
+
+    async def _launch(self):
+        """
+        Starts ``Playwright`` and launches Chromium, if not already running.
+        """
+        async with self.__launching:
+            if self.__browser is not None and self.__browser.is_connected():
+                return
+            os.makedirs(self.downloads_path, exist_ok=True)
+            if self.__play is None:
+                self.__play = await async_playwright().start()
+            self.__browser = await self.__play.chromium.launch(
+                downloads_path=self.downloads_path
+            )
+
+    def _archive(self, archive):
+        """
+        See :py:meth:`BrowserPool._archive`.
+        """
+        if isinstance(archive, str):
+            return replay.Archive(archive, self.archives) if self.archives else None
+        return archive
+
+    async def acquire(self, allow=(), archive=None):
+        """
+        Borrows a page from the pool, waiting for one to be released if necessary.
+        See :py:meth:`BrowserPool.acquire`.
+
+        :param allow: Resource types and URL substrings which :py:attr:`profile` never blocks on the page
+        :param archive: The archive which the page is replayed from or recorded into,
+            or its name in :py:attr:`archives`
+        :return: A page with downloads enabled
+        :rtype: playwright.async_api._generated.Page
+        """
+        archive = self._archive(archive)
+        recording = archive is not None and archive.recording
+        await self.__available.acquire()
+        try:
+            await self.evict_idle()
+            await self._launch()
+            page = None
+            while self.__idle and page is None and not recording:
+                context, _ = self.__idle.pop()
+                if context.pages:
+                    page = context.pages[0]
+                else:
+                    await context.close()
+            if page is None:
+                context = await self.__browser.new_context(accept_downloads=True)
+                page = await context.new_page()
+            if archive is not None:
+                await archive.aattach(page)
+            if self.profile is not None:
+                await self.profile.aroute(page, allow)
+        except BaseException:
+            self.__available.release()
+            raise
+        if recording:
+            self.__recording.add(id(page))
+        self.__borrowed[id(page)] = page
+        self.__last_used = time.monotonic()
+        return page
+
+    async def release(self, page):
+        """
+        Returns a borrowed page to the pool.
+        The browser context is cleared of cookies and storage, so the next borrower starts fresh.
+
+        :param page: The page returned by :py:meth:`acquire`
+        """
+        if self.__borrowed.pop(id(page), None) is None:
+            return
+        self.__last_used = time.monotonic()
+        context = page.context
+        try:
+            if page.is_closed() or id(page) in self.__recording:
+                self.__recording.discard(id(page))
+                await context.close()
+                return
+            await page.unroute("**/*")
+            await page.evaluate(
+                "() => { try { localStorage.clear(); sessionStorage.clear(); } catch (e) {} }"
+            )
+            await context.clear_cookies()
+            for extra in context.pages[1:]:
+                await extra.close()
+            await page.goto("about:blank")
+        except Exception:  # pylint: disable=broad-except
+            await context.close()
+            return
+        finally:
+            self.__available.release()
+        self.__idle.append((context, self.__last_used))
+        await self.evict_idle()
+
+    async def evict_idle(self):
+        """
+        Closes the browser contexts which have been idle for longer than :py:attr:`idle_timeout`.
+        The browser itself is closed once the pool has been entirely unused for that long.
+        """
+        now = time.monotonic()
+        keep = []
+        for context, last_used in self.__idle:
+            if now - last_used > self.idle_timeout:
+                await context.close()
+            else:
+                keep.append((context, last_used))
+        self.__idle = keep
+        if (not self.__idle and not self.__borrowed
+                and now - self.__last_used > self.idle_timeout):
+            await self._shutdown()
+
+    async def _shutdown(self):
+        """
+        Terminates the browser and ``Playwright``, leaving the pool reusable.
+        """
+        if self.__browser is not None:
+            await self.__browser.close()
+            self.__browser = None
+        if self.__play is not None:
+            await self.__play.stop()
+            self.__play = None
+
+    async def close(self):
+        """
+        Closes every context (including the contexts of borrowed pages), the browser and ``Playwright``.
+        Pages which are still borrowed can no longer be used, and releasing them does nothing.
+        """
+        for context, _ in self.__idle:
+            await context.close()
+        for page in self.__borrowed.values():
+            await page.context.close()
+            self.__available.release()
+        self.__idle = []
+        self.__borrowed = {}
+        self.__recording = set()
+        await self._shutdown()
+
+
+_pool_settings = {
+    "size": 4, "idle_timeout": 300.0, "downloads_path": "out", "profile": blocking.DEFAULT_PROFILE,
+    "archives": None
+}
+_local = threading.local()
+_async_pools = weakref.WeakKeyDictionary()
+
+
+def configure_pool(**settings):
+    """
+    Sets the options used to create the default pools returned by :py:func:`get_pool`
+    and :py:func:`get_async_pool`.
+    Pools which have already been created are not affected.
+
+    :param settings: Keyword arguments accepted by :py:class:`BrowserPool`
+    """
+    unknown = set(settings) - set(_pool_settings)
+    if unknown:
+        raise TypeError(f"Unknown browser pool setting(s): {', '.join(sorted(unknown))}")
+    _pool_settings.update(settings)
+
+
+def get_pool():
+    """
+    Returns the default browser pool of the calling thread, creating it if necessary.
+
+    :rtype: BrowserPool
+    """
+    pool = getattr(_local, "pool", None)
+    if pool is None:
+        pool = BrowserPool(**_pool_settings)
+        _local.pool = pool
+        if threading.current_thread() is threading.main_thread():
+            atexit.register(pool.close)
+    return pool
+
+
+def get_async_pool():
+    """
+    Returns the default asynchronous browser pool of the running event loop, creating it if necessary.
+    The pool is not closed automatically; await :py:meth:`AsyncBrowserPool.close` before the loop ends.
+
+    :rtype: AsyncBrowserPool
+    """
+    loop = asyncio.get_running_loop()
+    pool = _async_pools.get(loop)
+    if pool is None:
+        pool = AsyncBrowserPool(**_pool_settings)
+        _async_pools[loop] = pool
+    return pool
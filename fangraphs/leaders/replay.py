@@ -0,0 +1,207 @@
+#! python3
+# FanGraphs/leaders/replay.py
+
+"""
+Recording and replay of the HTTP traffic of the FanGraphs pages, as HAR archives.
+
+A page is recorded once, with network access, into *<directory>/<name>.har*.
+Afterwards, ``Playwright`` serves every request of the page from the archive, so tests and benchmarks
+run deterministically and without network; requests missing from the archive are aborted.
+
+The mode is read from the ``FANGRAPHS_REPLAY`` environment variable, unless given explicitly:
+
+- ``auto`` (default): replay the archive if it exists; otherwise, record it
+- ``record``: always record, replacing the archive
+- ``replay``: always replay; a missing archive is an error, so nothing is fetched from the network
+- ``off``: use the network, without recording
+
+The archives are kept in the ``FANGRAPHS_ARCHIVES`` directory (*fangraphs/tests/archives* by default).
+Pages borrowed from a browser pool are attached to their archives by the pool
+(see the ``archives`` option of :py:class:`fangraphs.leaders.pool.BrowserPool`).
+"""
+
+import base64
+import contextlib
+import json
+import os
+import urllib.parse
+
+from fangraphs.leaders import blocking
+
+MODES = ("auto", "record", "replay", "off")
+
+#: The default directory of the archives
+DIRECTORY = os.environ.get(
+    "FANGRAPHS_ARCHIVES",
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "tests", "archives")
+)
+
+
+def archive_name(address: str):
+    """
+    :param address: The URL address of a page
+    :return: A filename-safe name for the archive of the page, e.g. ``"leaders_splits-leaderboards"``
+    :rtype: str
+    """
+    parts = urllib.parse.urlsplit(address)
+    name = parts.path.strip("/").replace("/", "_").replace(".", "_")
+    return name or parts.hostname or "index"
+
+
+class Archive:
+    """
+    The HAR archive of a page, recorded from or replayed to ``Playwright`` browser contexts.
+    """
+    def __init__(self, name, directory=DIRECTORY, *, mode=None):
+        """
+        :param name: The name of the archive (see :py:func:`archive_name`)
+        :param directory: The directory of the archive
+        :param mode: One of :py:data:`MODES`; defaults to the ``FANGRAPHS_REPLAY`` environment variable, or ``auto``
+        :raises ValueError: Unknown mode
+
+        .. py:attribute:: path
+            The filepath of the archive
+            :type: str
+        """
+        mode = (mode or os.environ.get("FANGRAPHS_REPLAY") or "auto").lower()
+        if mode not in MODES:
+            raise ValueError(f"Unknown replay mode: {mode}")
+        self.name = name
+        self.path = os.path.join(directory, f"{name}.har")
+        self.mode = mode
+
+    @property
+    def recorded(self):
+        """
+        ``True`` if the archive exists on disk.
+
+        :rtype: bool
+        """
+        return os.path.exists(self.path)
+
+    @property
+    def recording(self):
+        """
+        ``True`` if the archive is (re-)recorded from the network.
+
+        :rtype: bool
+        """
+        return self.mode == "record" or (self.mode == "auto" and not self.recorded)
+
+    @property
+    def replaying(self):
+        """
+        ``True`` if requests are served from the archive.
+
+        :rtype: bool
+        """
+        return self.mode != "off" and not self.recording
+
+    def _har_options(self):
+        """
+        :raises FileNotFoundError: The archive is replayed, but has not been recorded
+        """
+        if self.replaying and not self.recorded:
+            raise FileNotFoundError(
+                f"No archive at {self.path}; record it with FANGRAPHS_REPLAY=record"
+            )
+        if self.recording:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            return {"update": True, "update_content": "embed", "update_mode": "minimal"}
+        return {"not_found": "abort"}
+
+    def attach(self, context):
+        """
+        Records or replays the requests of a synchronous browser context.
+        A recording is written when the context is closed.
+
+        :param context: The ``Playwright`` browser context (or page)
+        """
+        if self.mode != "off":
+            context.route_from_har(self.path, **self._har_options())
+
+    async def aattach(self, context):
+        """
+        Records or replays the requests of an asynchronous browser context.
+        A recording is written when the context is closed.
+
+        :param context: The ``Playwright`` browser context (or page)
+        """
+        if self.mode != "off":
+            await context.route_from_har(self.path, **self._har_options())
+
+    def _response(self, url: str):
+        """
+        Looks up the recorded response to a request, following recorded redirects
+        (e.g. from *fangraphs.com* to *www.fangraphs.com*).
+
+        :param url: The URL of the request
+        :return: The HAR entry of the final response, or ``None`` if ``url`` was not recorded
+        :rtype: dict or None
+        """
+        with open(self.path, encoding="utf-8") as file:
+            responses = {
+                e["request"]["url"].rstrip("/"): e["response"]
+                for e in json.load(file)["log"]["entries"]
+            }
+        seen = set()
+        response = None
+        while url and url not in seen:
+            seen.add(url)
+            response = responses.get(url.rstrip("/"))
+            if response is None:
+                return None
+            location = response.get("redirectURL") if 300 <= response["status"] < 400 else ""
+            url = urllib.parse.urljoin(url, location) if location else ""
+        return response
+
+    def status(self, url: str):
+        """
+        :param url: The URL of the request
+        :return: The recorded status code of the final response, or ``None`` if ``url`` was not recorded
+            (see :py:meth:`_response`)
+        :rtype: int or None
+        """
+        response = self._response(url)
+        return None if response is None else response["status"]
+
+    def text(self, url: str):
+        """
+        :param url: The URL of the request
+        :return: The recorded body of the final response, or ``None`` if ``url`` was not recorded
+            (see :py:meth:`_response`)
+        :rtype: str or None
+        """
+        response = self._response(url)
+        if response is None:
+            return None
+        content = response.get("content", {})
+        text = content.get("text", "")
+        if content.get("encoding") == "base64":
+            text = base64.b64decode(text).decode("utf-8", "replace")
+        return text
+
+
+@contextlib.contextmanager
+def open_page(address, *, waitfor="", archive=None, profile=blocking.DEFAULT_PROFILE):
+    """
+    Opens a page in a browser pool of its own, served from (or recorded into) its archive.
+
+    :param address: The URL address of the page
+    :param waitfor: The CSS selector to wait for after the page loads
+    :param archive: The archive of the page; defaults to the archive named after ``address``
+    :param profile: The request-interception profile, so ads and trackers are neither loaded nor recorded
+    :return: A context manager yielding the synchronous ``Playwright`` page
+    """
+    from fangraphs.leaders import pool  # pylint: disable=import-outside-toplevel
+
+    archive = archive or Archive(archive_name(address))
+    with pool.BrowserPool(1, profile=profile) as browser_pool:
+        page = browser_pool.acquire(archive=archive)
+        try:
+            page.goto(address, timeout=0)
+            if waitfor:
+                page.wait_for_selector(waitfor)
+            yield page
+        finally:
+            browser_pool.release(page)
@@ -0,0 +1,220 @@
+#! python3
+# FanGraphs/leaders/shard.py
+
+"""
+Sharded export of many leaderboards over a pool of processes.
+
+Synchronous scrapers parse their pages on a single CPU.
+:py:class:`ShardedRunner` splits a job list into shards of consecutive jobs, which a pool of worker processes export.
+Each worker owns its own browser (the default pool of the process, see :py:func:`fangraphs.leaders.pool.get_pool`),
+and the result of every job is sent back to the parent as soon as its shard is complete.
+Failed jobs, including those lost with a crashed worker, are retried on a fresh shard.
+"""
+
+import collections
+import concurrent.futures
+import multiprocessing
+import os
+import pickle
+import time
+
+from concurrent.futures.process import BrokenProcessPool
+
+from fangraphs.leaders import api
+from fangraphs.leaders import batch
+from fangraphs.leaders import metrics
+from fangraphs.leaders import pool
+
+#: A leaderboard to export: the (synchronous) scraper class, its filter configuration and the output filepath
+Job = collections.namedtuple("Job", ("scraper_cls", "filters", "path"))
+
+#: The outcome of a job, whose ``error`` is ``None`` if the leaderboard was exported
+JobResult = collections.namedtuple("JobResult", ("index", "job", "seconds", "error", "attempts"))
+
+
+def _init_worker(pool_settings):
+    """
+    Configures the default browser pool of a worker process.
+    """
+    pool.configure_pool(**pool_settings)
+
+
+def _picklable(err):
+    """
+    :return: ``err``, or a ``RuntimeError`` describing it if it cannot be sent to the parent process
+    """
+    try:
+        pickle.dumps(err)
+    except Exception:  # pylint: disable=broad-except
+        return RuntimeError(f"{type(err).__name__}: {err}")
+    return err
+
+
+def _export(job):
+    """
+    Exports the leaderboard of a job, on a page of the default browser pool of the process.
+    """
+    os.makedirs(os.path.dirname(job.path) or ".", exist_ok=True)
+    api._browser_export(job.scraper_cls, job.filters, job.path)
+
+
+def _run_shard(shard):
+    """
+    Exports the jobs of a shard in a worker process.
+    A failed job does not stop the rest of the shard.
+
+    :param shard: The numbered jobs of the shard
+    :return: The ``(index, seconds, error)`` of each job
+    :rtype: list
+    """
+    results = []
+    for index, job in shard:
+        start = time.perf_counter()
+        try:
+            _export(job)
+        except Exception as err:  # pylint: disable=broad-except
+            results.append((index, time.perf_counter() - start, _picklable(err)))
+        else:
+            results.append((index, time.perf_counter() - start, None))
+    return results
+
+
+class ShardedRunner:
+    """
+    Exports a list of jobs over a pool of worker processes, each with its own browser.
+    """
+    def __init__(self, jobs, *, processes=None, shard_size=4, retries=2, pool_settings=None):
+        """
+        :param jobs: The jobs to export, as :py:data:`Job` tuples or ``(scraper_cls, filters, path)`` tuples
+        :param processes: The number of worker processes. If not specified, one per CPU.
+        :param shard_size: The number of consecutive jobs sent to a worker at once
+        :param retries: The number of times a failed job is run again
+        :param pool_settings: The settings of the browser pool of each worker (see :py:func:`fangraphs.leaders.pool.configure_pool`).
+            Each worker only uses one page at a time, so the pool has a single context by default.
+
+        .. py:attribute:: jobs
+            The jobs to export
+            :type: list[Job]
+        """
+        self.jobs = [Job(*j) for j in jobs]
+        self.processes = max(1, min(processes or os.cpu_count() or 1, len(self.jobs) or 1))
+        if shard_size < 1:
+            raise ValueError("Shard size must be at least 1")
+        self.shard_size = shard_size
+        self.retries = retries
+        self.pool_settings = dict({"size": 1}, **(pool_settings or {}))
+
+    def _shards(self, indices):
+        """
+        Splits the numbered jobs into shards of at most :py:attr:`shard_size` consecutive jobs.
+        """
+        for start in range(0, len(indices), self.shard_size):
+            yield [(i, self.jobs[i]) for i in indices[start:start + self.shard_size]]
+
+    def _executor(self, processes=None):
+        """
+        Worker processes are spawned rather than forked, so no ``Playwright`` state of the parent is inherited.
+
+        :param processes: The number of worker processes; defaults to :py:attr:`processes`
+        """
+        return concurrent.futures.ProcessPoolExecutor(
+            processes or self.processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.pool_settings,)
+        )
+
+    def _settle(self, outcomes, attempts, retry):
+        """
+        Yields the final outcomes of a shard's jobs, and queues the failed jobs which have retries left.
+        """
+        for index, seconds, error in outcomes:
+            if error is not None and attempts[index] <= self.retries:
+                metrics.emit("retries", "shard", self.jobs[index].scraper_cls, 1)
+                retry.append(index)
+                continue
+            yield JobResult(index, self.jobs[index], seconds, error, attempts[index])
+
+    def _isolate(self, indices, attempts, retry):
+        """
+        Runs jobs one at a time, on a single worker process, so a job which kills its worker is identified.
+        Only that job is charged an attempt; the worker is replaced for the remaining jobs.
+        """
+        executor = None
+        try:
+            for index in indices:
+                if executor is None:
+                    executor = self._executor(1)
+                attempts[index] += 1
+                try:
+                    outcomes = executor.submit(_run_shard, [(index, self.jobs[index])]).result()
+                except BrokenProcessPool as err:
+                    outcomes = [(index, 0.0, err)]
+                    executor.shutdown()
+                    executor = None
+                yield from self._settle(outcomes, attempts, retry)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    def iter_results(self):
+        """
+        Exports every job, yielding the final outcome of each job as soon as it is known.
+        A job is only yielded once: after it succeeds, or after its last retry fails.
+
+        A worker process which dies breaks every shard in progress, and the job which killed it cannot be told apart.
+        The jobs of the broken shards are not charged an attempt; they are run again one at a time (see :py:meth:`_isolate`),
+        so only a job which kills its worker uses up its retries.
+
+        :return: A generator of job outcomes, in order of completion
+        :rtype: collections.Iterator[JobResult]
+        """
+        attempts = [0] * len(self.jobs)
+        pending = list(range(len(self.jobs)))
+        while pending:
+            retry, suspects = [], []
+            executor = self._executor()
+            futures = {}
+            try:
+                for shard in self._shards(pending):
+                    try:
+                        futures[executor.submit(_run_shard, shard)] = shard
+                    except BrokenProcessPool:
+                        suspects.extend(index for index, _ in shard)
+                        continue
+                    for index, _ in shard:
+                        attempts[index] += 1
+                for future in concurrent.futures.as_completed(futures):
+                    try:
+                        outcomes = future.result()
+                    except BrokenProcessPool:
+                        for index, _ in futures[future]:
+                            attempts[index] -= 1
+                            suspects.append(index)
+                        continue
+                    yield from self._settle(outcomes, attempts, retry)
+            finally:
+                for future in futures:
+                    future.cancel()
+                executor.shutdown()
+            if suspects:
+                yield from self._isolate(sorted(suspects), attempts, retry)
+            pending = sorted(retry)
+
+    def run(self):
+        """
+        Exports every job.
+
+        :return: The outcome of the run, whose successful jobs are merged in job order
+        :rtype: fangraphs.leaders.batch.BatchReport
+        """
+        report = batch.BatchReport()
+        start = time.perf_counter()
+        results = sorted(self.iter_results())
+        report.elapsed = time.perf_counter() - start
+        for result in results:
+            if result.error is None:
+                report.exported.append((result.job.filters, result.job.path, result.seconds))
+            else:
+                report.failed.append((result.job.filters, result.error))
+        return report
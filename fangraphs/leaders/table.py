@@ -0,0 +1,229 @@
+#! python3
+# FanGraphs/leaders/table.py
+
+"""
+In-memory columnar leaderboards.
+
+Numeric columns are held in ``array.array`` buffers, which ``numpy``, ``pandas`` and ``pyarrow``
+can wrap without copying; other columns are held as lists of strings.
+Tables can be written as CSV, or through ``pyarrow`` as Parquet, Arrow IPC or Feather files.
+"""
+
+import array
+import csv
+import io
+import os
+
+from fangraphs.leaders import columns
+
+#: Maps file extensions to the file formats tables can be written as
+FORMATS = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".arrow": "arrow",
+    ".ipc": "arrow",
+    ".feather": "feather"
+}
+
+
+def file_format(path="", fmt=None):
+    """
+    Resolves the file format of an export.
+
+    :param path: The filepath of the export
+    :param fmt: The requested file format; if not specified, it is inferred from the extension of ``path``
+    :return: A file format of :py:data:`FORMATS`
+    :rtype: str
+    :raises ValueError: Unknown file format ``fmt``
+    """
+    if fmt is None:
+        return FORMATS.get(os.path.splitext(path)[1].lower(), "csv")
+    if fmt.lower() not in FORMATS.values():
+        raise ValueError(f"Unknown file format: {fmt}")
+    return fmt.lower()
+
+
+class Table:
+    """
+    A leaderboard held in memory as named columns.
+    """
+    def __init__(self, columns: dict):
+        """
+        :param columns: Maps column headers to columns, which are ``array.array`` buffers or lists
+
+        .. py:attribute:: columns
+            Maps column headers to columns
+            :type: dict
+        """
+        lengths = {len(c) for c in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("Columns must have the same length")
+        self.columns = dict(columns)
+
+    @classmethod
+    def from_rows(cls, headers, rows, schema=None):
+        """
+        Builds a table from rows, converting each column whole (see :py:func:`fangraphs.leaders.columns.convert`).
+
+        :param headers: The column headers
+        :param rows: The rows of the table
+        :param schema: Maps column headers to kinds; defaults to :py:func:`fangraphs.leaders.columns.schema`
+        :rtype: Table
+        """
+        rows = list(rows)
+        schema = columns.schema() if schema is None else schema
+        width = len(headers)
+        if any(len(r) != width for r in rows):
+            rows = [list(r[:width]) + [""] * (width - len(r)) for r in rows]
+        cells = list(zip(*rows)) if rows else [()] * width
+        return cls({
+            header: columns.convert(values, schema.get(header))
+            for header, values in zip(headers, cells)
+        })
+
+    @classmethod
+    def from_csv(cls, file, schema=None):
+        """
+        Builds a table from CSV data.
+
+        :param file: The path of a CSV file, or a readable text file object
+        :param schema: Maps column headers to kinds; defaults to :py:func:`fangraphs.leaders.columns.schema`
+        :rtype: Table
+        """
+        if isinstance(file, (str, bytes)) or hasattr(file, "__fspath__"):
+            with open(file, newline="", encoding="utf-8-sig") as stream:
+                return cls.from_csv(stream, schema)
+        reader = csv.reader(file)
+        headers = next(reader, [])
+        return cls.from_rows(headers, reader, schema)
+
+    @property
+    def headers(self):
+        """
+        The column headers.
+
+        :rtype: list
+        """
+        return list(self.columns)
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()), ()))
+
+    def __getitem__(self, header):
+        return self.columns[header]
+
+    def __iter__(self):
+        return self.rows()
+
+    def __repr__(self):
+        return f"<Table: {len(self)} rows x {len(self.columns)} columns>"
+
+    def rows(self):
+        """
+        Iterates over the rows of the table.
+
+        :return: A generator of row tuples
+        """
+        return zip(*self.columns.values())
+
+    def to_csv(self, file=None):
+        """
+        Serializes the table to CSV.
+
+        :param file: The path of the CSV file, or a writable text file object.
+            If not specified, the CSV data is returned instead.
+        :return: The CSV data, if ``file`` is not specified
+        :rtype: str or None
+        """
+        if file is None:
+            stream = io.StringIO()
+            self.to_csv(stream)
+            return stream.getvalue()
+        if isinstance(file, (str, bytes)) or hasattr(file, "__fspath__"):
+            with open(file, "w", newline="") as stream:
+                self.to_csv(stream)
+            return None
+        writer = csv.writer(file)
+        writer.writerow(self.headers)
+        writer.writerows(self.rows())
+        return None
+
+    def to_numpy(self, header):
+        """
+        Wraps a column as a ``numpy`` array.
+        Numeric columns share the memory of their buffer.
+
+        :param header: The column header
+        :rtype: numpy.ndarray
+        :raises ImportError: ``numpy`` is not installed
+        """
+        try:
+            import numpy
+        except ImportError as err:
+            raise ImportError("Table.to_numpy requires numpy: pip install numpy") from err
+        column = self.columns[header]
+        if isinstance(column, array.array):
+            return numpy.frombuffer(column, dtype=numpy.int64 if column.typecode == "q" else numpy.float64)
+        return numpy.array(column, dtype=object)
+
+    def to_pandas(self):
+        """
+        :return: The table as a ``pandas`` data frame
+        :rtype: pandas.DataFrame
+        :raises ImportError: ``pandas`` is not installed
+        """
+        try:
+            import pandas
+        except ImportError as err:
+            raise ImportError("Table.to_pandas requires pandas: pip install pandas") from err
+        return pandas.DataFrame({h: self.to_numpy(h) for h in self.columns}, columns=self.headers)
+
+    def to_arrow(self):
+        """
+        :return: The table as a ``pyarrow`` table
+        :rtype: pyarrow.Table
+        :raises ImportError: ``pyarrow`` is not installed
+        """
+        try:
+            import pyarrow
+        except ImportError as err:
+            raise ImportError("Table.to_arrow requires pyarrow: pip install pyarrow") from err
+        import pyarrow.compute
+        arrays = []
+        for column in self.columns.values():
+            if isinstance(column, array.array):
+                kind = pyarrow.int64() if column.typecode == "q" else pyarrow.float64()
+                values = pyarrow.Array.from_buffers(kind, len(column), [None, pyarrow.py_buffer(column)])
+                if column.typecode == "d":
+                    values = pyarrow.compute.if_else(pyarrow.compute.is_nan(values), None, values)
+                arrays.append(values)
+            else:
+                arrays.append(pyarrow.array(column, type=pyarrow.string()))
+        return pyarrow.Table.from_arrays(arrays, names=self.headers)
+
+    def write(self, path, fmt=None, *, compression="zstd"):
+        """
+        Writes the table to a file.
+        Empty numeric cells are written as nulls in the columnar formats.
+
+        :param path: The filepath to write to
+        :param fmt: The file format (see :py:func:`file_format`)
+        :param compression: The compression codec of Parquet and Feather files
+        :raises ImportError: A columnar format is requested, but ``pyarrow`` is not installed
+        """
+        fmt = file_format(path, fmt)
+        if fmt == "csv":
+            self.to_csv(path)
+            return
+        data = self.to_arrow()
+        if fmt == "parquet":
+            import pyarrow.parquet
+            pyarrow.parquet.write_table(data, path, compression=compression)
+        elif fmt == "feather":
+            import pyarrow.feather
+            pyarrow.feather.write_feather(data, path, compression=compression)
+        else:
+            import pyarrow.ipc
+            with pyarrow.ipc.new_file(path, data.schema) as writer:
+                writer.write_table(data)
@@ -1,25 +1,165 @@
 #! python3
 # FanGraphs/selectors/__init__.py
 
+import functools
+import json
+
+import soupsieve
+
 import fangraphs.exceptions
+from fangraphs.leaders import metrics
+
+
+_LIST_TEXTS = "els => els.map(e => e.textContent)"
+_QUERY_TEXTS = """sels => sels.map(s => {
+    const e = document.querySelector(s);
+    return e ? e.textContent : "";
+})"""
+
+#: Reads the current option of every filter query in one evaluation, given the state specs of the filter queries
+#: (see ``Selections.state_spec``, ``Dropdowns.state_spec`` and ``Switches.state_spec``).
+#: An option whose element is missing is ``null``.
+STATE_JS = """specs => {
+    const first = s => document.querySelector(s);
+    const text = e => e ? e.textContent : null;
+    const bool = b => b ? "True" : "False";
+    const read = spec => {
+        switch (spec.kind) {
+            case "selected": {
+                const e = first(spec.selector);
+                return e ? e.textContent : "";
+            }
+            case "active": {
+                let option = "";
+                for (const s of spec.selectors) {
+                    const e = first(s);
+                    if (!e) return null;
+                    if (e.classList.contains("active")) option = e.textContent;
+                }
+                return option;
+            }
+            case "value": {
+                const e = first(spec.selector);
+                return e ? e.getAttribute("value") : null;
+            }
+            case "highlighted": {
+                const options = Array.from(document.querySelectorAll(spec.selector))
+                    .filter(e => e.classList.contains("highlight-selection"))
+                    .map(e => e.textContent);
+                return spec.multiple ? options : (options.length ? options[0] : "");
+            }
+            case "text":
+                return text(first(spec.selector));
+            case "checked": {
+                const e = first(spec.selector);
+                return e ? bool(e.getAttribute("checked") === "checked") : null;
+            }
+            case "class": {
+                const e = first(spec.selector);
+                return e ? bool(e.classList.contains(spec.name)) : null;
+            }
+            case "url":
+                return bool(location.href.includes(spec.contains));
+        }
+        return null;
+    };
+    const state = {};
+    for (const [query, spec] of specs) state[query] = read(spec);
+    return state;
+}"""
+
+
+@functools.lru_cache(maxsize=None)
+def compile_selector(selector: str):
+    """
+    Compiles a CSS selector into a ``soupsieve`` matcher.
+    Each selector is compiled once; later calls return the cached matcher,
+    which the filter query classes keep so that reading the page does not parse any CSS.
+
+    :param selector: The CSS selector
+    :return: The compiled matcher, whose ``select`` method takes a ``bs4`` tag
+    :rtype: soupsieve.SoupSieve
+    """
+    return soupsieve.compile(selector)
+
+
+def _index(options, option: str):
+    """
+    Finds the position of ``option`` among ``options``, ignoring case.
+
+    :param options: The options of the filter query
+    :param option: The option to find
+    :return: The index of the option
+    :rtype: int
+    :raises FanGraphs.exceptions.InvalidFilterOption: Invalid argument ``option``
+    """
+    options = [o.lower() for o in options]
+    try:
+        return options.index(option.lower())
+    except ValueError as err:
+        raise fangraphs.exceptions.InvalidFilterOption(option) from err
+
+
+def _catalog_text(options, option: str):
+    """
+    Finds the text of ``option`` among catalogued options, ignoring case.
+
+    :param options: The catalogued options of the filter query, or ``None``
+    :param option: The option to find
+    :return: The catalogued text of the option, or ``None`` if it is not catalogued
+    :rtype: str or None
+    """
+    for opt in options or []:
+        if opt.lower() == option.lower():
+            return opt
+    return None
+
+
+def _text_selector(selector: str, text: str):
+    """
+    :return: A ``Playwright`` selector matching the element with the text ``text`` within ``selector``
+    :rtype: str
+    """
+    return f"{selector} >> text={json.dumps(text.strip())}"
 
 
 class Selections:
     """
     Manages selection-class filter queries.
     """
-    def __init__(self, soup, selector, descendant=""):
-        self.soup = soup
+    def __init__(self, parser, selector, descendant="", *, options=None):
+        """
+        :param parser: The object (usually the scraper) whose ``soup`` attribute holds the parsed page.
+            The soup is read through ``parser`` on each use, so it is never stale.
+        :param selector: The CSS selector of the filter query, or the list of CSS selectors of its options
+        :param descendant: The CSS selector of the options, relative to ``selector``
+        :param options: The catalogued options of the filter query, which allow options to be located without reading the page
+        """
+        self.parser = parser
         self.selector = selector
         self.descendant = descendant
+        self.options = options
+        if isinstance(selector, str):
+            self._options_css = compile_selector(f"{selector} {descendant}")
+            self._current_css = compile_selector(f"{selector} .rtsLink.rtsSelected")
+        elif isinstance(selector, list):
+            self._options_css = [compile_selector(s) for s in selector]
+
+    @property
+    def soup(self):
+        """
+        The ``bs4.BeautifulSoup`` object of :py:attr:`parser`.
+        """
+        return self.parser.soup
 
     def list_options(self):
         if isinstance(self.selector, str):
-            elems = self.soup.select(f"{self.selector} {self.descendant}")
+            elems = self._options_css.select(self.soup)
         elif isinstance(self.selector, list):
+            soup = self.soup
             elems = [
-                self.soup.select(s)[0]
-                for s in self.selector
+                css.select(soup, limit=1)[0]
+                for css in self._options_css
             ]
         else:
             raise Exception
@@ -28,61 +168,124 @@ class Selections:
 
     def current_option(self):
         if isinstance(self.selector, str):
-            elem = self.soup.select(f"{self.selector} .rtsLink.rtsSelected")
-            option = elem.getText()
+            elems = self._current_css.select(self.soup, limit=1)
+            option = elems[0].getText() if elems else ""
         elif isinstance(self.selector, list):
             option = ""
-            for sel in self.selector:
-                elem = self.soup.select(sel)[0]
+            soup = self.soup
+            for css in self._options_css:
+                elem = css.select(soup, limit=1)[0]
                 if "active" in elem.get("class"):
                     option = elem.getText()
         else:
             raise Exception
         return option
 
-    async def configure(self, page, option: str):
-        option = option.lower()
-        options = [o.lower() for o in self.list_options()]
-        try:
-            index = options.index(option)
-        except ValueError as err:
-            raise fangraphs.exceptions.InvalidFilterOption(option) from err
+    def state_spec(self):
+        """
+        :return: How :py:data:`STATE_JS` reads the current option, as :py:meth:`current_option` does
+        :rtype: dict
+        """
         if isinstance(self.selector, str):
-            elem = await page.query_selector_all(
-                f"{self.selector} {self.descendant}"
-            )[index]
-            await elem.click()
-        elif isinstance(self.selector, list):
-            await page.click(self.selector[index])
-        else:
-            raise Exception
+            return {"kind": "selected", "selector": f"{self.selector} .rtsLink.rtsSelected"}
+        if isinstance(self.selector, list):
+            return {"kind": "active", "selectors": self.selector}
+        raise Exception
+
+    def configure(self, page, option: str):
+        """
+        Configures the filter query to ``option``, using a synchronous ``Playwright`` page.
+        Catalogued options are located by their text; other options are validated against the live page.
+        Either way, :py:attr:`soup` is not read.
+
+        :param page: The synchronous ``Playwright`` page
+        :param option: The option to configure the filter query to
+        """
+        with metrics.stage("configure", self.parser):
+            text = _catalog_text(self.options, option)
+            if isinstance(self.selector, str):
+                selector = f"{self.selector} {self.descendant}"
+                if text is not None:
+                    page.click(_text_selector(selector, text))
+                    return
+                index = _index(page.eval_on_selector_all(selector, _LIST_TEXTS), option)
+                page.query_selector_all(selector)[index].click()
+            elif isinstance(self.selector, list):
+                if text is not None:
+                    index = self.options.index(text)
+                else:
+                    index = _index(page.evaluate(_QUERY_TEXTS, self.selector), option)
+                page.click(self.selector[index])
+            else:
+                raise Exception
+
+    async def aconfigure(self, page, option: str):
+        """
+        Configures the filter query to ``option``, using an asynchronous ``Playwright`` page.
+
+        :param page: The asynchronous ``Playwright`` page
+        :param option: The option to configure the filter query to
+        """
+        with metrics.stage("configure", self.parser):
+            text = _catalog_text(self.options, option)
+            if isinstance(self.selector, str):
+                selector = f"{self.selector} {self.descendant}"
+                if text is not None:
+                    await page.click(_text_selector(selector, text))
+                    return
+                index = _index(await page.eval_on_selector_all(selector, _LIST_TEXTS), option)
+                elems = await page.query_selector_all(selector)
+                await elems[index].click()
+            elif isinstance(self.selector, list):
+                if text is not None:
+                    index = self.options.index(text)
+                else:
+                    index = _index(await page.evaluate(_QUERY_TEXTS, self.selector), option)
+                await page.click(self.selector[index])
+            else:
+                raise Exception
 
 
 class Dropdowns:
     """
     Manage dropdown-class filter queries.
     """
-    def __init__(self, soup, selector, descendants="", dd_options=None):
-        self.soup = soup
+    def __init__(self, parser, selector, descendants="", dd_options=None, *, options=None):
+        """
+        :param parser: The object (usually the scraper) whose ``soup`` attribute holds the parsed page
+        :param selector: The CSS selector of the dropdown
+        :param descendants: The CSS selector of the options, relative to the options container
+        :param dd_options: The CSS selector of the options container, if it is not ``selector``
+        :param options: The catalogued options of the filter query, which allow options to be located without reading the page
+        """
+        self.parser = parser
         self.selector = selector
         self.descendants = descendants
         self.dd_options = dd_options
+        self.options = options
+        self._options_css = compile_selector(self._options_selector())
+        self._value_css = compile_selector(selector)
+        self._highlight_css = compile_selector(f"{selector} {descendants}")
+        self._text_css = compile_selector(f"{selector} > div > span")
+
+    @property
+    def soup(self):
+        """
+        The ``bs4.BeautifulSoup`` object of :py:attr:`parser`.
+        """
+        return self.parser.soup
 
     def list_options(self):
-        if self.dd_options:
-            elems = self.soup.select(f"{self.dd_options} {self.descendants}")
-            options = [e.getText() for e in elems]
-        else:
-            elems = self.soup.select(f"{self.selector} {self.descendants}")
-            options = [e.getText() for e in elems]
+        elems = self._options_css.select(self.soup)
+        options = [e.getText() for e in elems]
         return options
 
     def current_option(self, opt_type, *, multiple=False):
         if opt_type == 1:
-            elem = self.soup.select(self.selector)[0]
+            elem = self._value_css.select(self.soup, limit=1)[0]
             option = elem.get("value")
         elif opt_type == 2:
-            elems = self.soup.select(f"{self.selector} {self.descendants}")
+            elems = self._highlight_css.select(self.soup)
             option = [
                 e.getText() for e in elems
                 if "highlight-selection" in e.get("class")
@@ -90,40 +293,110 @@ class Dropdowns:
             if not multiple:
                 option = option[0] if option else ""
         elif opt_type == 3:
-            elem = self.soup.select(f"{self.selector} > div > span")[0]
+            elem = self._text_css.select(self.soup, limit=1)[0]
             option = elem.getText()
         else:
             raise Exception
         return option
 
-    async def configure(self, page, option: str):
-        options = [o.lower() for o in self.list_options()]
-        try:
-            index = options.index(option.lower())
-        except ValueError as err:
-            raise fangraphs.exceptions.InvalidFilterOption(option) from err
-        await page.click(self.selector)
-        elem = await page.query_selector_all(
-            f"{self.selector} {self.descendants}"
-        )[index]
-        await elem.click()
+    def state_spec(self, opt_type, *, multiple=False):
+        """
+        :return: How :py:data:`STATE_JS` reads the current option, as :py:meth:`current_option` does
+        :rtype: dict
+        """
+        if opt_type == 1:
+            return {"kind": "value", "selector": self.selector}
+        if opt_type == 2:
+            return {"kind": "highlighted", "selector": f"{self.selector} {self.descendants}", "multiple": multiple}
+        if opt_type == 3:
+            return {"kind": "text", "selector": f"{self.selector} > div > span"}
+        raise Exception
+
+    def _options_selector(self):
+        """
+        :return: The CSS selector matching every option element of the dropdown
+        :rtype: str
+        """
+        return f"{self.dd_options or self.selector} {self.descendants}"
+
+    def configure(self, page, option: str):
+        """
+        Configures the filter query to ``option``, using a synchronous ``Playwright`` page.
+        Catalogued options are located by their text; other options are validated against the live page.
+        Either way, :py:attr:`soup` is not read.
+
+        :param page: The synchronous ``Playwright`` page
+        :param option: The option to configure the filter query to
+        """
+        with metrics.stage("configure", self.parser):
+            selector = self._options_selector()
+            text = _catalog_text(self.options, option)
+            if text is None:
+                index = _index(page.eval_on_selector_all(selector, _LIST_TEXTS), option)
+            page.click(self.selector)
+            if text is not None:
+                page.click(_text_selector(selector, text))
+            else:
+                page.query_selector_all(selector)[index].click()
+
+    async def aconfigure(self, page, option: str):
+        """
+        Configures the filter query to ``option``, using an asynchronous ``Playwright`` page.
+
+        :param page: The asynchronous ``Playwright`` page
+        :param option: The option to configure the filter query to
+        """
+        with metrics.stage("configure", self.parser):
+            selector = self._options_selector()
+            text = _catalog_text(self.options, option)
+            if text is None:
+                index = _index(await page.eval_on_selector_all(selector, _LIST_TEXTS), option)
+            await page.click(self.selector)
+            if text is not None:
+                await page.click(_text_selector(selector, text))
+            else:
+                elems = await page.query_selector_all(selector)
+                await elems[index].click()
 
 
 class Switches:
     """
     Manages checkbox-class filter queries.
     """
-    def __init__(self, soup, selector):
-        self.soup = soup
+    def __init__(self, parser, selector):
+        """
+        :param parser: The object (usually the scraper) whose ``soup`` attribute holds the parsed page
+        :param selector: The CSS selector of the switch
+        """
+        self.parser = parser
         self.selector = selector
+        self._css = compile_selector(selector)
+
+    @property
+    def soup(self):
+        """
+        The ``bs4.BeautifulSoup`` object of :py:attr:`parser`.
+        """
+        return self.parser.soup
 
     def current_option(self, opt_type):
         if opt_type == 1:
-            elem = self.soup.select(self.selector)[0]
+            elem = self._css.select(self.soup, limit=1)[0]
             option = "True" if elem.get("checked") == "checked" else "False"
         elif opt_type == 2:
-            elem = self.soup.select(self.selector)[0]
+            elem = self._css.select(self.soup, limit=1)[0]
             option = "True" if "isActive" in elem.get("class") else "False"
         else:
             raise Exception
         return option
+
+    def state_spec(self, opt_type):
+        """
+        :return: How :py:data:`STATE_JS` reads the current option, as :py:meth:`current_option` does
+        :rtype: dict
+        """
+        if opt_type == 1:
+            return {"kind": "checked", "selector": self.selector}
+        if opt_type == 2:
+            return {"kind": "class", "selector": self.selector, "name": "isActive"}
+        raise Exception
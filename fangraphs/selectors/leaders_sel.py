@@ -28,6 +28,8 @@ class GameSpan:
         "season2": ".controls-stats:nth-child(2) > div:nth-child(3) > .fg-selection-box__selection",
         "determine": ".controls-stats.stat-determined > div:nth-child(1) > .fg-selection-box__selection"
     }
+    page_size = ".fg-data-grid .table-page-control:nth-child(1) select"
+    table = ".fg-data-grid"
     waitfor = ".fg-data-grid.table-type"
 
 
@@ -57,6 +59,8 @@ class International:
     switches = {
         "split_seasons": ".controls-stats > .fg-checkbox"
     }
+    page_size = ".fg-data-grid .table-page-control:nth-child(1) select"
+    table = ".fg-data-grid"
     waitfor = ".fg-data-grid.table-type"
 
 
@@ -105,6 +109,7 @@ class MajorLeague:
         "age1": "#LeaderBoard1_cmdAge",
         "age2": "#LeaderBoard1_cmdAge"
     }
+    table = ".rgMasterTable"
 
 
 class SeasonStat:
@@ -135,6 +140,14 @@ class SeasonStat:
         "plate_discipline": ".season-grid-controls-dropdown-row-stats > div:nth-child(8)",
         "value": ".season-grid-controls-dropdown-row-stats > div:nth-child(9)"
     }
+    pagination = {
+        "table": ".table-scroll",
+        "total": ".table-page-control:nth-last-child(1) > .table-control-total",
+        "next": ".table-page-control:nth-last-child(1) > .next",
+        "input": ".table-page-control:nth-last-child(1) input"
+    }
+    page_size = ".fg-data-grid .table-page-control:nth-child(1) select"
+    table = ".table-scroll"
     waitfor = ".fg-data-grid.undefined"
 
 
@@ -210,6 +223,9 @@ class Splits:
         "split_teams": "#stack-buttons > div:nth-child(2)",
         "auto_pt": "#stack-buttons > div:nth-child(3)"
     }
+    filter_groups = ".fgBin.splits-bin-controller div"
+    page_size = ".fg-data-grid .table-page-control:nth-child(1) select"
+    table = ".fg-data-grid"
     waitfor = ".fg-data-grid.undefined"
 
 
@@ -227,4 +243,5 @@ class WAR:
         "team": "#WARBoard1_rcbTeam_DropDown",
         "type": "#WARBoard1_rcbType_DropDown"
     }
+    table = ".rgMasterTable"
     waitfor = ".rgMasterTable"
@@ -0,0 +1,293 @@
+#! python3
+# tests/fakes.py
+
+"""
+In-memory stand-ins for the ``Playwright`` objects driven by the tests, so no browser is launched.
+
+The stand-ins implement the synchronous API.
+:py:class:`AsyncWrapper` exposes any of them through the asynchronous API instead,
+as well as the generated data grid of :py:class:`fangraphs.benchmarks.fixtures.GridPage`.
+"""
+
+import asyncio
+import itertools
+import os
+
+from fangraphs.benchmarks import fixtures
+
+
+class Fake:
+    """
+    Base class of the stand-ins, which :py:func:`wrap` exposes as coroutines.
+    """
+    _wrapper = None
+
+
+class AsyncWrapper:
+    """
+    Exposes the methods of a synchronous stand-in as coroutines, as ``playwright.async_api`` does.
+    The methods in :py:attr:`synchronous` remain synchronous, and attributes holding stand-ins are wrapped as well.
+    """
+    synchronous = ("is_closed", "is_connected", "expect_download")
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __getattr__(self, name):
+        attr = getattr(self.obj, name)
+        if not callable(attr):
+            return wrap(attr)
+        if name in self.synchronous:
+            return attr
+
+        async def method(*args, **kwargs):
+            return wrap(attr(*args, **kwargs))
+        return method
+
+
+#: The classes whose objects :py:func:`wrap` exposes as coroutines
+WRAPPED = (Fake, fixtures.GridPage, fixtures.GridInput)
+
+
+def wrap(value):
+    """
+    :return: The asynchronous wrapper of a stand-in (the same wrapper each time), or of each stand-in of a list
+    """
+    if isinstance(value, list):
+        return [wrap(v) for v in value]
+    if isinstance(value, WRAPPED):
+        if getattr(value, "_wrapper", None) is None:
+            value._wrapper = AsyncWrapper(value)
+        return value._wrapper
+    return value
+
+
+class Download(Fake):
+    """
+    A download, saved as a file of the downloads directory of the browser.
+    """
+    def __init__(self, path, data):
+        self._path = path
+        with open(path, "w") as file:
+            file.write(data)
+
+    def path(self):
+        return self._path
+
+    def delete(self):
+        os.remove(self._path)
+
+
+class Expectation:
+    """
+    The context manager returned by ``expect_download``, in both the synchronous and the asynchronous API.
+    """
+    def __init__(self, value):
+        self.value = value
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, value, traceback):
+        pass
+
+    async def __aenter__(self):
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(wrap(self.value))
+        return Expectation(future)
+
+    async def __aexit__(self, exc_type, value, traceback):
+        pass
+
+
+class Page(Fake):
+    """
+    A blank page, which records the routes added to it and the URLs it is read at.
+    Once navigated, the page serves :py:attr:`html`, and its **Export Data** button downloads :py:attr:`csv`.
+    """
+    html = "<html></html>"
+    csv = "Name,WAR\nMookie Betts,6.5\n"
+
+    _downloads = itertools.count()
+
+    def __init__(self, context):
+        self.context = context
+        self.url = "about:blank"
+        self.routes = []
+        self.contents = []
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    def route(self, url, handler):
+        self.routes.append(("route", url))
+
+    def route_from_har(self, path, **options):
+        self.routes.append(("har", path, options))
+
+    def unroute(self, url):
+        self.routes = []
+
+    def evaluate(self, expression, arg=None):
+        return None
+
+    def goto(self, url, timeout=None):
+        self.url = url
+
+    def content(self):
+        self.contents.append(self.url)
+        return self.html
+
+    def wait_for_selector(self, selector, **kwargs):
+        pass
+
+    def query_selector(self, selector):
+        return None
+
+    def click(self, selector):
+        pass
+
+    def expect_download(self):
+        path = os.path.join(self.context.browser.downloads_path, f"download-{next(self._downloads)}")
+        return Expectation(Download(path, self.csv))
+
+    def close(self):
+        self.closed = True
+
+
+class Option(Fake):
+    """
+    An option of a dropdown on a :py:class:`FilterPage`.
+    """
+    def __init__(self, page, selector, index):
+        self.page = page
+        self.name = f"{selector}[{index}]"
+
+    def click(self):
+        self.page.actions.append(("click", self.name))
+
+
+class FilterPage(Fake):
+    """
+    A page of filter controls, which records the actions on it.
+    """
+    def __init__(self, url, state, options, html=""):
+        """
+        :param url: The URL of the page
+        :param state: Maps filter queries to their current options, as read by a snapshot of the page
+        :param options: The options of every dropdown on the page
+        :param html: The markup of the page
+        """
+        self.url = url
+        self.state = state
+        self.options = options
+        self.html = html
+        self.actions = []
+
+    def evaluate(self, expression, arg=None):
+        self.actions.append(("evaluate",))
+        return {query: self.state.get(query, "") for query, _ in arg}
+
+    def content(self):
+        return self.html
+
+    def wait_for_selector(self, selector, **kwargs):
+        pass
+
+    def query_selector(self, selector):
+        self.actions.append(("query", selector))
+
+    def eval_on_selector_all(self, selector, expression):
+        return self.options
+
+    def query_selector_all(self, selector):
+        return [Option(self, selector, i) for i in range(len(self.options))]
+
+    def click(self, selector):
+        self.actions.append(("click", selector))
+
+
+class Context(Fake):
+    """
+    A browser context, holding its pages.
+    """
+    def __init__(self, browser):
+        self.browser = browser
+        self.pages = []
+        self.closed = False
+
+    def new_page(self):
+        page = Page(self)
+        self.pages.append(page)
+        return page
+
+    def clear_cookies(self):
+        pass
+
+    def close(self):
+        self.closed = True
+        for page in self.pages:
+            page.closed = True
+        self.pages = []
+
+
+class Browser(Fake):
+    """
+    A browser, holding every context it has created.
+    """
+    def __init__(self, downloads_path="."):
+        self.downloads_path = downloads_path
+        self.contexts = []
+        self.closed = False
+
+    def is_connected(self):
+        return not self.closed
+
+    def new_context(self, **options):
+        context = Context(self)
+        self.contexts.append(context)
+        return context
+
+    def close(self):
+        self.closed = True
+
+
+class Chromium(Fake):
+
+    def __init__(self, play):
+        self.play = play
+
+    def launch(self, **options):
+        browser = Browser(options.get("downloads_path", "."))
+        self.play.browsers.append(browser)
+        return browser
+
+
+class Playwright(Fake):
+    """
+    Stands in for both ``sync_playwright()`` and ``async_playwright()``, recording the browsers it launches.
+    """
+    def __init__(self):
+        self.chromium = Chromium(self)
+        self.browsers = []
+        self.stopped = False
+
+    def start(self):
+        return self
+
+    def stop(self):
+        self.stopped = True
+
+
+def patch_playwright(monkeypatch, module):
+    """
+    Replaces ``sync_playwright`` and ``async_playwright`` in ``module`` with one :py:class:`Playwright`.
+
+    :return: The stand-in, which records the browsers launched through it
+    :rtype: Playwright
+    """
+    play = Playwright()
+    monkeypatch.setattr(module, "sync_playwright", lambda: play)
+    monkeypatch.setattr(module, "async_playwright", lambda: wrap(play))
+    return play
@@ -0,0 +1,145 @@
+#! python3
+# tests/test_api.py
+
+"""
+Tests for :py:mod:`FanGraphs.leaders.api`, run against a local stub server.
+"""
+
+import csv
+import http.server
+import json
+import threading
+import urllib.parse
+
+import pytest
+
+import fangraphs.exceptions
+from fangraphs.leaders import api
+from fangraphs.leaders import leaders
+
+
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Serves canned leaderboard rows and records each request.
+    """
+    requests = []
+
+    def _respond(self, body):
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        url = urllib.parse.urlsplit(self.path)
+        self.requests.append(
+            ("GET", url.path, dict(urllib.parse.parse_qsl(url.query)))
+        )
+        self._respond({"data": [
+            {"Name": "<a href='/players'>Mike Trout</a>", "Season": 2020, "WAR": 1.9},
+            {"Name": "Mookie Betts", "Season": 2020, "WAR": 3.0, "Team": "LAD"}
+        ]})
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        length = int(self.headers["Content-Length"])
+        self.requests.append(
+            ("POST", self.path, json.loads(self.rfile.read(length)))
+        )
+        self._respond([{"playerName": "Juan Soto", "PA": 196}])
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture(name="client")
+def fixture_client():
+    """
+    An API client pointed at a local stub server.
+    """
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    StubHandler.requests.clear()
+    with api.APIClient(base_url=f"http://127.0.0.1:{server.server_port}") as client:
+        yield client
+    server.shutdown()
+    server.server_close()
+
+
+class TestAPIClient:
+    """
+    :py:class:`FanGraphs.leaders.api.APIClient`
+    """
+    def test_fetch(self, client):
+        """
+        Instance method ``APIClient.fetch``.
+        """
+        headers, rows = client.fetch(
+            leaders.SeasonStat, {"stat": "Pitching", "start_season": "2019"}
+        )
+        method, path, params = StubHandler.requests[-1]
+        assert method == "GET"
+        assert path == "/api/leaders/season-grid/data"
+        assert params["position"] == "P"
+        assert params["seasonStart"] == "2019"
+        assert headers == ["Name", "Season", "WAR", "Team"]
+        assert rows == [
+            ["Mike Trout", 2020, 1.9, ""],
+            ["Mookie Betts", 2020, 3.0, "LAD"]
+        ]
+
+    def test_fetch_post(self, client):
+        """
+        Instance method ``APIClient.fetch`` for ``POST`` endpoints.
+        """
+        headers, rows = client.fetch(leaders.Splits, {"stat": "Batting", "split_teams": "True"})
+        method, _, body = StubHandler.requests[-1]
+        assert method == "POST"
+        assert body["strPosition"] == "B"
+        assert body["strSplitTeams"] is True
+        assert headers == ["playerName", "PA"]
+        assert rows == [["Juan Soto", 196]]
+
+    def test_fetch_unmapped(self, client):
+        """
+        Instance method ``APIClient.fetch`` for configurations without an endpoint mapping.
+        """
+        assert client.fetch(leaders.MajorLeague, {}) is None
+        assert client.fetch(leaders.Splits, {"handedness": "vs L"}) is None
+        assert not StubHandler.requests
+
+    def test_fetch_invalid_option(self, client):
+        """
+        Instance method ``APIClient.fetch`` with an option unknown to the endpoint.
+        """
+        with pytest.raises(fangraphs.exceptions.InvalidFilterOption):
+            client.fetch(leaders.SeasonStat, {"stat": "Fielding"})
+
+
+def test_export(client, tmp_path):
+    """
+    Function ``export``.
+    """
+    path = str(tmp_path / "grid.csv")
+    assert api.export(leaders.GameSpan, {"stat": "Batting"}, path, client=client) == path
+    with open(path, newline="") as file:
+        assert list(csv.reader(file)) == [
+            ["Name", "Season", "WAR", "Team"],
+            ["Mike Trout", "2020", "1.9", ""],
+            ["Mookie Betts", "2020", "3.0", "LAD"]
+        ]
+    with pytest.raises(fangraphs.exceptions.InvalidFilterQuery):
+        api.export(leaders.GameSpan, {"nonexistent": "x"}, path, client=client)
+
+
+def test_export_table(client):
+    """
+    Function ``export`` with ``as_table``.
+    """
+    data = api.export(leaders.GameSpan, {"stat": "Batting"}, client=client, as_table=True)
+    assert data.headers == ["Name", "Season", "WAR", "Team"]
+    assert data["Season"].typecode == "q"
+    assert list(data["WAR"]) == [1.9, 3.0]
+    assert data["Team"] == ["", "LAD"]
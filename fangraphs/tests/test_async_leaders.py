@@ -0,0 +1,83 @@
+#! python3
+# tests/test_async_leaders.py
+
+"""
+Tests for :py:mod:`FanGraphs.leaders.async_leaders`, on pages lent by an asynchronous browser pool
+of ``Playwright`` stand-ins (see :py:mod:`fakes`).
+"""
+
+import asyncio
+
+import pytest
+
+from fangraphs.leaders import async_leaders
+from fangraphs.leaders import pool
+from fangraphs.leaders import table
+from fangraphs.tests import fakes
+
+
+@pytest.fixture
+def browser_pool(monkeypatch, tmp_path):
+    """
+    An asynchronous browser pool of one context, which lends :py:class:`fakes.Page` objects.
+    """
+    fakes.patch_playwright(monkeypatch, pool)
+    return pool.AsyncBrowserPool(1, profile=None, downloads_path=tmp_path / "downloads")
+
+
+class TestAsyncWAR:
+    """
+    :py:class:`FanGraphs.leaders.async_leaders.AsyncWAR`
+    """
+    def test_enter(self, browser_pool):
+        """
+        Instance methods ``AsyncWAR.__aenter__`` and ``AsyncWAR.__aexit__``.
+        """
+        async def enter():
+            async with async_leaders.AsyncWAR(browser_pool=browser_pool) as war:
+                page = war.page.obj
+                assert page.url == war.address and page.contents == [war.address]
+                assert war.soup is not None and browser_pool.borrowed == 1
+            assert war.page is None and page.url == "about:blank"
+            assert browser_pool.borrowed == 0 and browser_pool.idle == 1
+            await browser_pool.close()
+        asyncio.run(enter())
+
+    def test_reset(self, browser_pool):
+        """
+        Instance method ``AsyncWAR.reset``.
+        """
+        async def reset():
+            async with async_leaders.AsyncWAR(browser_pool=browser_pool) as war:
+                await war.page.goto("https://fangraphs.com/warleaders.aspx?season=2019")
+                await war.reset()
+                assert war.page.url == war.address
+                assert war.page.contents == [war.address, war.address]
+            await browser_pool.close()
+        asyncio.run(reset())
+
+    def test_export(self, browser_pool, tmp_path):
+        """
+        Instance method ``AsyncWAR.export``.
+        """
+        path = tmp_path / "war.csv"
+
+        async def export():
+            async with async_leaders.AsyncWAR(browser_pool=browser_pool) as war:
+                assert await war.export(str(path)) is None
+                leaderboard = await war.export(as_table=True)
+            await browser_pool.close()
+            return leaderboard
+        leaderboard = asyncio.run(export())
+        assert path.read_text() == fakes.Page.csv
+        assert isinstance(leaderboard, table.Table)
+        assert leaderboard.headers == ["Name", "WAR"] and len(leaderboard) == 1
+        assert not list((tmp_path / "downloads").iterdir())
+
+    def test_enter_sync(self, browser_pool):
+        """
+        Instance method ``AsyncWAR.__enter__``, which is not supported.
+        """
+        with pytest.raises(TypeError):
+            with async_leaders.AsyncWAR(browser_pool=browser_pool):
+                pass
@@ -0,0 +1,174 @@
+#! python3
+# tests/test_batch.py
+
+"""
+Tests for :py:mod:`FanGraphs.leaders.batch`.
+"""
+
+import asyncio
+import os
+
+from fangraphs.leaders import async_leaders
+from fangraphs.leaders import batch
+from fangraphs.leaders import leaders
+
+
+class Scraper:
+    """
+    Records the calls of the batch exporter, in place of an asynchronous scraper.
+    The exports of the jobs in :py:attr:`failing` raise ``RuntimeError``,
+    the next :py:attr:`broken_resets` resets raise ``ConnectionError``,
+    and the next :py:attr:`broken_enters` scrapers cannot borrow a page.
+    """
+    calls = []
+    failing = set()
+    broken_resets = 0
+    broken_enters = 0
+
+    def __init__(self, browser_pool=None, catalog=None):
+        pass
+
+    async def __aenter__(self):
+        if Scraper.broken_enters:
+            Scraper.broken_enters -= 1
+            raise TimeoutError("no page")
+        return self
+
+    async def __aexit__(self, exc_type, value, traceback):
+        self.calls.append(("quit",))
+
+    async def replace_page(self):
+        self.calls.append(("replace",))
+        await self.reset()
+
+    async def reset(self):
+        self.calls.append(("reset",))
+        if Scraper.broken_resets:
+            Scraper.broken_resets -= 1
+            raise ConnectionError("page crashed")
+
+    async def configure_by_url(self, filters):
+        self.calls.append(("configure", dict(filters)))
+
+    async def export(self, path):
+        self.calls.append(("export", os.path.basename(path)))
+        if os.path.basename(path) in self.failing:
+            raise RuntimeError(path)
+
+
+def _exporter(tmp_path, jobs, *, failing=(), broken_resets=0, broken_enters=0, workers=1):
+    """
+    Builds a batch exporter, whose workers drive a :py:class:`Scraper`.
+    """
+    Scraper.calls = []
+    Scraper.failing = set(failing)
+    Scraper.broken_resets = broken_resets
+    Scraper.broken_enters = broken_enters
+    exporter = batch.BatchExporter(
+        leaders.MajorLeague, jobs, workers=workers, path=str(tmp_path / "{index}.csv"), browser_pool=object()
+    )
+    exporter.scraper_cls = Scraper
+    return exporter
+
+
+def test_expand_grid():
+    """
+    Function ``expand_grid``.
+    """
+    jobs = batch.expand_grid({"stat": ["Batting", "Pitching"], "single_season": ["2019", "2020"]})
+    assert jobs == [
+        {"stat": "Batting", "single_season": "2019"},
+        {"stat": "Batting", "single_season": "2020"},
+        {"stat": "Pitching", "single_season": "2019"},
+        {"stat": "Pitching", "single_season": "2020"}
+    ]
+
+
+class TestBatchExporter:
+    """
+    :py:class:`FanGraphs.leaders.batch.BatchExporter`
+    """
+    def test_async_class(self):
+        """
+        Private static method ``BatchExporter._async_class``.
+        """
+        exporter = batch.BatchExporter(leaders.MajorLeague, [{}])
+        assert exporter.scraper_cls is async_leaders.AsyncMajorLeague
+        exporter = batch.BatchExporter(async_leaders.AsyncWAR, [{}])
+        assert exporter.scraper_cls is async_leaders.AsyncWAR
+
+    def test_chunks(self):
+        """
+        Private instance method ``BatchExporter._chunks``.
+        """
+        exporter = batch.BatchExporter(
+            leaders.MajorLeague, {"single_season": [str(y) for y in range(2010, 2017)]}, workers=3
+        )
+        chunks = list(exporter._chunks())
+        assert [len(c) for c in chunks] == [3, 2, 2]
+        assert [i for c in chunks for i, _ in c] == list(range(7))
+
+    def test_configure(self, tmp_path):
+        """
+        Private instance method ``BatchExporter._configure``.
+        """
+        exporter = _exporter(tmp_path, [{}])
+        scraper = Scraper()
+
+        async def configure():
+            await exporter._configure(scraper, None, {"stat": "Batting", "season": "2019"})
+            await exporter._configure(
+                scraper, {"stat": "Batting", "season": "2019"}, {"stat": "batting", "season": "2020"}
+            )
+            await exporter._configure(scraper, {"stat": "Batting", "season": "2020"}, {"stat": "Batting"})
+            await exporter._configure(scraper, {"stat": "Batting"}, {"stat": "Batting"})
+        asyncio.run(configure())
+        assert Scraper.calls == [
+            ("configure", {"stat": "Batting", "season": "2019"}),
+            ("configure", {"season": "2020"}),
+            ("reset",),
+            ("configure", {"stat": "Batting"})
+        ]
+
+    def test_run_failing_job(self, tmp_path):
+        """
+        Instance method ``BatchExporter.run``, with a failing job.
+        """
+        jobs = [{"season": "2019"}, {"season": "2020"}, {"season": "2021"}]
+        report = _exporter(tmp_path, jobs, failing={"1.csv"}).run()
+        assert [f for f, _, _ in report.exported] == [jobs[0], jobs[2]]
+        assert [(f, type(e)) for f, e in report.failed] == [(jobs[1], RuntimeError)]
+        assert Scraper.calls[3:6] == [("export", "1.csv"), ("reset",), ("configure", jobs[2])]
+
+    def test_run_broken_reset(self, tmp_path):
+        """
+        Instance method ``BatchExporter.run``, with a page which cannot be reset after a failing job.
+        """
+        jobs = [{"season": "2019"}, {"season": "2020"}]
+        report = _exporter(tmp_path, jobs, failing={"0.csv"}, broken_resets=1).run()
+        assert [f for f, _, _ in report.exported] == [jobs[1]]
+        (filters, err), = report.failed
+        assert filters == jobs[0]
+        assert isinstance(err, ConnectionError) and isinstance(err.__context__, RuntimeError)
+        assert Scraper.calls[1:5] == [("export", "0.csv"), ("reset",), ("replace",), ("reset",)]
+
+    def test_run_lost_page(self, tmp_path):
+        """
+        Instance method ``BatchExporter.run``, without a fresh page to replace a broken one.
+        """
+        jobs = [{"season": "2019"}, {"season": "2020"}, {"season": "2021"}]
+        report = _exporter(tmp_path, jobs, failing={"0.csv"}, broken_resets=2).run()
+        assert report.exported == []
+        assert [f for f, _ in report.failed] == jobs
+        assert [type(e) for _, e in report.failed] == [RuntimeError, ConnectionError, ConnectionError]
+        assert report.failed[1][1] is report.failed[2][1]
+
+    def test_run_broken_worker(self, tmp_path):
+        """
+        Instance method ``BatchExporter.run``, with a worker which cannot borrow a page.
+        """
+        jobs = [{"season": "2018"}, {"season": "2019"}, {"season": "2020"}, {"season": "2021"}]
+        report = _exporter(tmp_path, jobs, broken_enters=1, workers=2).run()
+        assert [f for f, _, _ in report.exported] == jobs[2:]
+        assert [f for f, _ in report.failed] == jobs[:2]
+        assert all(isinstance(e, TimeoutError) for _, e in report.failed)
@@ -0,0 +1,108 @@
+#! python3
+# tests/test_benchmarks.py
+
+"""
+Tests for :py:mod:`FanGraphs.benchmarks`.
+"""
+
+import json
+
+import requests
+
+from fangraphs import benchmarks
+from fangraphs.benchmarks import fixtures
+from fangraphs.benchmarks import server
+from fangraphs.benchmarks import suite
+from fangraphs.leaders import leaders
+
+
+class TestResult:
+    """
+    :py:class:`FanGraphs.benchmarks.Result`
+    """
+    def test_percentile(self):
+        """
+        Instance method ``Result.percentile``.
+        """
+        result = benchmarks.Result("case", [i / 1000 for i in range(100, 0, -1)], 0)
+        assert result.percentile(50) == 0.05
+        assert result.percentile(99) == 0.099
+        assert result.percentile(100) == 0.1
+        assert result.summary()["p90_ms"] == 90
+
+
+def test_measure():
+    """
+    Function ``measure``.
+    """
+    calls = []
+    result = benchmarks.measure("case", lambda: calls.append(bytearray(2 ** 16)), repeat=5, warmup=2)
+    assert len(result.timings) == 5
+    assert len(calls) == 8
+    assert result.peak_memory >= 2 ** 16
+
+
+def test_grid():
+    """
+    Function ``fixtures.grid``.
+    """
+    headers, rows = fixtures.grid(rows=3, columns=2)
+    assert headers == ["Name", "Team", "S0", "S1"]
+    assert [r[:2] for r in rows] == [["Player 0", "TM"], ["Player 1", "TM"], ["Player 2", "TM"]]
+    assert all(len(r) == 4 for r in rows)
+
+
+def test_load(tmp_path):
+    """
+    Function ``fixtures.load``, from the archive of a page.
+    """
+    entries = [
+        {"request": {"url": leaders.WAR.address},
+         "response": {"status": 200, "redirectURL": "", "content": {"text": "<html>WAR</html>"}}},
+    ]
+    (tmp_path / "warleaders_aspx.har").write_text(json.dumps({"log": {"entries": entries}}))
+    assert fixtures.load(leaders.WAR, tmp_path) == "<html>WAR</html>"
+    assert fixtures.load(leaders.Splits, tmp_path) is None
+
+
+def test_grid_scraper():
+    """
+    Function ``fixtures.grid_scraper``.
+    """
+    headers, rows = fixtures.grid(rows=25, columns=2)
+    instance, browser_pool = fixtures.grid_scraper(headers, rows, page_sizes=("10",), has_input=False)
+    assert list(instance.iter_rows(typed=False)) == rows
+    assert instance.page.clicks == instance.page.waits == 2
+    assert instance.headers() == headers
+    assert browser_pool.borrowed == 1
+
+
+def test_pagination_cases():
+    """
+    Function ``suite.pagination_cases``.
+    """
+    results = suite.pagination_cases(page_sizes=(10,), rows=25, partitions=2, repeat=2)
+    assert [r.name for r in results] == [
+        "iter_rows[25 rows, 10 rows/page]", "iter_rows[25 rows, 10 rows/page, 2 partitions]",
+        "export[25 rows, 10 rows/page]"
+    ]
+    assert all(len(r.timings) == 2 for r in results)
+
+
+def test_stub_server():
+    """
+    Class ``server.StubServer``.
+    """
+    with server.StubServer({"/data": b'{"data": []}'}) as stub:
+        assert requests.get(f"{stub.url}/data?season=2020").json() == {"data": []}
+        assert requests.post(f"{stub.url}/other", json={}).status_code == 404
+        assert stub.requests == 2
+
+
+def test_export_cases():
+    """
+    Function ``suite.export_cases``.
+    """
+    results = suite.export_cases(rows=10, repeat=2)
+    assert results[0].name == "api_export[csv, 10 rows]"
+    assert all(len(r.timings) == 2 for r in results)
@@ -0,0 +1,81 @@
+#! python3
+# FanGraphs/tests/test_blocking.py
+
+import pytest
+
+from fangraphs.leaders import blocking
+
+
+class Route:
+    """
+    Records whether a routed request was aborted or passed on.
+    """
+    def __init__(self, url, resource_type):
+        self.request = type("Request", (), {"url": url, "resource_type": resource_type})()
+        self.outcome = None
+
+    def abort(self):
+        self.outcome = "abort"
+
+    def fallback(self):
+        self.outcome = "fallback"
+
+
+class Page:
+    """
+    Stores the handler installed by :py:meth:`fangraphs.leaders.blocking.ResourceProfile.route`.
+    """
+    def __init__(self):
+        self.handlers = {}
+
+    def route(self, url, handler):
+        self.handlers[url] = handler
+
+
+class TestResourceProfile:
+
+    @pytest.mark.parametrize(
+        "url, resource_type, blocked",
+        [
+            ("https://www.fangraphs.com/leaders.aspx", "document", False),
+            ("https://www.fangraphs.com/api/leaders/war", "xhr", False),
+            ("https://www.fangraphs.com/logo.png", "image", True),
+            ("https://fonts.gstatic.com/roboto.woff2", "font", True),
+            ("https://g.ezoic.net/ezoic/ad.js", "script", True),
+            ("https://securepubads.g.doubleclick.net/tag/js/gpt.js", "script", True),
+            ("https://notdoubleclick.net/app.js", "script", False),
+        ]
+    )
+    def test_blocks(self, url, resource_type, blocked):
+        """
+        Instance method ``ResourceProfile.blocks``.
+        """
+        assert blocking.DEFAULT_PROFILE.blocks(url, resource_type) is blocked
+
+    def test_blocks_allow(self):
+        """
+        Instance method ``ResourceProfile.blocks``, given an allow-list.
+        """
+        profile = blocking.ResourceProfile()
+        assert not profile.blocks("https://www.fangraphs.com/logo.png", "image", ("image",))
+        assert not profile.blocks("https://cdn.fangraphs.com/fonts/a.woff2", "font", ("cdn.fangraphs.com",))
+        assert profile.blocks("https://fonts.gstatic.com/a.woff2", "font", ("cdn.fangraphs.com",))
+
+    def test_blocks_ads(self):
+        """
+        Instance property ``ResourceProfile.blocks_ads``.
+        """
+        assert blocking.DEFAULT_PROFILE.blocks_ads
+        assert not blocking.ResourceProfile(block_hosts=()).blocks_ads
+
+    def test_route(self):
+        """
+        Instance method ``ResourceProfile.route``.
+        """
+        page = Page()
+        blocking.ResourceProfile().route(page)
+        handler = page.handlers["**/*"]
+        image, document = Route("https://a.com/b.png", "image"), Route("https://a.com/", "document")
+        handler(image)
+        handler(document)
+        assert (image.outcome, document.outcome) == ("abort", "fallback")
@@ -0,0 +1,132 @@
+#! python3
+# tests/test_cache.py
+
+"""
+Tests for :py:mod:`FanGraphs.leaders.cache`.
+"""
+
+import datetime
+import multiprocessing
+import os
+
+import pytest
+
+from fangraphs.leaders import cache
+from fangraphs.leaders import leaders
+
+
+@pytest.fixture(name="export_file")
+def fixture_export_file(tmp_path):
+    """
+    A small exported CSV file.
+    """
+    path = tmp_path / "export.csv"
+    path.write_text("Name,WAR\nMike Trout,8.3\n")
+    return str(path)
+
+
+def _put(directory, source, season):
+    cache.ExportCache(directory).put(leaders.WAR, {"season": str(season)}, source)
+
+
+class TestExportCache:
+    """
+    :py:class:`FanGraphs.leaders.cache.ExportCache`
+    """
+    def test_key(self):
+        """
+        Static method ``ExportCache.key``.
+        """
+        key = cache.ExportCache.key(leaders.WAR, {"season": "2019", "TEAM": "All"})
+        assert key == cache.ExportCache.key(leaders.WAR, {"team": "all", "Season": 2019})
+        assert key != cache.ExportCache.key(leaders.MajorLeague, {"season": "2019", "team": "all"})
+
+    def test_get_put(self, tmp_path, export_file):
+        """
+        Instance methods ``ExportCache.get`` and ``ExportCache.put``.
+        """
+        export_cache = cache.ExportCache(str(tmp_path / "cache"))
+        filters = {"season": "2019"}
+        assert export_cache.get(leaders.WAR, filters) is None
+        export_cache.put(leaders.WAR, filters, export_file)
+        path = export_cache.get(leaders.WAR, filters)
+        with open(path) as file:
+            assert file.read() == "Name,WAR\nMike Trout,8.3\n"
+        assert cache.ExportCache(str(tmp_path / "cache")).get(leaders.WAR, filters) == path
+
+    def test_current_season_ttl(self, tmp_path, export_file):
+        """
+        Instance method ``ExportCache.put`` for leaderboards of the current season.
+        """
+        export_cache = cache.ExportCache(str(tmp_path / "cache"), current_ttl=-1)
+        year = str(datetime.date.today().year)
+        export_cache.put(leaders.WAR, {"season": "2019"}, export_file)
+        export_cache.put(leaders.WAR, {"season": year}, export_file)
+        export_cache.put(leaders.WAR, {}, export_file)
+        assert export_cache.get(leaders.WAR, {"season": "2019"}) is not None
+        assert export_cache.get(leaders.WAR, {"season": year}) is None
+        assert export_cache.get(leaders.WAR, {}) is None
+
+    def test_season_switch_ttl(self, tmp_path, export_file):
+        """
+        Instance method ``ExportCache.put`` for leaderboards whose switches, but no season queries, name seasons.
+        """
+        export_cache = cache.ExportCache(str(tmp_path / "cache"), current_ttl=-1)
+        export_cache.put(leaders.MajorLeague, {"split_seasons": "true"}, export_file)
+        export_cache.put(leaders.MajorLeague, {"split_seasons": "true", "season1": "2015", "season2": "2016"}, export_file)
+        assert export_cache.get(leaders.MajorLeague, {"split_seasons": "true"}) is None
+        assert export_cache.get(
+            leaders.MajorLeague, {"split_seasons": "true", "season1": "2015", "season2": "2016"}
+        ) is not None
+
+    def test_parallel_put(self, tmp_path, export_file):
+        """
+        Instance method ``ExportCache.put`` from parallel processes.
+        """
+        directory = str(tmp_path / "cache")
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(4) as workers:
+            workers.starmap(_put, [(directory, export_file, season) for season in range(2000, 2016)])
+        export_cache = cache.ExportCache(directory)
+        for season in range(2000, 2016):
+            assert export_cache.get(leaders.WAR, {"season": str(season)}) is not None
+        assert len(os.listdir(directory)) == 16 + 2
+
+    def test_lru_eviction(self, tmp_path, export_file):
+        """
+        Instance method ``ExportCache.put`` exceeding ``ExportCache.max_size``.
+        """
+        export_cache = cache.ExportCache(str(tmp_path / "cache"), max_size=50)
+        export_cache.put(leaders.WAR, {"season": "2017"}, export_file)
+        export_cache.put(leaders.WAR, {"season": "2018"}, export_file)
+        export_cache.get(leaders.WAR, {"season": "2017"})
+        export_cache.put(leaders.WAR, {"season": "2019"}, export_file)
+        assert export_cache.get(leaders.WAR, {"season": "2017"}) is not None
+        assert export_cache.get(leaders.WAR, {"season": "2018"}) is None
+        assert export_cache.get(leaders.WAR, {"season": "2019"}) is not None
+
+    def test_put_evicted(self, tmp_path, export_file, monkeypatch):
+        """
+        Instance method ``ExportCache.put``, for files which are evicted before the older entries, or cannot be kept.
+        """
+        monkeypatch.setattr(cache.time, "time", lambda: 1000.0)
+        export_cache = cache.ExportCache(str(tmp_path / "cache"), max_size=50)
+        export_cache.put(leaders.WAR, {"season": "2017"}, export_file)
+        export_cache.put(leaders.WAR, {"season": "2018"}, export_file)
+        path = export_cache.put(leaders.WAR, {"season": "2019"}, export_file)
+        assert path is not None and os.path.exists(path)
+        assert export_cache.get(leaders.WAR, {"season": "2019"}) == path
+
+        assert cache.ExportCache(str(tmp_path / "small"), max_size=10).put(leaders.WAR, {}, export_file) is None
+        expired = cache.ExportCache(str(tmp_path / "expired"), current_ttl=-1)
+        assert expired.put(leaders.WAR, {"season": str(datetime.date.today().year)}, export_file) is None
+
+    def test_export_hit(self, tmp_path, export_file):
+        """
+        Instance method ``ExportCache.export`` for cached leaderboards.
+        """
+        export_cache = cache.ExportCache(str(tmp_path / "cache"))
+        export_cache.put(leaders.WAR, {"season": "2019"}, export_file)
+        path = export_cache.export(leaders.WAR, {"season": "2019"}, str(tmp_path / "war.csv"))
+        with open(path) as file:
+            assert file.read() == "Name,WAR\nMike Trout,8.3\n"
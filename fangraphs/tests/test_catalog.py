@@ -0,0 +1,157 @@
+#! python3
+# tests/test_catalog.py
+
+"""
+Tests for :py:mod:`FanGraphs.leaders.catalog`.
+"""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+import fangraphs.exceptions
+from fangraphs.benchmarks import fixtures
+from fangraphs.leaders import async_leaders
+from fangraphs.leaders import catalog
+from fangraphs.leaders import leaders
+
+
+class WAR:
+    """
+    Stands in for an entered :py:class:`FanGraphs.leaders.leaders.WAR` scraper.
+    """
+    options = {
+        "season": ["2020", "2019"],
+        "team": ["All Teams", "Angels"],
+        "type": ["All", "Pitchers"]
+    }
+
+    def list_queries(self):
+        return list(self.options)
+
+    def __init__(self, catalog=None):
+        self.catalog = catalog
+
+    def list_options(self, query):
+        assert self.catalog is None
+        return self.options[query]
+
+
+class Pool:
+    """
+    Lends blank pages, in place of a browser pool.
+    """
+    def acquire(self, allow=(), archive=None):
+        return fixtures.SnapshotPage("<html></html>")
+
+
+class AsyncPool:
+    """
+    Lends blank pages, in place of an asynchronous browser pool.
+    """
+    async def acquire(self, allow=(), archive=None):
+        return fixtures.SnapshotPage("<html></html>")
+
+
+class TestOptionCatalog:
+    """
+    :py:class:`FanGraphs.leaders.catalog.OptionCatalog`
+    """
+    def test_fill(self, tmp_path):
+        """
+        Instance methods ``OptionCatalog.fill`` and ``OptionCatalog.list_options``.
+        """
+        option_catalog = catalog.OptionCatalog(str(tmp_path))
+        assert option_catalog.list_options(leaders.WAR, "team") is None
+        assert option_catalog.is_stale(leaders.WAR)
+        option_catalog.fill(WAR(option_catalog))
+        reloaded = catalog.OptionCatalog(str(tmp_path))
+        assert reloaded.list_options(leaders.WAR, "TEAM") == ["All Teams", "Angels"]
+        assert reloaded.list_queries(leaders.WAR) == ["season", "team", "type"]
+        assert not reloaded.is_stale(leaders.WAR)
+        with pytest.raises(fangraphs.exceptions.InvalidFilterQuery):
+            reloaded.list_options(leaders.WAR, "league")
+
+    def test_version(self, tmp_path):
+        """
+        Instance method ``OptionCatalog.load`` for catalogs of another version.
+        """
+        option_catalog = catalog.OptionCatalog(str(tmp_path))
+        option_catalog.fill(WAR())
+        path = tmp_path / "WAR.json"
+        data = json.loads(path.read_text())
+        data["version"] = catalog.CATALOG_VERSION + 1
+        path.write_text(json.dumps(data))
+        assert catalog.OptionCatalog(str(tmp_path)).load(leaders.WAR) is None
+
+    def test_validate(self, tmp_path):
+        """
+        Instance method ``OptionCatalog.validate``.
+        """
+        option_catalog = catalog.OptionCatalog(str(tmp_path))
+        assert option_catalog.validate(leaders.WAR, {"team": "Yankees"}) == {}
+        option_catalog.fill(WAR())
+        assert option_catalog.validate(leaders.WAR, {"team": "angels", "season": 2019}) == {}
+        assert option_catalog.validate(leaders.WAR, {"team": "Yankees", "type": "All"}) == {"team": "Yankees"}
+        with pytest.raises(fangraphs.exceptions.InvalidFilterQuery):
+            option_catalog.validate(leaders.WAR, {"league": "AL"})
+
+
+class TestCatalogedScraper:
+    """
+    Scrapers of :py:mod:`FanGraphs.leaders.leaders` given an option catalog.
+    """
+    def test_list_options(self, tmp_path):
+        """
+        Instance method ``WAR.list_options``, with a catalog.
+        """
+        option_catalog = catalog.OptionCatalog(str(tmp_path))
+        option_catalog.fill(WAR())
+        scraper = leaders.WAR(catalog=option_catalog)
+        assert scraper.list_options("Team") == ["All Teams", "Angels"]
+        with pytest.raises(fangraphs.exceptions.InvalidFilterQuery):
+            scraper.list_options("league")
+
+        scraper.page = fixtures.SnapshotPage(
+            '<div id="WARBoard1_rcbTeam_DropDown"><div><ul><li>Yankees</li></ul></div></div>'
+        )
+        scraper._refresh_parser()
+        assert scraper.list_options("Team") == ["Yankees"]
+
+    def test_ensure(self, tmp_path, monkeypatch):
+        """
+        Private instance method ``ScrapingUtilities._ensure_catalog``, when a page is borrowed.
+        """
+        calls = []
+        monkeypatch.setattr(catalog.OptionCatalog, "refresh", lambda self, cls: calls.append(("refresh", cls)))
+        monkeypatch.setattr(
+            catalog.OptionCatalog, "refresh_in_background", lambda self, cls: calls.append(("background", cls))
+        )
+        option_catalog = catalog.OptionCatalog(str(tmp_path))
+        scraper = leaders.WAR(browser_pool=Pool(), catalog=option_catalog)
+        async_scraper = async_leaders.AsyncWAR(browser_pool=AsyncPool(), catalog=option_catalog)
+        assert calls == []
+        scraper._browser_init()
+        asyncio.run(async_scraper._browser_init())
+        assert calls == [("refresh", leaders.WAR), ("background", async_leaders.AsyncWAR)]
+
+        option_catalog.fill(WAR())
+        scraper._browser_init()
+        asyncio.run(async_scraper._browser_init())
+        assert len(calls) == 2
+        assert scraper._dropdowns["team"].options == ["All Teams", "Angels"]
+
+    def test_refresh_in_background(self, tmp_path, monkeypatch):
+        """
+        Instance method ``OptionCatalog.refresh_in_background``, for a page which is already being re-catalogued.
+        """
+        release = threading.Event()
+        monkeypatch.setattr(catalog.OptionCatalog, "refresh", lambda self, cls: release.wait(5))
+        option_catalog = catalog.OptionCatalog(str(tmp_path))
+        thread = option_catalog.refresh_in_background(async_leaders.AsyncWAR)
+        assert option_catalog.refresh_in_background(leaders.WAR) is thread
+        release.set()
+        thread.join()
+        assert option_catalog.refresh_in_background(leaders.WAR) is not thread
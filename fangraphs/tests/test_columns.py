@@ -0,0 +1,104 @@
+#! python3
+# tests/test_columns.py
+
+"""
+Tests for :py:mod:`FanGraphs.leaders.columns`.
+"""
+
+import math
+
+import pytest
+
+from fangraphs.leaders import columns
+
+
+@pytest.fixture(name="vectorized", params=[True, False], ids=["numpy", "python"])
+def fixture_vectorized(request, monkeypatch):
+    """
+    Runs a test with and without ``numpy``.
+    """
+    if request.param:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(columns, "numpy", None)
+    return request.param
+
+
+class TestConvert:
+    """
+    :py:func:`FanGraphs.leaders.columns.convert`
+    """
+    def test_kinds(self, vectorized):
+        """
+        Conversion of each kind of column.
+        """
+        assert list(columns.convert(["53", " 55"], "int")) == [53, 55]
+        assert list(columns.convert(["1", "2"], "float")) == [1.0, 2.0]
+        assert list(columns.convert(["25.3 %", "8.0%"], "percent")) == pytest.approx([0.253, 0.08])
+        assert list(columns.convert(["$12.4", "-$1.5"], "dollars")) == [12.4, -1.5]
+        assert list(columns.convert(["183.2", "45", "0.1"], "innings")) == pytest.approx([183 + 2 / 3, 45, 1 / 3])
+        assert columns.convert(["001", "002"], "text") == ["001", "002"]
+
+    def test_percent(self, vectorized):
+        """
+        Conversion of percent columns, whose cells may lack their percent sign.
+        """
+        assert list(columns.convert(["25.3 %", "10.0"], "percent")) == pytest.approx([0.253, 0.1])
+        assert list(columns.convert(["25.3 %", "10.0"])) == pytest.approx([0.253, 10.0])
+        percents = columns.convert(["5", "", "12.5%"], "percent")
+        assert percents[0] == pytest.approx(0.05) and math.isnan(percents[1]) and percents[2] == 0.125
+        assert list(columns.convert([0.253, 0.1], "percent")) == [0.253, 0.1]
+
+    def test_inferred(self, vectorized):
+        """
+        Conversion of columns missing from the registry.
+        """
+        ints = columns.convert(["1", 2])
+        assert ints.typecode == "q" and list(ints) == [1, 2]
+        floats = columns.convert(["-0.4", ""])
+        assert floats.typecode == "d" and floats[0] == -0.4 and math.isnan(floats[1])
+        assert columns.convert(["LAA", "3"]) == ["LAA", "3"]
+        assert columns.convert(["", None]) == ["", ""]
+        assert columns.convert([]) == []
+
+    def test_numbers(self, vectorized):
+        """
+        Conversion of cells which are already numbers.
+        """
+        assert columns.convert([1.5, 2], "float").typecode == "d"
+        assert columns.convert([1, 2]).typecode == "q"
+
+
+class TestSchema:
+    """
+    :py:func:`FanGraphs.leaders.columns.schema` and :py:func:`FanGraphs.leaders.columns.register`
+    """
+    def test_schema(self):
+        """
+        Function ``schema``.
+        """
+        assert columns.schema("Pitching")["IP"] == "innings"
+        assert "IP" not in columns.schema("batting")
+        merged = columns.schema()
+        assert merged["Inn"] == "innings" and merged["wRC+"] == "int"
+        with pytest.raises(KeyError):
+            columns.schema("baserunning")
+
+    def test_group_schema(self):
+        """
+        Function ``group_schema``.
+        """
+        assert columns.group_schema("Pitching") == columns.schema("pitching")
+        assert columns.group_schema("Fielding")["Inn"] == "innings"
+        assert columns.group_schema("Dashboard") == columns.schema()
+        assert columns.group_schema(None) == columns.schema()
+
+    def test_register(self, monkeypatch):
+        """
+        Function ``register``.
+        """
+        monkeypatch.setattr(columns, "SCHEMAS", {"batting": {}})
+        columns.register("batting", {"Barrel%": "percent"})
+        assert columns.schema("batting") == {"Barrel%": "percent"}
+        with pytest.raises(ValueError):
+            columns.register("batting", {"EV": "speed"})
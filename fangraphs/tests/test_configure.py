@@ -0,0 +1,141 @@
+#! python3
+# tests/test_configure.py
+
+"""
+Tests for :py:meth:`FanGraphs.leaders.ScrapingUtilities.configure_many`,
+driven by the in-memory page of filter controls of :py:mod:`fakes`.
+"""
+
+import asyncio
+
+import pytest
+
+import fangraphs.exceptions
+from fangraphs.leaders import _is_current
+from fangraphs.leaders import async_leaders
+from fangraphs.leaders import leaders
+from fangraphs.tests import fakes
+
+SEASONS = ["2019", "2020", "2021"]
+STATE = {"season1": "2020", "season2": "2020", "split_teams": "False", "age1": "14"}
+
+
+def major_league_page():
+    """
+    :return: A page of the filter controls of ``MajorLeague``, whose current options are those of :py:data:`STATE`
+    :rtype: fakes.FilterPage
+    """
+    return fakes.FilterPage(leaders.MajorLeague.address, STATE, SEASONS, '<input id="LeaderBoard1_cbTeams">')
+
+
+class BlankPage(fakes.FilterPage):
+    """
+    A borrowed page which has not been navigated yet.
+    """
+    def __init__(self):
+        super().__init__("about:blank", STATE, SEASONS)
+
+    def wait_for_selector(self, selector, **kwargs):
+        raise AssertionError(f"waited for {selector} on a blank page")
+
+    def content(self):
+        raise AssertionError("parsed a blank page")
+
+
+class AsyncPool:
+    """
+    Lends :py:class:`BlankPage` objects.
+    """
+    async def acquire(self, allow=(), archive=None):
+        return fakes.wrap(BlankPage())
+
+
+def _clicks(page):
+    return [a[1] for a in page.actions if a[0] == "click"]
+
+
+class TestMajorLeague:
+
+    filters = {"season1": "2019", "Season2": "2021", "split_teams": "True", "age1": "14"}
+
+    def _check(self, page, configured):
+        assert configured == ["season1", "season2", "split_teams"]
+        clicks = _clicks(page)
+        assert clicks.count("#LeaderBoard1_btnMSeason") == 1
+        assert "#LeaderBoard1_cmdAge" not in clicks
+        assert clicks[-1] == "#LeaderBoard1_btnMSeason"
+        assert "#LeaderBoard1_cbTeams" in clicks
+        assert page.actions.count(("evaluate",)) == 1
+        assert page.actions.count(("query", ".ezmob-footer-close")) == 1
+
+    def test_configure_many(self):
+        """
+        Instance method ``MajorLeague.configure_many``.
+        """
+        scraper = leaders.MajorLeague()
+        scraper.page = major_league_page()
+        scraper._refresh_parser()
+        self._check(scraper.page, scraper.configure_many(self.filters))
+
+    def test_configure_many_async(self):
+        """
+        Instance method ``AsyncMajorLeague.configure_many``.
+        """
+        scraper = async_leaders.AsyncMajorLeague()
+        scraper.page = fakes.wrap(major_league_page())
+
+        async def configure_many():
+            await scraper._refresh_parser()
+            return await scraper.configure_many(self.filters)
+        self._check(scraper.page.obj, asyncio.run(configure_many()))
+
+    def test_browser_init_async(self):
+        """
+        Private instance method ``AsyncMajorLeague._browser_init``, which does not read the blank page.
+        """
+        scraper = async_leaders.AsyncMajorLeague(browser_pool=AsyncPool())
+        asyncio.run(scraper._browser_init())
+        assert scraper.page.url == "about:blank" and scraper.page.actions == []
+
+    def test_configure_many_current(self):
+        """
+        Instance method ``MajorLeague.configure_many``, with every filter query already set.
+        """
+        scraper = leaders.MajorLeague()
+        scraper.page = major_league_page()
+        assert scraper.configure_many({"season1": "2020", "SPLIT_TEAMS": False}) == []
+        assert scraper.page.actions == [("evaluate",)]
+
+    def test_configure_many_no_update(self):
+        """
+        Instance method ``MajorLeague.configure_many``, without submitting the filters.
+        """
+        scraper = leaders.MajorLeague()
+        scraper.page = major_league_page()
+        scraper.configure_many({"season1": "2019"}, autoupdate=False)
+        assert "#LeaderBoard1_btnMSeason" not in _clicks(scraper.page)
+
+    def test_configure_many_invalid(self):
+        """
+        Instance method ``MajorLeague.configure_many``, with an invalid filter query.
+        """
+        scraper = leaders.MajorLeague()
+        scraper.page = major_league_page()
+        with pytest.raises(fangraphs.exceptions.InvalidFilterQuery):
+            scraper.configure_many({"season1": "2019", "league_of_its_own": "x"})
+        assert _clicks(scraper.page) == []
+
+
+@pytest.mark.parametrize("current, option, expected", [
+    ("Batting", "batting", True),
+    ("Batting", "Pitching", False),
+    ("True", True, True),
+    (["vs LHP", "Home"], "home", True),
+    ([], "Home", False),
+    (None, "", False)
+])
+def test_is_current(current, option, expected):
+    """
+    Private function ``_is_current``.
+    """
+    assert _is_current(current, option) is expected
@@ -7,35 +7,62 @@ The docstring in each test identifies the class attribute(s)/method(s) being tes
 """
 
 import bs4
-from playwright.sync_api import sync_playwright
 import pytest
 import requests
 
+from fangraphs.leaders import replay
 from fangraphs.selectors import leaders_sel
 
 
+def fetch_archive(address):
+    """
+    Looks up the archive of the FanGraphs page.
+    Skips the test if the archive is replayed, but has not been recorded.
+
+    :param address: The base URL address of the FanGraphs page
+    :return: The archive of the page
+    :rtype: replay.Archive
+    """
+    archive = replay.Archive(replay.archive_name(address))
+    if archive.replaying and not archive.recorded:
+        pytest.skip(
+            f"No archive at {archive.path}; record it with FANGRAPHS_REPLAY=record"
+        )
+    return archive
+
+
 def fetch_soup(address, waitfor=""):
     """
-    Initializes the ``bs4.BeautifulSoup`` object for parsing the FanGraphs page
+    Initializes the ``bs4.BeautifulSoup`` object for parsing the FanGraphs page.
+    The page is served from its recorded archive, if any (see :py:mod:`fangraphs.leaders.replay`).
 
     :param address: The base URL address of the FanGraphs page
     :param waitfor: The CSS selector to wait for
     :return: A ``BeautifulSoup`` object for parsing the page
     :rtype: bs4.BeautifulSoup
     """
-    with sync_playwright() as play:
-        browser = play.chromium.launch()
-        page = browser.new_page()
-        page.goto(address, timeout=0)
-        if waitfor:
-            page.wait_for_selector(waitfor)
+    archive = fetch_archive(address)
+    with replay.open_page(address, waitfor=waitfor, archive=archive) as page:
         soup = bs4.BeautifulSoup(
             page.content(), features="lxml"
         )
-        browser.close()
     return soup
 
 
+def fetch_status(address):
+    """
+    Requests the FanGraphs page, or looks up its recorded response if its archive is replayed.
+
+    :param address: The base URL address of the FanGraphs page
+    :return: The HTTP status code of the page
+    :rtype: int
+    """
+    archive = fetch_archive(address)
+    if archive.replaying:
+        return archive.status(address)
+    return requests.get(address).status_code
+
+
 class TestMajorLeague:
     """
     :py:class:`FanGraphs.leaders.MajorLeague`
@@ -60,8 +87,7 @@ class TestMajorLeague:
         """
         Class attribute ``MajorLeagueLeaderboards.address``.
         """
-        res = requests.get(self.address)
-        assert res.status_code == 200
+        assert fetch_status(self.address) == 200
 
     @pytest.mark.parametrize(
         "selectors",
@@ -180,8 +206,7 @@ class TestSplits:
         """
         Class attribute ``SplitsLeaderboards.address``.
         """
-        res = requests.get(self.address)
-        assert res.status_code == 200
+        assert fetch_status(self.address) == 200
 
     def test_list_options_selections(self):
         """
@@ -363,8 +388,7 @@ class TestSeasonStatGrid:
         """
         Class attribute ``SeasonStatGrid.address``
         """
-        res = requests.get(self.address)
-        assert res.status_code == 200
+        assert fetch_status(self.address) == 200
 
     def test_list_options_selections(self):
         """
@@ -486,8 +510,7 @@ class TestGameSpan:
         """
         Class attribute ``GameSpanLeaderboards.address``.
         """
-        res = requests.get(self.address)
-        assert res.status_code == 200
+        assert fetch_status(self.address) == 200
 
     def test_list_options_selections(self):
         """
@@ -610,8 +633,7 @@ class TestInternational:
         """
         Class attribute ``InternationalLeaderboards.address``.
         """
-        res = requests.get(self.address)
-        assert res.status_code == 200
+        assert fetch_status(self.address) == 200
 
     def test_list_options_selections(self):
         """
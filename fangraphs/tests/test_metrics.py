@@ -0,0 +1,86 @@
+#! python3
+# tests/test_metrics.py
+
+"""
+Tests for :py:mod:`FanGraphs.leaders.metrics`.
+"""
+
+import logging
+
+import pytest
+
+from fangraphs.benchmarks import fixtures
+from fangraphs.leaders import leaders
+from fangraphs.leaders import metrics
+
+
+@pytest.fixture
+def events():
+    """
+    Collects the events emitted during a test.
+    """
+    collected = []
+    hook = metrics.add_hook(collected.append)
+    yield collected
+    metrics.remove_hook(hook)
+
+
+def test_stage_disabled():
+    """
+    Function ``stage``, without hooks.
+    """
+    assert not metrics.enabled()
+    assert metrics.stage("goto", "WAR") is metrics.stage("parse", "WAR")
+
+
+def test_stage(events):
+    """
+    Function ``stage``, with a callback hook.
+    """
+    with pytest.raises(ValueError):
+        with metrics.stage("goto", leaders.WAR):
+            raise ValueError
+    metrics.emit("bytes", "download", "WAR", 512)
+    assert [(e.kind, e.stage, e.page) for e in events] == [("seconds", "goto", "WAR"), ("bytes", "download", "WAR")]
+    assert events[0].value >= 0
+
+
+def test_parse(events):
+    """
+    Private instance method ``ScrapingUtilities._parse``, instrumented.
+    """
+    html = "<html><body><table></table></body></html>"
+    scraper = fixtures.scraper(leaders.WAR, html)
+    scraper.soup
+    stages = {(e.kind, e.stage) for e in events}
+    assert {("seconds", "wait"), ("seconds", "content"), ("seconds", "parse")} <= stages
+    assert ("characters", "parse", "WAR", len(html)) in events
+
+
+def test_logging_hook(caplog):
+    """
+    Class ``LoggingHook``.
+    """
+    hook = metrics.add_hook(metrics.LoggingHook(level=logging.INFO))
+    try:
+        with caplog.at_level(logging.INFO, logger="fangraphs.metrics"):
+            metrics.emit("seconds", "goto", "MajorLeague", 0.25)
+    finally:
+        metrics.remove_hook(hook)
+    assert caplog.messages == ["MajorLeague goto: 250.0 ms"]
+
+
+def test_prometheus_hook():
+    """
+    Class ``PrometheusHook``.
+    """
+    hook = metrics.PrometheusHook()
+    for seconds in (0.5, 1.5):
+        hook(metrics.Event("seconds", "goto", "WAR", seconds))
+    hook(metrics.Event("retries", "shard", "WAR", 1))
+    lines = hook.exposition().splitlines()
+    assert "# TYPE fangraphs_stage_seconds summary" in lines
+    assert 'fangraphs_stage_seconds_sum{page="WAR",stage="goto"} 2' in lines
+    assert 'fangraphs_stage_seconds_count{page="WAR",stage="goto"} 2' in lines
+    assert 'fangraphs_retries_total{page="WAR",stage="shard"} 1' in lines
+    assert not any("bytes" in line for line in lines)
@@ -0,0 +1,182 @@
+#! python3
+# tests/test_pagination.py
+
+"""
+Tests for the pagination of :py:class:`FanGraphs.leaders.leaders.SeasonStat`,
+driven by the generated data grid of :py:mod:`FanGraphs.benchmarks.fixtures` in place of a ``Playwright`` page.
+"""
+
+import asyncio
+
+import pytest
+
+from fangraphs.benchmarks import fixtures
+from fangraphs.leaders import async_leaders
+from fangraphs.leaders import leaders
+from fangraphs.tests import fakes
+
+TOTAL_ROWS = 42
+PAGE_SIZES = ["3", "6"]
+EXPECTED = [[str(i)] for i in range(TOTAL_ROWS)]
+
+
+def scraper(cls, has_input=True, has_select=True, wrap=False, size=16):
+    """
+    Creates a scraper on a :py:class:`fangraphs.benchmarks.fixtures.GridPage` of :py:data:`TOTAL_ROWS` rows,
+    borrowed from a :py:class:`fangraphs.benchmarks.fixtures.GridPool`, without a browser.
+    """
+    instance = cls()
+    browser_pool = fixtures.GridPool(
+        ["#"], EXPECTED, size=size, page_sizes=PAGE_SIZES, has_input=has_input, has_select=has_select
+    )
+    page = browser_pool.acquire()
+    instance.page = fakes.wrap(page) if wrap else page
+    instance.browser_pool = fakes.AsyncWrapper(browser_pool) if wrap else browser_pool
+    return instance, browser_pool
+
+
+async def close_ad_async():
+    """
+    Stands in for the coroutine methods which do not apply to :py:class:`fangraphs.benchmarks.fixtures.GridPage`.
+    """
+
+
+def test_page_ranges():
+    """
+    Static method ``SeasonStat._page_ranges``.
+    """
+    assert leaders.SeasonStat._page_ranges(7, 3) == [range(0, 3), range(3, 5), range(5, 7)]
+    assert leaders.SeasonStat._page_ranges(2, 4) == [range(0, 1), range(1, 2)]
+    assert leaders.SeasonStat._page_ranges(5, 1) == [range(0, 5)]
+
+
+@pytest.mark.parametrize("has_select", [True, False])
+def test_maximize_page_size(has_select):
+    """
+    Instance method ``SeasonStat._maximize_page_size``.
+    """
+    instance, _ = scraper(leaders.SeasonStat, has_select=has_select)
+    instance._refresh_parser = lambda: None
+    assert instance._maximize_page_size()
+    assert instance.page.total_pages == (7 if has_select else 1)
+    assert instance.page.waits == (1 if has_select else 0)
+    assert not instance._maximize_page_size()
+    assert instance.page.navigations == (0 if has_select else 1)
+
+    async def maximize():
+        async_instance, _ = scraper(async_leaders.AsyncSeasonStat, has_select=has_select, wrap=True)
+        async_instance._refresh_parser = close_ad_async
+        assert await async_instance._maximize_page_size()
+        return async_instance.page.obj
+    page = asyncio.run(maximize())
+    assert page.total_pages == (7 if has_select else 1)
+    assert page.waits == (1 if has_select else 0)
+
+
+def test_maximize_page_size_single_page():
+    """
+    Instance method ``SeasonStat._maximize_page_size``, on a data grid which fits on its first page.
+    The grid does not re-render with more rows, so it is not waited for.
+    """
+    instance, _ = scraper(leaders.SeasonStat)
+    instance.page.data = EXPECTED[:3]
+    instance._refresh_parser = lambda: None
+    assert instance._maximize_page_size()
+    assert instance.page.size == int(PAGE_SIZES[-1])
+    assert instance.page.waits == 0
+
+
+@pytest.mark.parametrize("has_select", [True, False])
+def test_read_table(has_select):
+    """
+    Instance methods ``SeasonStat.read_table`` and ``AsyncSeasonStat.read_table``.
+    """
+    instance, _ = scraper(leaders.SeasonStat, has_select=has_select)
+    instance._refresh_parser = lambda: None
+    instance._schema = dict
+    size = int(PAGE_SIZES[-1]) if has_select else TOTAL_ROWS
+    assert list(instance.read_table()["#"]) == list(range(size))
+
+    async def read():
+        async_instance, _ = scraper(async_leaders.AsyncSeasonStat, has_select=has_select, wrap=True)
+        async_instance._refresh_parser = close_ad_async
+        async_instance._schema = dict
+        return await async_instance.read_table()
+    assert list(asyncio.run(read())["#"]) == list(range(size))
+
+
+def test_headers():
+    """
+    Instance method ``SeasonStat.headers``.
+    """
+    instance, _ = scraper(leaders.SeasonStat)
+    assert instance.headers() == ["#"]
+
+
+@pytest.mark.parametrize("has_input", [True, False])
+@pytest.mark.parametrize("partitions", [1, 3, 10])
+def test_iter_rows(has_input, partitions):
+    """
+    Instance method ``SeasonStat.iter_rows``.
+    """
+    instance, browser_pool = scraper(leaders.SeasonStat, has_input)
+    instance._refresh_parser = lambda: None
+    assert list(instance.iter_rows(typed=False, partitions=partitions)) == EXPECTED
+    assert browser_pool.borrowed == 1
+    first = leaders.SeasonStat._page_ranges(instance.page.total_pages, partitions if has_input else 1)[0]
+    assert instance.page.clicks == len(first) - 1
+    assert instance.page.waits == instance.page.clicks + 1
+
+
+def test_iter_rows_streaming():
+    """
+    Instance methods ``SeasonStat.iter_rows`` and ``AsyncSeasonStat.iter_rows``,
+    which only read the next page of the data grid once the rows of the current page have been consumed.
+    """
+    size = int(PAGE_SIZES[-1])
+    instance, _ = scraper(leaders.SeasonStat)
+    instance._refresh_parser = lambda: None
+    rows = instance.iter_rows()
+    assert instance.page.size == int(PAGE_SIZES[0])
+    assert [next(rows) for _ in range(size)] == [[i] for i in range(size)]
+    assert instance.page.clicks == 0
+    assert next(rows) == [size]
+    assert instance.page.clicks == 1
+
+    async def stream():
+        async_instance, _ = scraper(async_leaders.AsyncSeasonStat, wrap=True)
+        async_instance._refresh_parser = close_ad_async
+        async_rows = async_instance.iter_rows()
+        first = [await async_rows.__anext__() for _ in range(size)]
+        clicks = async_instance.page.clicks
+        await async_rows.__anext__()
+        await async_rows.aclose()
+        return first, clicks, async_instance.page.clicks
+    assert asyncio.run(stream()) == ([[i] for i in range(size)], 0, 1)
+
+
+def test_iter_rows_exhausted_pool():
+    """
+    Instance method ``SeasonStat.iter_rows``, with more partitions than the browser pool can lend pages.
+    """
+    instance, _ = scraper(leaders.SeasonStat, size=2)
+    instance._refresh_parser = lambda: None
+    assert list(instance.iter_rows(typed=False, partitions=10)) == EXPECTED
+    first = leaders.SeasonStat._page_ranges(instance.page.total_pages, 2)[0]
+    assert instance.page.clicks == len(first) - 1
+
+
+@pytest.mark.parametrize("partitions, size", [(1, 16), (3, 16), (3, 1)])
+def test_async_iter_rows(partitions, size):
+    """
+    Instance method ``AsyncSeasonStat.iter_rows``.
+    """
+    async def collect():
+        instance, browser_pool = scraper(async_leaders.AsyncSeasonStat, wrap=True, size=size)
+        instance._refresh_parser = close_ad_async
+        rows = [row async for row in instance.iter_rows(typed=False, partitions=partitions)]
+        return rows, browser_pool.borrowed
+
+    rows, borrowed = asyncio.run(collect())
+    assert rows == EXPECTED
+    assert borrowed == 1
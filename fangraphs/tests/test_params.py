@@ -0,0 +1,99 @@
+#! python3
+# tests/test_params.py
+
+"""
+Tests for :py:mod:`FanGraphs.leaders.params`.
+"""
+
+import urllib.parse
+
+import pytest
+
+import fangraphs.exceptions
+from fangraphs.leaders import leaders
+from fangraphs.leaders import params
+
+
+def query_string(url):
+    return dict(urllib.parse.parse_qsl(urllib.parse.urlsplit(url).query))
+
+
+class TestCompileURL:
+    """
+    :py:func:`FanGraphs.leaders.params.compile_url`
+    """
+    def test_mapped(self):
+        """
+        Filter queries which are encoded in the URL.
+        """
+        url, unmapped = params.compile_url(
+            "https://fangraphs.com/leaders.aspx?pos=all&stats=bat&type=8",
+            params.MajorLeague.params,
+            {"stat": "Pitching", "Single_Season": 2019, "team": "Yankees", "min_pa": "Qualified"}
+        )
+        assert unmapped == {}
+        assert url.startswith("https://fangraphs.com/leaders.aspx?")
+        assert query_string(url) == {
+            "pos": "all", "stats": "pit", "type": "8", "season": "2019", "season1": "2019",
+            "team": "9", "qual": "y"
+        }
+
+    def test_group(self):
+        """
+        The ``group`` and ``team`` filter queries, which share the ``team`` parameter.
+        """
+        url, _ = params.compile_url(
+            "https://fangraphs.com/leaders.aspx?team=0", params.MajorLeague.params,
+            {"group": "Team Stats", "team": "Cubs"}
+        )
+        assert query_string(url)["team"] == "17,ts"
+        url, _ = params.compile_url(url, params.MajorLeague.params, {"group": "Player Stats"})
+        assert query_string(url)["team"] == "17"
+
+    def test_unmapped(self):
+        """
+        Filter queries and options which are not encoded in the URL.
+        """
+        url, unmapped = params.compile_url(
+            "https://fangraphs.com/warleaders.aspx", params.WAR.params,
+            {"season": "2020", "team": "Angels", "Type": "Pitchers"}
+        )
+        assert query_string(url) == {"season": "2020"}
+        assert unmapped == {"team": "Angels", "Type": "Pitchers"}
+        _, unmapped = params.compile_url(
+            "https://fangraphs.com/leaders.aspx", params.MajorLeague.params, {"split": "Home", "stat": "Hitting"}
+        )
+        assert unmapped == {"split": "Home", "stat": "Hitting"}
+
+
+class Page:
+    """
+    Records the navigations of a scraper.
+    """
+    def __init__(self, url):
+        self.url = url
+        self.navigations = []
+
+    def goto(self, url, timeout=None):
+        self.navigations.append(url)
+        self.url = url
+
+    def wait_for_selector(self, selector):
+        pass
+
+
+def test_configure_by_url():
+    """
+    Instance method ``WAR.configure_by_url``.
+    """
+    scraper = leaders.WAR()
+    scraper.page = Page(scraper.address)
+    configured = []
+    scraper.configure = lambda query, option: configured.append((query, option))
+    scraper.configure_by_url({"season": "2018", "team": "Angels"})
+    assert scraper.page.navigations == ["https://fangraphs.com/warleaders.aspx?season=2018"]
+    assert configured == [("team", "Angels")]
+    scraper.configure_by_url({"season": "2018"})
+    assert len(scraper.page.navigations) == 1
+    with pytest.raises(fangraphs.exceptions.InvalidFilterQuery):
+        scraper.configure_by_url({"league": "AL"})
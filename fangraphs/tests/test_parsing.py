@@ -0,0 +1,147 @@
+#! python3
+# tests/test_parsing.py
+
+"""
+Tests for the parsing of pages by :py:class:`FanGraphs.leaders.ScrapingUtilities`.
+"""
+
+import asyncio
+
+from fangraphs.benchmarks import fixtures
+from fangraphs.leaders import async_leaders
+from fangraphs.leaders import leaders
+from fangraphs.leaders import metrics
+
+GRID = '<div class="table-scroll"><table><tr><td>Mookie Betts</td><td>6.5</td></tr></table></div>'
+TOTAL = '<div class="table-control-total">7</div>'
+
+
+class FragmentPage(fixtures.SnapshotPage):
+    """
+    A snapshot page which serves the markup of its subtrees, and refuses to serve the entire page.
+    """
+    def __init__(self, fragments, url=""):
+        """
+        :param fragments: Maps CSS selectors to the outer HTML of their elements
+        """
+        super().__init__("", url)
+        self.fragments = fragments
+        self.evaluated = []
+
+    def content(self):
+        raise AssertionError("parsed the entire page")
+
+    def eval_on_selector(self, selector, expression):
+        self.evaluated.append((selector, expression))
+        return self.fragments[selector]
+
+
+class CountingPage(fixtures.SnapshotPage):
+    """
+    A snapshot page which counts how many times its markup is read.
+    """
+    def __init__(self, html, url=""):
+        super().__init__(html, url)
+        self.reads = 0
+
+    def content(self):
+        self.reads += 1
+        return super().content()
+
+
+class AsyncFragmentPage(FragmentPage):
+
+    async def wait_for_selector(self, selector, **kwargs):
+        pass
+
+    async def eval_on_selector(self, selector, expression):
+        return super().eval_on_selector(selector, expression)
+
+
+class TestParseFragment:
+    """
+    Private instance method ``ScrapingUtilities._parse_fragment``.
+    """
+    def test_parse_fragment(self):
+        """
+        Only the outer HTML of the grid is transferred and parsed.
+        """
+        scraper = leaders.SeasonStat()
+        scraper.page = FragmentPage({".table-scroll": GRID})
+        events = []
+        hook = metrics.add_hook(events.append)
+        try:
+            elem = scraper._parse_fragment(".table-scroll")
+        finally:
+            metrics.remove_hook(hook)
+        assert elem.tag == "div" and elem.get("class") == "table-scroll"
+        assert [td.text for td in elem.iter("td")] == ["Mookie Betts", "6.5"]
+        assert scraper.page.evaluated == [(".table-scroll", "e => e.outerHTML")]
+        assert [(e.stage, e.value) for e in events if e.kind == "characters"] == [("fragment", len(GRID))]
+
+    def test_parse_fragment_page(self):
+        """
+        The subtree of another page than :py:attr:`page`.
+        """
+        scraper = leaders.SeasonStat()
+        scraper.page = FragmentPage({})
+        other = FragmentPage({".table-scroll": GRID})
+        assert scraper._parse_fragment(".table-scroll", other).get("class") == "table-scroll"
+        assert scraper.page.evaluated == []
+
+    def test_total_pages(self):
+        """
+        Private instance method ``SeasonStat._total_pages``, which reads the total from its subtree.
+        """
+        selector = leaders.SeasonStat._pagination["total"]
+        scraper = leaders.SeasonStat()
+        scraper.page = FragmentPage({selector: TOTAL})
+        assert scraper._total_pages() == 7
+
+        async_scraper = async_leaders.AsyncSeasonStat()
+        async_scraper.page = AsyncFragmentPage({selector: TOTAL})
+        assert asyncio.run(async_scraper._total_pages()) == 7
+        assert async_scraper.page.evaluated == [(selector, "e => e.outerHTML")]
+
+
+class TestSoup:
+    """
+    Instance property ``ScrapingUtilities.soup``, which is only re-parsed once :py:meth:`_refresh_parser` marks it.
+    """
+    def test_lazy(self):
+        """
+        The page is not parsed until the soup is read, and is parsed once however often it is read.
+        """
+        scraper = leaders.SeasonStat()
+        scraper.page = CountingPage(GRID)
+        scraper._refresh_parser()
+        assert scraper.page.reads == 0
+        assert scraper.soup.select_one("td").text == "Mookie Betts"
+        assert scraper.soup is scraper.soup
+        assert scraper.page.reads == 1
+
+    def test_dirty(self):
+        """
+        Consecutive actions on the page cost a single parse.
+        """
+        scraper = leaders.SeasonStat()
+        scraper.page = CountingPage(GRID)
+        scraper._refresh_parser()
+        soup = scraper.soup
+        for _ in range(5):
+            scraper._refresh_parser()
+        assert scraper.page.reads == 1
+        scraper.page.html = TOTAL
+        assert scraper.soup is not soup
+        assert scraper.soup.select_one(".table-control-total").text == "7"
+        assert scraper.page.reads == 2
+
+    def test_set(self):
+        """
+        A soup which is set directly is not re-parsed.
+        """
+        scraper = leaders.SeasonStat()
+        scraper.page = CountingPage(GRID)
+        scraper._refresh_parser()
+        scraper.soup = None
+        assert scraper.soup is None and scraper.page.reads == 0
@@ -0,0 +1,204 @@
+#! python3
+# tests/test_pool.py
+
+"""
+Tests for :py:mod:`FanGraphs.leaders.pool`, driven by the ``Playwright`` stand-ins of :py:mod:`fakes`.
+"""
+
+import asyncio
+import threading
+import types
+
+import pytest
+
+import fangraphs.exceptions
+from fangraphs.leaders import pool
+from fangraphs.tests import fakes
+
+
+@pytest.fixture
+def play(monkeypatch):
+    """
+    Replaces ``Playwright`` in :py:mod:`FanGraphs.leaders.pool`.
+    """
+    return fakes.patch_playwright(monkeypatch, pool)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    Replaces the clock of :py:mod:`FanGraphs.leaders.pool`; set ``clock.now`` to move it.
+    """
+    clock = types.SimpleNamespace(now=0.0)
+    monkeypatch.setattr(pool, "time", types.SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+class TestBrowserPool:
+    """
+    :py:class:`FanGraphs.leaders.pool.BrowserPool`
+    """
+    def test_reuse(self, play, tmp_path):
+        """
+        Instance methods ``BrowserPool.acquire`` and ``BrowserPool.release``.
+        """
+        browser_pool = pool.BrowserPool(2, profile=None, downloads_path=tmp_path)
+        page = browser_pool.acquire()
+        page.goto("https://fangraphs.com/leaders.aspx")
+        assert browser_pool.borrowed == 1 and browser_pool.idle == 0
+        browser_pool.release(page)
+        assert browser_pool.borrowed == 0 and browser_pool.idle == 1
+        assert page.url == "about:blank" and not page.context.closed
+
+        assert browser_pool.acquire() is page
+        assert len(play.browsers) == 1 and len(play.browsers[0].contexts) == 1
+
+    def test_exhausted(self, play, tmp_path):
+        """
+        Instance method ``BrowserPool.acquire``, with every context borrowed.
+        """
+        browser_pool = pool.BrowserPool(2, profile=None, downloads_path=tmp_path)
+        first = browser_pool.acquire()
+        browser_pool.acquire()
+        with pytest.raises(fangraphs.exceptions.BrowserPoolExhausted):
+            browser_pool.acquire()
+        browser_pool.release(first)
+        assert browser_pool.acquire() is first
+
+    def test_evict_idle(self, play, clock, tmp_path):
+        """
+        Instance method ``BrowserPool.evict_idle``.
+        """
+        browser_pool = pool.BrowserPool(2, profile=None, idle_timeout=10, downloads_path=tmp_path)
+        page = browser_pool.acquire()
+        browser_pool.release(page)
+        clock.now = 5
+        browser_pool.evict_idle()
+        assert browser_pool.idle == 1 and not play.browsers[0].closed
+
+        clock.now = 11
+        browser_pool.evict_idle()
+        assert browser_pool.idle == 0 and page.context.closed
+        assert play.browsers[0].closed and play.stopped
+
+        assert browser_pool.acquire() is not page
+        assert len(play.browsers) == 2
+
+    def test_release_closed(self, play, tmp_path):
+        """
+        Instance method ``BrowserPool.release``, with a closed page.
+        """
+        browser_pool = pool.BrowserPool(2, profile=None, downloads_path=tmp_path)
+        page = browser_pool.acquire()
+        page.close()
+        browser_pool.release(page)
+        assert page.context.closed
+        assert browser_pool.borrowed == 0 and browser_pool.idle == 0
+        browser_pool.release(page)
+        assert browser_pool.idle == 0
+
+    def test_close(self, play, tmp_path):
+        """
+        Instance method ``BrowserPool.close``, with borrowed pages.
+        """
+        browser_pool = pool.BrowserPool(3, profile=None, downloads_path=tmp_path)
+        pages = [browser_pool.acquire() for _ in range(3)]
+        browser_pool.release(pages[0])
+        browser_pool.close()
+        assert all(page.context.closed for page in pages)
+        assert browser_pool.borrowed == 0 and browser_pool.idle == 0
+        assert play.browsers[0].closed and play.stopped
+        browser_pool.release(pages[1])
+        assert browser_pool.idle == 0
+
+
+class TestAsyncBrowserPool:
+    """
+    :py:class:`FanGraphs.leaders.pool.AsyncBrowserPool`
+    """
+    def test_reuse(self, play, tmp_path):
+        """
+        Instance methods ``AsyncBrowserPool.acquire`` and ``AsyncBrowserPool.release``.
+        """
+        async def reuse():
+            async with pool.AsyncBrowserPool(2, profile=None, downloads_path=tmp_path) as browser_pool:
+                page = await browser_pool.acquire()
+                await browser_pool.release(page)
+                assert browser_pool.idle == 1
+                return page, await browser_pool.acquire()
+        page, reused = asyncio.run(reuse())
+        assert reused is page
+        assert len(play.browsers) == 1 and len(play.browsers[0].contexts) == 1
+
+    def test_wait(self, play, tmp_path):
+        """
+        Instance method ``AsyncBrowserPool.acquire``, with every context borrowed.
+        """
+        async def wait():
+            browser_pool = pool.AsyncBrowserPool(1, profile=None, downloads_path=tmp_path)
+            page = await browser_pool.acquire()
+            waiting = asyncio.ensure_future(browser_pool.acquire())
+            await asyncio.sleep(0)
+            assert not waiting.done()
+            await browser_pool.release(page)
+            assert await asyncio.wait_for(waiting, 1) is page
+            await browser_pool.close()
+        asyncio.run(wait())
+
+    def test_release_closed(self, play, tmp_path):
+        """
+        Instance method ``AsyncBrowserPool.release``, with a closed page.
+        """
+        async def release():
+            browser_pool = pool.AsyncBrowserPool(1, profile=None, downloads_path=tmp_path)
+            page = await browser_pool.acquire()
+            await page.close()
+            await browser_pool.release(page)
+            assert browser_pool.borrowed == 0 and browser_pool.idle == 0
+            assert page.context.obj.closed
+            await asyncio.wait_for(browser_pool.acquire(), 1)
+            await browser_pool.close()
+        asyncio.run(release())
+
+    def test_close(self, play, tmp_path):
+        """
+        Instance method ``AsyncBrowserPool.close``, with borrowed pages.
+        """
+        async def close():
+            browser_pool = pool.AsyncBrowserPool(2, profile=None, downloads_path=tmp_path)
+            pages = [await browser_pool.acquire() for _ in range(2)]
+            await browser_pool.close()
+            assert all(page.context.obj.closed for page in pages)
+            assert browser_pool.borrowed == 0
+            assert play.browsers[0].closed and play.stopped
+            await browser_pool.release(pages[0])
+            await asyncio.wait_for(browser_pool.acquire(), 1)
+            await asyncio.wait_for(browser_pool.acquire(), 1)
+            await browser_pool.close()
+        asyncio.run(close())
+
+
+def test_get_pool(play, monkeypatch):
+    """
+    Function ``get_pool``, which returns one pool per thread.
+    """
+    monkeypatch.setattr(pool, "_local", threading.local())
+    monkeypatch.setattr(pool.atexit, "register", lambda func: func)
+    pools = []
+    thread = threading.Thread(target=lambda: pools.append(pool.get_pool()))
+    thread.start()
+    thread.join()
+    assert pool.get_pool() is pool.get_pool()
+    assert pools[0] is not pool.get_pool()
+
+
+def test_get_async_pool(play, monkeypatch):
+    """
+    Function ``get_async_pool``, which returns one pool per event loop.
+    """
+    monkeypatch.setattr(pool, "_async_pools", {})
+
+    async def get():
+        assert pool.get_async_pool() is pool.get_async_pool()
+        return pool.get_async_pool()
+    assert asyncio.run(get()) is not asyncio.run(get())
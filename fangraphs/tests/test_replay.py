@@ -0,0 +1,174 @@
+#! python3
+# tests/test_replay.py
+
+"""
+Tests for :py:mod:`FanGraphs.leaders.replay`.
+"""
+
+import asyncio
+import base64
+import json
+
+import pytest
+
+from fangraphs.leaders import pool
+from fangraphs.leaders import replay
+from fangraphs.tests import fakes
+
+
+@pytest.mark.parametrize(
+    "address, name",
+    [
+        ("https://fangraphs.com/leaders.aspx", "leaders_aspx"),
+        ("https://fangraphs.com/leaders/splits-leaderboards", "leaders_splits-leaderboards"),
+        ("https://www.fangraphs.com/", "www.fangraphs.com"),
+    ]
+)
+def test_archive_name(address, name):
+    """
+    Function ``archive_name``.
+    """
+    assert replay.archive_name(address) == name
+
+
+class Context:
+    """
+    Records the arguments of ``route_from_har``.
+    """
+    def __init__(self):
+        self.calls = []
+
+    def route_from_har(self, path, **options):
+        self.calls.append((path, options))
+
+
+class TestArchive:
+    """
+    :py:class:`FanGraphs.leaders.replay.Archive`
+    """
+    def test_modes(self, tmp_path):
+        """
+        Instance properties ``Archive.recording`` and ``Archive.replaying``.
+        """
+        auto = replay.Archive("page", tmp_path, mode="auto")
+        assert auto.recording and not auto.replaying
+        (tmp_path / "page.har").write_text("{}")
+        assert auto.replaying and not auto.recording
+        assert replay.Archive("page", tmp_path, mode="record").recording
+        off = replay.Archive("page", tmp_path, mode="off")
+        assert not off.recording and not off.replaying
+        with pytest.raises(ValueError):
+            replay.Archive("page", tmp_path, mode="rewind")
+
+    def test_default_mode(self, tmp_path, monkeypatch):
+        """
+        Instance attribute ``Archive.mode`` and instance property ``Archive.recorded``.
+        """
+        monkeypatch.delenv("FANGRAPHS_REPLAY", raising=False)
+        archive = replay.Archive("page", tmp_path)
+        assert archive.mode == "auto"
+        assert archive.recording and not archive.replaying and not archive.recorded
+        (tmp_path / "page.har").write_text("{}")
+        assert archive.recorded and archive.replaying
+        monkeypatch.setenv("FANGRAPHS_REPLAY", "REPLAY")
+        assert replay.Archive("page", tmp_path).mode == "replay"
+
+    def test_attach(self, tmp_path):
+        """
+        Instance method ``Archive.attach``.
+        """
+        context = Context()
+        replay.Archive("page", tmp_path, mode="record").attach(context)
+        assert context.calls[-1][1]["update"] is True
+        with pytest.raises(FileNotFoundError):
+            replay.Archive("page", tmp_path, mode="replay").attach(context)
+        (tmp_path / "page.har").write_text("{}")
+        replay.Archive("page", tmp_path, mode="replay").attach(context)
+        assert context.calls[-1] == (str(tmp_path / "page.har"), {"not_found": "abort"})
+        replay.Archive("page", tmp_path, mode="off").attach(context)
+        assert len(context.calls) == 2
+
+    def test_status(self, tmp_path):
+        """
+        Instance method ``Archive.status``.
+        """
+        entries = [
+            {"request": {"url": "https://fangraphs.com/leaders.aspx"},
+             "response": {"status": 301, "redirectURL": "https://www.fangraphs.com/leaders.aspx"}},
+            {"request": {"url": "https://www.fangraphs.com/leaders.aspx"},
+             "response": {"status": 200, "redirectURL": ""}},
+        ]
+        (tmp_path / "page.har").write_text(json.dumps({"log": {"entries": entries}}))
+        archive = replay.Archive("page", tmp_path, mode="replay")
+        assert archive.status("https://fangraphs.com/leaders.aspx") == 200
+        assert archive.status("https://fangraphs.com/warleaders.aspx") is None
+
+    def test_text(self, tmp_path):
+        """
+        Instance method ``Archive.text``.
+        """
+        entries = [
+            {"request": {"url": "https://fangraphs.com/leaders.aspx"},
+             "response": {"status": 200, "redirectURL": "", "content": {"text": "<html></html>"}}},
+            {"request": {"url": "https://fangraphs.com/warleaders.aspx"},
+             "response": {"status": 200, "redirectURL": "",
+                          "content": {"text": base64.b64encode(b"<table></table>").decode(), "encoding": "base64"}}},
+        ]
+        (tmp_path / "page.har").write_text(json.dumps({"log": {"entries": entries}}))
+        archive = replay.Archive("page", tmp_path, mode="replay")
+        assert archive.text("https://fangraphs.com/leaders.aspx") == "<html></html>"
+        assert archive.text("https://fangraphs.com/warleaders.aspx") == "<table></table>"
+        assert archive.text("https://fangraphs.com/leaders/splits-leaderboards") is None
+
+
+class TestPoolArchives:
+    """
+    Archives attached by :py:meth:`FanGraphs.leaders.pool.BrowserPool.acquire`.
+    """
+    def test_acquire(self, tmp_path, monkeypatch):
+        """
+        Instance method ``BrowserPool.acquire``, with archives.
+        """
+        monkeypatch.delenv("FANGRAPHS_REPLAY", raising=False)
+        fakes.patch_playwright(monkeypatch, pool)
+        (tmp_path / "page.har").write_text("{}")
+        with pool.BrowserPool(2, profile=None, archives=str(tmp_path)) as browser_pool:
+            page = browser_pool.acquire(archive="page")
+            assert page.routes == [("har", str(tmp_path / "page.har"), {"not_found": "abort"})]
+            browser_pool.release(page)
+            assert page.routes == [] and browser_pool.idle == 1
+            recorder = browser_pool.acquire(archive=replay.Archive("new", tmp_path, mode="record"))
+            assert recorder.context is not page.context
+            assert recorder.routes[0][2]["update"] is True
+            browser_pool.release(recorder)
+            assert recorder.context.closed and browser_pool.idle == 1
+        with pool.BrowserPool(1, profile=None) as browser_pool:
+            assert browser_pool.acquire(archive="page").routes == []
+
+    def test_acquire_async(self, tmp_path, monkeypatch):
+        """
+        Instance method ``AsyncBrowserPool.acquire``, with archives.
+        """
+        fakes.patch_playwright(monkeypatch, pool)
+        (tmp_path / "page.har").write_text("{}")
+        archive = replay.Archive("page", tmp_path, mode="replay")
+
+        async def acquire():
+            async with pool.AsyncBrowserPool(1, profile=None) as browser_pool:
+                page = await browser_pool.acquire(archive=archive)
+                routes = page.routes
+                await browser_pool.release(page)
+                return routes
+        assert asyncio.run(acquire()) == [("har", str(tmp_path / "page.har"), {"not_found": "abort"})]
+
+    def test_open_page(self, tmp_path, monkeypatch):
+        """
+        Function ``open_page``, through a browser pool of its own.
+        """
+        play = fakes.patch_playwright(monkeypatch, pool)
+        (tmp_path / "page.har").write_text("{}")
+        archive = replay.Archive("page", tmp_path, mode="replay")
+        with replay.open_page("https://fangraphs.com/leaders.aspx", archive=archive, profile=None) as page:
+            assert page.url == "https://fangraphs.com/leaders.aspx"
+            assert page.routes[0][0] == "har"
+        assert play.browsers[0].closed and play.stopped
@@ -0,0 +1,130 @@
+#! python3
+# tests/test_selectors.py
+
+"""
+Tests for :py:mod:`FanGraphs.selectors`.
+"""
+
+import bs4
+import pytest
+
+from fangraphs import selectors
+from fangraphs.benchmarks import fixtures
+from fangraphs.leaders import leaders
+
+
+class Parser:
+    """
+    Holds the parsed page read by the filter query classes.
+    """
+    def __init__(self, html):
+        self.soup = bs4.BeautifulSoup(html, features="lxml")
+
+
+def test_compile_selector():
+    """
+    Function ``compile_selector``.
+    """
+    css = selectors.compile_selector("#stats .fgButton")
+    assert selectors.compile_selector("#stats .fgButton") is css
+    assert selectors.compile_selector("#stats > .fgButton") is not css
+
+
+@pytest.mark.parametrize("scraper_cls", fixtures.SCRAPERS)
+def test_compiled_queries(scraper_cls):
+    """
+    Every filter query of a page shares the compiled matchers of its selectors.
+    """
+    first = fixtures.scraper(scraper_cls, "<html></html>")
+    second = fixtures.scraper(scraper_cls, "<html></html>")
+    for query in getattr(first, "_selections", {}):
+        css, other = first._selections[query]._options_css, second._selections[query]._options_css
+        if isinstance(css, list):
+            assert all(c is o for c, o in zip(css, other))
+        else:
+            assert css is other
+    for query in first._dropdowns:
+        assert first._dropdowns[query]._options_css is second._dropdowns[query]._options_css
+
+
+def test_instance_registries():
+    """
+    Each scraper owns its filter queries, which read its own page.
+    """
+    checked = fixtures.scraper(leaders.MajorLeague, '<input id="LeaderBoard1_cbTeams" checked="checked">')
+    unchecked = fixtures.scraper(leaders.MajorLeague, '<input id="LeaderBoard1_cbTeams">')
+    assert checked._switches is not unchecked._switches
+    assert checked.current_option("split_teams") == "True"
+    assert unchecked.current_option("split_teams") == "False"
+    unchecked.page = fixtures.SnapshotPage('<input id="LeaderBoard1_cbTeams" checked="checked">')
+    unchecked._refresh_parser()
+    assert unchecked.current_option("split_teams") == "True"
+    assert leaders.MajorLeague.list_queries() == checked.list_queries()
+
+
+class TestSelections:
+
+    html = """
+    <div class="stats"><div class="fgButton active">Batting</div><div class="fgButton">Pitching</div></div>
+    <div id="tabs"><ul><li><a class="rtsLink">All</a></li><li><a class="rtsLink rtsSelected">AL</a></li></ul></div>
+    """
+
+    def test_list_options(self):
+        """
+        Instance method ``Selections.list_options``.
+        """
+        parser = Parser(self.html)
+        buttons = selectors.Selections(parser, [".stats > div:nth-child(1)", ".stats > div:nth-child(2)"])
+        tabs = selectors.Selections(parser, "#tabs", "li")
+        assert buttons.list_options() == ["Batting", "Pitching"]
+        assert tabs.list_options() == ["All", "AL"]
+
+    def test_current_option(self):
+        """
+        Instance method ``Selections.current_option``.
+        """
+        parser = Parser(self.html)
+        buttons = selectors.Selections(parser, [".stats > div:nth-child(1)", ".stats > div:nth-child(2)"])
+        tabs = selectors.Selections(parser, "#tabs", "li")
+        assert buttons.current_option() == "Batting"
+        assert tabs.current_option() == "AL"
+        with pytest.raises(IndexError):
+            selectors.Selections(parser, ["#missing"]).current_option()
+
+
+class TestDropdowns:
+
+    html = """
+    <div id="season"><div><span>2020</span></div>
+    <ul><li class="highlight-selection">2020</li><li class="">2021</li></ul></div>
+    <input id="team" value="LAD">
+    """
+
+    def test_list_options(self):
+        """
+        Instance method ``Dropdowns.list_options``.
+        """
+        parser = Parser(self.html)
+        assert selectors.Dropdowns(parser, "#season", "li").list_options() == ["2020", "2021"]
+
+    def test_current_option(self):
+        """
+        Instance method ``Dropdowns.current_option``.
+        """
+        parser = Parser(self.html)
+        assert selectors.Dropdowns(parser, "#team").current_option(1) == "LAD"
+        assert selectors.Dropdowns(parser, "#season", "li").current_option(2) == "2020"
+        assert selectors.Dropdowns(parser, "#season", "li").current_option(2, multiple=True) == ["2020"]
+        assert selectors.Dropdowns(parser, "#season").current_option(3) == "2020"
+
+
+class TestSwitches:
+
+    def test_current_option(self):
+        """
+        Instance method ``Switches.current_option``.
+        """
+        parser = Parser('<input id="a" checked="checked"><div id="b" class="isActive"></div><div id="c" class=""></div>')
+        assert selectors.Switches(parser, "#a").current_option(1) == "True"
+        assert selectors.Switches(parser, "#b").current_option(2) == "True"
+        assert selectors.Switches(parser, "#c").current_option(2) == "False"
@@ -0,0 +1,95 @@
+#! python3
+# tests/test_shard.py
+
+"""
+Tests for :py:mod:`FanGraphs.leaders.shard`.
+"""
+
+import os
+
+from concurrent.futures.process import BrokenProcessPool
+
+from fangraphs.leaders import shard
+
+
+class Scraper:
+    """
+    Stands in for a synchronous scraper in the worker processes, without a browser.
+    The ``mode`` filter query makes the export fail once (``flaky``), always (``broken``),
+    or kills the worker process (``crash``).
+    """
+    def __init__(self, browser_pool=None):
+        self.filters = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, value, traceback):
+        pass
+
+    def configure_by_url(self, filters):
+        self.filters.update(filters)
+
+    def export(self, path, as_table=False, fmt=None):
+        mode = self.filters.get("mode")
+        if mode == "crash":
+            os._exit(1)
+        if mode == "broken":
+            raise ValueError("broken")
+        if mode == "flaky" and not os.path.exists(path + ".tried"):
+            open(path + ".tried", "w").close()
+            raise ValueError("flaky")
+        with open(path, "w") as file:
+            file.write(self.filters["season"])
+
+
+class TestShardedRunner:
+    """
+    :py:class:`FanGraphs.leaders.shard.ShardedRunner`
+    """
+    def test_shards(self):
+        """
+        Private instance method ``ShardedRunner._shards``.
+        """
+        runner = shard.ShardedRunner([(Scraper, {}, "")] * 7, processes=2, shard_size=3)
+        shards = list(runner._shards(list(range(7))))
+        assert [[i for i, _ in s] for s in shards] == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_run(self, tmp_path):
+        """
+        Instance method ``ShardedRunner.run``.
+        """
+        jobs = [
+            (Scraper, {"season": str(season)}, str(tmp_path / f"{season}.csv"))
+            for season in range(2015, 2021)
+        ]
+        jobs[2][1]["mode"] = "flaky"
+        jobs[4][1]["mode"] = "broken"
+        report = shard.ShardedRunner(jobs, processes=2, shard_size=2, retries=1).run()
+        assert [path for _, path, _ in report.exported] == [jobs[i][2] for i in (0, 1, 2, 3, 5)]
+        assert [(filters["season"], str(err)) for filters, err in report.failed] == [("2019", "broken")]
+        assert (tmp_path / "2017.csv").read_text() == "2017"
+
+    def test_iter_results_crash(self, tmp_path):
+        """
+        Instance method ``ShardedRunner.iter_results``, when a worker process dies.
+        """
+        jobs = [(Scraper, {"season": "2020", "mode": "crash"}, str(tmp_path / "2020.csv"))]
+        results = list(shard.ShardedRunner(jobs, processes=1, retries=1).iter_results())
+        assert len(results) == 1
+        assert results[0].attempts == 2
+        assert isinstance(results[0].error, BrokenProcessPool)
+
+    def test_iter_results_isolation(self, tmp_path):
+        """
+        Instance method ``ShardedRunner.iter_results``, when one job kills its worker process among healthy jobs.
+        """
+        jobs = [
+            (Scraper, {"season": str(season)}, str(tmp_path / f"{season}.csv"))
+            for season in range(2015, 2021)
+        ]
+        jobs[1][1]["mode"] = "crash"
+        results = sorted(shard.ShardedRunner(jobs, processes=2, shard_size=2, retries=0).iter_results())
+        assert [r.index for r in results if r.error is None] == [0, 2, 3, 4, 5]
+        assert all(r.attempts == 1 for r in results)
+        assert isinstance(results[1].error, BrokenProcessPool)
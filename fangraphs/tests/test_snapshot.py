@@ -0,0 +1,55 @@
+#! python3
+# tests/test_snapshot.py
+
+"""
+Tests for :py:meth:`FanGraphs.leaders.ScrapingUtilities.snapshot`.
+"""
+
+import pytest
+
+from fangraphs import selectors
+from fangraphs.benchmarks import fixtures
+from fangraphs.leaders import metrics
+
+
+class EvaluatingPage(fixtures.SnapshotPage):
+    """
+    A snapshot page which records its evaluations.
+    """
+    def __init__(self, html, url=""):
+        super().__init__(html, url)
+        self.evaluated = []
+
+    def evaluate(self, expression, arg=None):
+        self.evaluated.append((expression, arg))
+        return {query: None for query, _ in arg}
+
+
+@pytest.mark.parametrize("scraper_cls", fixtures.SCRAPERS)
+def test_state_specs(scraper_cls):
+    """
+    Private instance method ``ScrapingUtilities._state_specs``.
+    """
+    scraper = fixtures.scraper(scraper_cls, "<html></html>")
+    specs = scraper._state_specs()
+    assert sorted(q for q, _ in specs) == sorted(scraper.list_queries())
+    kinds = {"selected", "active", "value", "highlighted", "text", "checked", "class", "url"}
+    assert all(spec["kind"] in kinds for _, spec in specs)
+
+
+@pytest.mark.parametrize("scraper_cls", fixtures.SCRAPERS)
+def test_snapshot(scraper_cls):
+    """
+    Instance method ``ScrapingUtilities.snapshot``.
+    """
+    scraper = fixtures.scraper(scraper_cls, "<html></html>")
+    scraper.page = EvaluatingPage("<html></html>")
+    events = []
+    hook = metrics.add_hook(events.append)
+    try:
+        state = scraper.snapshot()
+    finally:
+        metrics.remove_hook(hook)
+    assert scraper.page.evaluated == [(selectors.STATE_JS, scraper._state_specs())]
+    assert set(state) == set(scraper.list_queries())
+    assert [(e.kind, e.stage) for e in events] == [("seconds", "snapshot")]
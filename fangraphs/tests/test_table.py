@@ -0,0 +1,135 @@
+#! python3
+# tests/test_table.py
+
+"""
+Tests for :py:mod:`FanGraphs.leaders.table`.
+"""
+
+import io
+import math
+
+import pytest
+
+from fangraphs.benchmarks import fixtures
+from fangraphs.leaders import columns
+from fangraphs.leaders import leaders
+from fangraphs.leaders import table
+
+CSV = '﻿"Name","Team","G","AVG","WAR"\n"Mike Trout","LAA","53","0.281",""\n"Mookie Betts","LAD","55","0.292","3.0"\n'
+
+
+class TestTable:
+    """
+    :py:class:`FanGraphs.leaders.table.Table`
+    """
+    def test_from_csv(self, tmp_path):
+        """
+        Class method ``Table.from_csv``.
+        """
+        path = tmp_path / "export.csv"
+        path.write_text(CSV, encoding="utf-8")
+        data = table.Table.from_csv(str(path))
+        assert data.headers == ["Name", "Team", "G", "AVG", "WAR"]
+        assert len(data) == 2
+        assert data["Name"] == ["Mike Trout", "Mookie Betts"]
+        assert data["G"].typecode == "q" and list(data["G"]) == [53, 55]
+        assert data["AVG"].typecode == "d"
+        assert math.isnan(data["WAR"][0]) and data["WAR"][1] == 3.0
+
+    def test_from_rows(self):
+        """
+        Class method ``Table.from_rows``.
+        """
+        data = table.Table.from_rows(["Name", "Age", "Note"], [["A", 25, ""], ["B", "31", ""]])
+        assert list(data.rows()) == [("A", 25, ""), ("B", 31, "")]
+        assert data["Note"] == ["", ""]
+        with pytest.raises(ValueError):
+            table.Table({"A": [1], "B": [1, 2]})
+
+    def test_from_rows_schema(self):
+        """
+        Class method ``Table.from_rows``, with the schema of a stat group.
+        """
+        rows = [["183.2", "25.3 %", "10.0"]]
+        fielding = table.Table.from_rows(["Inn", "K%", "BB%"], rows, columns.schema("fielding"))
+        assert fielding["Inn"][0] == pytest.approx(183 + 2 / 3)
+        assert list(fielding["K%"]) == pytest.approx([0.253]) and list(fielding["BB%"]) == pytest.approx([0.1])
+        batting = table.Table.from_rows(["Inn"], rows, columns.schema("batting"))
+        assert batting["Inn"][0] == 183.2
+
+    def test_to_csv(self):
+        """
+        Instance method ``Table.to_csv``.
+        """
+        data = table.Table.from_csv(io.StringIO(CSV.lstrip("﻿")))
+        assert table.Table.from_csv(io.StringIO(data.to_csv())).headers == data.headers
+
+    def test_to_numpy(self):
+        """
+        Instance method ``Table.to_numpy``.
+        """
+        numpy = pytest.importorskip("numpy")
+        data = table.Table.from_csv(io.StringIO(CSV.lstrip("﻿")))
+        games = data.to_numpy("G")
+        assert games.dtype == numpy.int64
+        data["G"][0] = 60
+        assert games[0] == 60
+
+
+def test_file_format():
+    """
+    Function ``file_format``.
+    """
+    assert table.file_format("out/war.parquet") == "parquet"
+    assert table.file_format("out/war.FEATHER") == "feather"
+    assert table.file_format("out/war.txt") == "csv"
+    assert table.file_format("out/war.csv", "arrow") == "arrow"
+    with pytest.raises(ValueError):
+        table.file_format("out/war.csv", "xlsx")
+
+
+def test_stat_columns():
+    """
+    Conversion of percentages, dollar values and innings.
+    """
+    data = table.Table.from_rows(
+        ["K%", "Dollars", "IP", "WAR"],
+        [["25.3 %", "$12.4", "183.2", "-0.4"], ["8.0%", "-$1.5", "45", ""]]
+    )
+    assert list(data["K%"]) == pytest.approx([0.253, 0.08])
+    assert list(data["Dollars"]) == [12.4, -1.5]
+    assert list(data["IP"]) == pytest.approx([183 + 2 / 3, 45.0])
+    assert data["WAR"][0] == -0.4 and math.isnan(data["WAR"][1])
+
+
+@pytest.mark.parametrize("path", ["war.parquet", "war.arrow", "war.feather"])
+def test_write(tmp_path, path):
+    """
+    Instance method ``Table.write``.
+    """
+    pyarrow = pytest.importorskip("pyarrow")
+    import pyarrow.feather
+    import pyarrow.parquet
+    data = table.Table.from_csv(io.StringIO(CSV.lstrip("﻿")))
+    data.write(str(tmp_path / path))
+    if path.endswith(".parquet"):
+        written = pyarrow.parquet.read_table(str(tmp_path / path))
+    else:
+        written = pyarrow.feather.read_table(str(tmp_path / path))
+    assert written.column_names == data.headers
+    assert written.column("G").type == pyarrow.int64()
+    assert written.column("WAR").null_count == 1
+
+
+def test_scraper_schema():
+    """
+    Private instance method ``ScrapingUtilities._schema``.
+    """
+    html = """
+    <div id="LeaderBoard1_tsStats"><ul>
+    <li><a class="rtsLink">Batting</a></li><li><a class="rtsLink rtsSelected">Pitching</a></li>
+    </ul></div>
+    """
+    assert fixtures.scraper(leaders.MajorLeague, html)._schema() == columns.schema("pitching")
+    assert fixtures.scraper(leaders.MajorLeague, "<html></html>")._schema() == columns.schema()
+    assert fixtures.scraper(leaders.WAR, "<html></html>")._schema() == columns.schema()